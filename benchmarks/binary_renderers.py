@@ -0,0 +1,68 @@
+"""
+Measure the size and rendering time of error responses with the JSON renderer
+and the binary renderers. Used for the table in the "Binary error responses"
+section of the docs. Run it from the root of the repository with msgpack and
+cbor2 installed:
+
+    PYTHONPATH=. python benchmarks/binary_renderers.py
+"""
+
+import timeit
+
+import django
+from django.conf import settings
+
+settings.configure(
+    INSTALLED_APPS=["rest_framework", "drf_standardized_errors"],
+    USE_I18N=False,
+)
+django.setup()
+
+from rest_framework.exceptions import ValidationError  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from drf_standardized_errors.compact import CompactExceptionFormatter  # noqa: E402
+from drf_standardized_errors.formatter import ExceptionFormatter  # noqa: E402
+from drf_standardized_errors.renderers import (  # noqa: E402
+    CBORRenderer,
+    MessagePackRenderer,
+)
+
+RENDERERS = [JSONRenderer(), MessagePackRenderer(), CBORRenderer()]
+CONTEXT = {"view": None, "args": (), "kwargs": {}, "request": None}
+
+
+def get_cases():
+    single = ValidationError({"email": ["Enter a valid email address."]})
+    bulk = ValidationError(
+        {"items": [{"email": ["Enter a valid email address."]}] * 10_000}
+    )
+    yield "1", "default", ExceptionFormatter(single, CONTEXT, single).run()
+    yield "10,000", "default", ExceptionFormatter(bulk, CONTEXT, bulk).run()
+    yield "10,000", "compact", CompactExceptionFormatter(bulk, CONTEXT, bulk).run()
+
+
+def format_size(size):
+    return f"{size / 1000:.0f} KB" if size >= 10_000 else f"{size} bytes"
+
+
+def format_time(seconds):
+    return f"{seconds * 1000:.1f}ms" if seconds >= 0.001 else f"{seconds * 1e6:.1f}µs"
+
+
+def measure(renderer, data):
+    content = renderer.render(data)
+    number, total = timeit.Timer(lambda: renderer.render(data)).autorange()
+    return f"{format_size(len(content))}, {format_time(total / number)}"
+
+
+def main():
+    print("| Errors    | Formatter | JSON | MessagePack | CBOR |")
+    print("|-----------|-----------|------|-------------|------|")
+    for errors, formatter, data in get_cases():
+        results = " | ".join(measure(renderer, data) for renderer in RENDERERS)
+        print(f"| {errors} | {formatter} | {results} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class StandardizedErrorsConfig(AppConfig):
     name = "drf_standardized_errors"
     verbose_name = "drf-standardized-errors"
+
+    def ready(self) -> None:
+        from .settings import package_settings
+
+        package_settings.warm()
+        if package_settings.WARM_UP_ON_STARTUP:
+            from .warmup import warm_up
+
+            warm_up()
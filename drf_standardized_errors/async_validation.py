@@ -0,0 +1,132 @@
+"""
+Run slow async validators (like the ones calling other services)
+concurrently instead of one after the other, so that validating the data
+takes as long as the slowest validator. The errors of all validators are
+merged into one ``ValidationError`` with the same shape as the errors of a
+serializer.
+"""
+
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import get_error_detail
+from rest_framework.serializers import as_serializer_error
+
+AsyncValidator = Callable[[Any], Awaitable[Any]]
+
+
+async def validate_concurrently(
+    data: Mapping[str, Any],
+    field_validators: Optional[Mapping[str, Iterable[AsyncValidator]]] = None,
+    validators: Iterable[AsyncValidator] = (),
+    max_concurrency: Optional[int] = None,
+) -> None:
+    """
+    Run the field validators with the value of their field (when present in
+    the data) and the object validators with the whole data, with at most
+    ``max_concurrency`` of them running at the same time. Raise a
+    ``ValidationError`` with the errors of all validators merged in the order
+    the validators are declared.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    calls: List[Tuple[Optional[str], AsyncValidator, Any]] = []
+    for field, validators_of_field in (field_validators or {}).items():
+        if field in data:
+            for validator in validators_of_field:
+                calls.append((field, validator, data[field]))
+    for validator in validators:
+        calls.append((None, validator, data))
+
+    async def run(validator: AsyncValidator, value: Any) -> Any:
+        if semaphore is None:
+            return await validator(value)
+        async with semaphore:
+            return await validator(value)
+
+    results = await asyncio.gather(
+        *(run(validator, value) for _, validator, value in calls),
+        return_exceptions=True,
+    )
+
+    errors: Dict[str, Any] = {}
+    for (field_name, _, _), result in zip(calls, results):
+        if not isinstance(result, BaseException):
+            continue
+        if not isinstance(result, (ValidationError, DjangoValidationError)):
+            raise result
+        if field_name is None:
+            for key, detail in as_serializer_error(result).items():
+                merge_errors(errors, key, detail)
+        else:
+            merge_errors(errors, field_name, get_field_error_detail(result))
+    if errors:
+        raise ValidationError(errors)
+
+
+def get_field_error_detail(
+    exc: Union[ValidationError, DjangoValidationError],
+) -> Any:
+    if isinstance(exc, DjangoValidationError):
+        return get_error_detail(exc)
+    return exc.detail
+
+
+def merge_errors(errors: Dict[str, Any], key: str, detail: Any) -> None:
+    existing = errors.get(key)
+    if isinstance(existing, list) and isinstance(detail, list):
+        existing.extend(detail)
+    elif existing is None:
+        errors[key] = list(detail) if isinstance(detail, list) else detail
+    # a field with nested errors keeps the first ones, like DRF does when
+    # a validator raises a dict
+
+
+class AsyncValidationMixin:
+    """
+    Serializer mixin adding ``ais_valid`` that runs the regular validation
+    then the async validators of the serializer concurrently when the regular
+    validation passes. ``async_field_validators`` maps field names to the
+    validators of the validated value of that field while
+    ``async_validators`` are called with the validated data.
+    """
+
+    async_field_validators: Mapping[str, Iterable[AsyncValidator]] = {}
+    async_validators: Iterable[AsyncValidator] = ()
+    max_concurrency: Optional[int] = None
+
+    _errors: Any
+    _validated_data: Any
+    errors: Any
+    is_valid: Callable[..., bool]
+
+    async def ais_valid(self, *, raise_exception: bool = False) -> bool:
+        # the regular validation can query the database
+        if await sync_to_async(self.is_valid)():
+            try:
+                await validate_concurrently(
+                    self._validated_data,
+                    self.async_field_validators,
+                    self.async_validators,
+                    self.max_concurrency,
+                )
+            except ValidationError as exc:
+                self._validated_data = {}
+                self._errors = exc.detail
+
+        if self._errors and raise_exception:
+            raise ValidationError(self.errors)
+        return not bool(self._errors)
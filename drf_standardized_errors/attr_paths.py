@@ -0,0 +1,187 @@
+"""
+The attrs of the errors are derived from the structure of the serializer:
+nested serializer field names are joined with NESTED_FIELD_SEPARATOR and
+list indices or dict keys are added for the items of lists or dicts. In the
+API schema, the list indices and dict keys are represented by
+LIST_INDEX_IN_API_SCHEMA and DICT_KEY_IN_API_SCHEMA.
+
+The attr tree of a serializer class is computed once and holds, for each
+field, its attr template (like "items.INDEX.email") and its full attr when
+it does not depend on a list index or dict key (like "shipping_address.zipcode").
+The same tree is used to list the fields of the API schema along with the
+attr template of their errors.
+"""
+
+import inspect
+import sys
+from dataclasses import dataclass, field as dataclass_field
+from typing import Any, Dict, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from rest_framework import serializers
+from rest_framework.settings import api_settings as drf_settings
+
+from .settings import package_settings
+
+# attr trees by serializer class along with the settings snapshot they were
+# computed with
+_attr_trees: "WeakKeyDictionary[type, Tuple[Any, Optional[AttrNode]]]" = (
+    WeakKeyDictionary()
+)
+
+
+@dataclass
+class AttrNode:
+    # None when the attr depends on a list index or a dict key
+    attr: Optional[str]
+    template: Optional[str]
+    # the field whose errors have this attr (the serializer itself for its
+    # non field errors)
+    field: Any = None
+    children: "Dict[str, AttrNode]" = dataclass_field(default_factory=dict)
+    # the node of list items or dict values
+    item: "Optional[AttrNode]" = None
+    # the nodes of the serializers of a PolymorphicProxySerializer
+    variants: "List[AttrNode]" = dataclass_field(default_factory=list)
+
+    @property
+    def is_list(self) -> bool:
+        return isinstance(
+            self.field, (serializers.ListSerializer, serializers.ListField)
+        )
+
+    def get_child(self, key: Any) -> "Optional[AttrNode]":
+        child = self.children.get(key)
+        for variant in self.variants:
+            child = child or variant.get_child(key)
+        return child or self.item
+
+
+def join_attr(prefix: Any, name: Any) -> str:
+    return f"{prefix}{package_settings.NESTED_FIELD_SEPARATOR}{name}"
+
+
+def get_view_attr_tree(view: Any) -> Optional[AttrNode]:
+    """
+    Return the attr tree of the serializer class of the view, if any. It is
+    only a shortcut to precomputed attrs, so errors raised by other serializers
+    are still formatted the same.
+    """
+    get_serializer_class = getattr(view, "get_serializer_class", None)
+    if get_serializer_class is None:
+        return None
+    try:
+        serializer_class = get_serializer_class()
+    except Exception:
+        return None
+    return get_attr_tree(serializer_class)
+
+
+def get_attr_tree(serializer_class: type) -> Optional[AttrNode]:
+    """
+    Return the attr tree of the serializer class, computed once per class and
+    settings. Returns None when the serializer cannot be instantiated without
+    arguments.
+    """
+    snapshot = package_settings.snapshot
+    try:
+        tree_snapshot, tree = _attr_trees[serializer_class]
+    except KeyError:
+        tree_snapshot = None
+
+    if tree_snapshot is not snapshot:
+        try:
+            serializer = serializer_class()
+        except Exception:
+            tree = None
+        else:
+            tree = build_attr_tree(serializer, None, None)
+        _attr_trees[serializer_class] = (snapshot, tree)
+    return tree
+
+
+def build_attr_tree(
+    field: serializers.Field, attr: Optional[str], template: Optional[str]
+) -> AttrNode:
+    node = AttrNode(attr, template, field)
+    if is_polymorphic_proxy_serializer(field):
+        sub_serializers = field.serializers
+        if isinstance(sub_serializers, dict):
+            sub_serializers = list(sub_serializers.values())
+        node.variants = [
+            build_attr_tree(force_instance(serializer), attr, template)
+            for serializer in sub_serializers
+        ]
+        return node
+
+    if isinstance(field, serializers.BaseSerializer):
+        add_child(node, drf_settings.NON_FIELD_ERRORS_KEY)
+
+    if isinstance(field, serializers.ListSerializer):
+        node.item = build_item_tree(
+            field.child, node, package_settings.LIST_INDEX_IN_API_SCHEMA
+        )
+    elif isinstance(field, serializers.BaseSerializer):
+        for name, child in getattr(field, "fields", {}).items():
+            if not child.read_only:
+                node.children[name] = build_attr_tree(
+                    child, child_attr(node, name), child_template(node, name)
+                )
+    elif isinstance(field, serializers.ListField):
+        node.item = build_item_tree(
+            field.child, node, package_settings.LIST_INDEX_IN_API_SCHEMA
+        )
+    elif getattr(field, "child", None) is not None:
+        # dict fields and other composite fields
+        node.item = build_item_tree(
+            field.child, node, package_settings.DICT_KEY_IN_API_SCHEMA
+        )
+    return node
+
+
+def is_polymorphic_proxy_serializer(field: Any) -> bool:
+    # drf-spectacular is an optional dependency and it is already imported
+    # when such a serializer exists
+    utils = sys.modules.get("drf_spectacular.utils")
+    return utils is not None and isinstance(field, utils.PolymorphicProxySerializer)
+
+
+def force_instance(field: Any) -> Any:
+    if inspect.isclass(field) and issubclass(field, serializers.Field):
+        return field()
+    return field
+
+
+def build_item_tree(child: serializers.Field, node: AttrNode, name: str) -> AttrNode:
+    return build_attr_tree(child, None, child_template(node, name))
+
+
+def add_child(node: AttrNode, name: str) -> None:
+    # the errors of the child are the non field errors of the node field
+    node.children[name] = AttrNode(
+        child_attr(node, name), child_template(node, name), node.field
+    )
+
+
+def child_attr(node: AttrNode, name: str) -> Optional[str]:
+    if node.template is None:
+        return name
+    elif node.attr is None:
+        return None
+    else:
+        return join_attr(node.attr, name)
+
+
+def child_template(node: AttrNode, name: str) -> str:
+    return name if node.template is None else join_attr(node.template, name)
+
+
+def get_attr_template(tree: AttrNode, attr: str) -> Optional[str]:
+    """
+    Return the template of the attr (like "items.INDEX.email" for
+    "items.3.email") or None when the attr does not match the tree.
+    """
+    node: Optional[AttrNode] = tree
+    for name in attr.split(package_settings.NESTED_FIELD_SEPARATOR):
+        node = node.get_child(name) if node else None
+    return node.template if node else None
@@ -0,0 +1,56 @@
+"""
+Format exceptions raised outside requests (like when validating records in
+background jobs or bulk imports) in the same format as error responses.
+"""
+
+from typing import Any, Iterable, Iterator, Optional, Tuple, Type
+
+from rest_framework.generics import GenericAPIView
+
+from .formatter import ExceptionFormatter
+from .handler import ExceptionHandler
+from .settings import package_settings
+from .types import ExceptionHandlerContext
+
+
+def format_many(
+    excs: Iterable[Optional[Exception]],
+    index_offset: int = 0,
+    serializer_class: Optional[type] = None,
+    formatter_class: Optional[Type[ExceptionFormatter]] = None,
+) -> Iterator[Tuple[int, Any]]:
+    """
+    Generate the index and the formatted error response of each exception.
+    The index is the position of the exception in ``excs`` plus
+    ``index_offset``, so that records validated in chunks keep their index in
+    the whole batch. ``None`` stands for a record without errors and is
+    skipped.
+
+    Exceptions are converted like the exception handler does but the error
+    responses are neither rendered nor reported. When passed, the attr tree of
+    ``serializer_class`` is used for all the validation errors of the batch.
+    """
+    context = get_batch_context(serializer_class)
+    handler_class = package_settings.EXCEPTION_HANDLER_CLASS
+    msg = "`EXCEPTION_HANDLER_CLASS` should be a subclass of ExceptionHandler."
+    assert issubclass(handler_class, ExceptionHandler), msg
+    formatter_class = formatter_class or package_settings.EXCEPTION_FORMATTER_CLASS
+    msg = "`EXCEPTION_FORMATTER_CLASS` should be a subclass of ExceptionFormatter."
+    assert issubclass(formatter_class, ExceptionFormatter), msg
+
+    for index, exc in enumerate(excs, start=index_offset):
+        if exc is None:
+            continue
+        handler = handler_class(exc, context)
+        api_exc = handler.convert_exception_group(exc)
+        api_exc = handler.convert_known_exceptions(api_exc)
+        api_exc = handler.convert_unhandled_exceptions(api_exc)
+        yield index, formatter_class(api_exc, context, exc).run()
+
+
+def get_batch_context(serializer_class: Optional[type]) -> ExceptionHandlerContext:
+    view = None
+    if serializer_class is not None:
+        # formatters get the serializer class from the view
+        view = GenericAPIView(serializer_class=serializer_class)
+    return {"view": view, "args": (), "kwargs": {}, "request": None}
@@ -0,0 +1,204 @@
+"""
+Serializers and validators for bulk endpoints.
+"""
+
+from functools import reduce
+from itertools import count
+from operator import or_
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+from django.db import models
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+from rest_framework.exceptions import ErrorDetail, ValidationError
+from rest_framework.settings import api_settings as drf_settings
+from rest_framework.utils import html
+from rest_framework.validators import UniqueTogetherValidator, UniqueValidator
+
+
+class TooManyItemErrors(Exception):
+    pass
+
+
+class FailFastListSerializerMixin:
+    """
+    ListSerializer mixin that stops validating the items once
+    ``max_item_errors`` of them are invalid, so that rejecting a large invalid
+    payload costs in proportion to the number of errors reported rather than
+    to the size of the payload. When items are skipped, the errors are raised
+    in the DRF dict format along with a "too_many_errors" error under the
+    non field errors key of the list.
+    """
+
+    default_error_messages = {
+        "too_many_errors": _(
+            "Validation stopped after {max_item_errors} invalid items."
+        ),
+    }
+    max_item_errors: Optional[int] = 100
+
+    child: Any
+    error_messages: Dict[str, Any]
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        if "max_item_errors" in kwargs:
+            self.max_item_errors = kwargs.pop("max_item_errors")
+        super().__init__(*args, **kwargs)
+
+    def to_internal_value(self, data: Any) -> Any:
+        if html.is_html_input(data):
+            data = html.parse_html_list(data, default=[])
+        item_errors: Dict[int, Any] = {}
+        item_count = len(data) if isinstance(data, list) else 0
+        item_indices = count()
+        run_validation = self.child.run_validation
+
+        def run_item_validation(item: Any) -> Any:
+            # items are validated in order by ListSerializer.to_internal_value
+            index = next(item_indices)
+            try:
+                return run_validation(item)
+            except ValidationError as exc:
+                item_errors[index] = exc.detail
+                if (
+                    self.max_item_errors is not None
+                    and len(item_errors) >= self.max_item_errors
+                    and index + 1 < item_count
+                ):
+                    raise TooManyItemErrors() from exc
+                raise
+
+        # the child validation is wrapped rather than overriding
+        # ``run_child_validation`` which only exists since DRF 3.15
+        self.child.run_validation = run_item_validation
+        try:
+            return super().to_internal_value(data)  # type: ignore[misc]
+        except TooManyItemErrors:
+            message = self.error_messages["too_many_errors"].format(
+                max_item_errors=self.max_item_errors
+            )
+            detail = ErrorDetail(message, code="too_many_errors")
+            errors = {**item_errors, drf_settings.NON_FIELD_ERRORS_KEY: [detail]}
+            raise ValidationError(errors)
+        finally:
+            del self.child.run_validation
+
+
+class FailFastListSerializer(FailFastListSerializerMixin, serializers.ListSerializer):
+    pass
+
+
+class BulkUniqueValidator:
+    """
+    ListSerializer validator that checks that the items are unique with one
+    query for the whole list, instead of one query per item for
+    ``UniqueValidator`` and ``UniqueTogetherValidator`` (or one query per
+    ``batch_size`` query params for large lists). Items that duplicate
+    a previous item of the list are rejected as well. Errors are raised per
+    item index: under the field name when checking a single field and under
+    the non field errors key of the item otherwise.
+    """
+
+    requires_context = True
+    message = UniqueValidator.message
+    together_message = UniqueTogetherValidator.message
+    duplicate_message = _("Duplicate of the item at index {index}.")
+    code = "unique"
+    batch_size = 900
+
+    def __init__(
+        self,
+        queryset: models.QuerySet,
+        fields: Sequence[str],
+        message: Optional[str] = None,
+        duplicate_message: Optional[str] = None,
+    ):
+        self.queryset = queryset
+        self.fields = list(fields)
+        if message is not None:
+            self.message = message
+        elif len(self.fields) > 1:
+            self.message = self.together_message
+        if duplicate_message is not None:
+            self.duplicate_message = duplicate_message
+
+    def __call__(self, value: List[Dict[str, Any]], serializer: Any) -> None:
+        keys = {}
+        for index, attrs in enumerate(value):
+            key = self.get_key(attrs)
+            if key is not None:
+                keys[index] = key
+        if not keys:
+            return
+
+        existing_keys = self.get_existing_keys(set(keys.values()), serializer)
+        errors = {}
+        first_indices: Dict[Tuple[Hashable, ...], int] = {}
+        for index, key in keys.items():
+            if key in existing_keys:
+                field_names = ", ".join(self.fields)
+                message = self.message.format(field_names=field_names)
+                errors[index] = self.get_item_error(message)
+            elif key in first_indices:
+                message = self.duplicate_message.format(index=first_indices[key])
+                errors[index] = self.get_item_error(message)
+            else:
+                first_indices[key] = index
+        if errors:
+            raise ValidationError(errors)
+
+    def get_key(self, attrs: Dict[str, Any]) -> Optional[Tuple[Hashable, ...]]:
+        """
+        Return the values of the fields for the item or None when one of them
+        is missing or null: null values are never checked for uniqueness.
+        """
+        values = []
+        for field in self.fields:
+            value = attrs.get(field)
+            if value is None:
+                return None
+            values.append(value.pk if isinstance(value, models.Model) else value)
+        return tuple(values)
+
+    def get_existing_keys(
+        self, keys: Set[Tuple[Hashable, ...]], serializer: Any
+    ) -> Set[Tuple[Hashable, ...]]:
+        """
+        Query the keys in chunks of at most ``batch_size`` query params to
+        stay under the limits of the databases (like 999 params for older
+        SQLite versions and 1000 items in an IN list for Oracle).
+        """
+        queryset = self.exclude_current_instances(self.queryset.all(), serializer)
+        chunk_size = max(self.batch_size // len(self.fields), 1)
+        keys_list = list(keys)
+        existing_keys = set()
+        for start in range(0, len(keys_list), chunk_size):
+            chunk = keys_list[start : start + chunk_size]
+            if len(self.fields) == 1:
+                (field,) = self.fields
+                lookup = Q(**{f"{field}__in": [key[0] for key in chunk]})
+            else:
+                lookups = (Q(**dict(zip(self.fields, key))) for key in chunk)
+                lookup = reduce(or_, lookups)
+            existing_keys.update(queryset.filter(lookup).values_list(*self.fields))
+        return existing_keys
+
+    def exclude_current_instances(
+        self, queryset: models.QuerySet, serializer: Any
+    ) -> models.QuerySet:
+        """
+        When updating, the instances being updated should not conflict with
+        the items
+        """
+        instances = getattr(serializer, "instance", None)
+        if instances is None:
+            return queryset
+        return queryset.exclude(pk__in=[instance.pk for instance in instances])
+
+    def get_item_error(self, message: str) -> Dict[str, List[ErrorDetail]]:
+        if len(self.fields) == 1:
+            key = self.fields[0]
+        else:
+            key = drf_settings.NON_FIELD_ERRORS_KEY
+        return {key: [ErrorDetail(message, code=self.code)]}
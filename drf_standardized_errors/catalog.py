@@ -0,0 +1,168 @@
+"""
+The catalog of the error codes that each operation of the API can return, as
+documented in the API schema. It relies on the same ``AutoSchema`` methods
+that decide which error responses are added to an operation but does not
+generate the API schema itself: no component is built, so computing the
+catalog is a fraction of the cost of generating the schema. Operations are
+independent of each other and can be inspected by a pool of processes.
+"""
+
+import inspect
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional, Set, Tuple
+
+from django.db import connections
+from drf_spectacular.drainage import GENERATOR_STATS
+from drf_spectacular.generators import SchemaGenerator
+from drf_spectacular.plumbing import (
+    is_versioning_supported,
+    modify_for_versioning,
+    operation_matches_version,
+)
+from drf_spectacular.settings import spectacular_settings
+from rest_framework import serializers
+from rest_framework.views import APIView
+
+from .openapi import AutoSchema, get_operation_schema
+from .openapi_serializers import ParseErrorCodeEnum, ValidationErrorEnum
+from .settings import package_settings
+
+# (path, path regex, method, view)
+Endpoint = Tuple[str, str, str, APIView]
+
+# the endpoints of the worker processes
+_endpoints: List[Endpoint] = []
+
+
+@dataclass
+class CatalogEntry:
+    operation: str
+    status: str
+    attr: Optional[str]
+    codes: List[str]
+
+
+def iter_error_catalog(
+    generator: Optional[SchemaGenerator] = None, workers: int = 1
+) -> Iterator[CatalogEntry]:
+    """
+    Yield the catalog entries operation by operation and in the order of the
+    endpoints. With more than one worker, operations are inspected by a pool
+    of processes. Inspecting operations is CPU-bound, so threads would not run
+    it in parallel. Worker processes are forked to inherit the URLconf and
+    the generator, which is not possible on all platforms: operations are
+    inspected in the current process there.
+    """
+    generator = generator or SchemaGenerator()
+    with GENERATOR_STATS.silence():
+        endpoints = get_endpoints(generator)
+        if workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+            # forked processes must not share the database connections
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=init_worker,
+                initargs=(generator,),
+            ) as executor:
+                indices = range(len(endpoints))
+                for entries in executor.map(get_endpoint_entries, indices):
+                    yield from entries
+        else:
+            for endpoint in endpoints:
+                yield from get_operation_entries(endpoint)
+
+
+def init_worker(generator: SchemaGenerator) -> None:
+    global _endpoints
+    with GENERATOR_STATS.silence():
+        _endpoints = get_endpoints(generator)
+
+
+def get_endpoint_entries(index: int) -> List[CatalogEntry]:
+    with GENERATOR_STATS.silence():
+        return get_operation_entries(_endpoints[index])
+
+
+def get_endpoints(generator: SchemaGenerator) -> List[Endpoint]:
+    """
+    Return the endpoints of the API schema with their views set up the same
+    way as ``SchemaGenerator.parse`` does.
+    """
+    generator._initialise_endpoints()
+    endpoints = []
+    for path, path_regex, method, view in generator._get_paths_and_endpoints():
+        view.request = spectacular_settings.GET_MOCK_REQUEST(method, path, view, None)
+        if view.versioning_class and is_versioning_supported(view.versioning_class):
+            version = generator.api_version or view.versioning_class.default_version
+            if not version:
+                continue
+            patterns = generator.inspector.patterns  # type: ignore[union-attr]
+            path = modify_for_versioning(patterns, method, path, view, version)
+            if not operation_matches_version(view, version):
+                continue
+        endpoints.append((path, path_regex, method, view))
+    return endpoints
+
+
+def get_operation_entries(endpoint: Endpoint) -> List[CatalogEntry]:
+    path, path_regex, method, view = endpoint
+    if not isinstance(getattr(view, "schema", None), AutoSchema):
+        return []
+
+    schema = get_operation_schema(view, path, method, path_regex)
+    if schema.is_excluded():
+        return []
+
+    operation = f"{schema.method} {path}"
+    responses = dict.fromkeys(get_declared_status_codes(schema))
+    custom_status_codes = {
+        str(status_code) for status_code in package_settings.ERROR_SCHEMAS or {}
+    }
+    entries = []
+    for status_code in schema._get_allowed_error_status_codes():
+        if not schema._should_add_error_response(responses, status_code):
+            continue
+
+        if status_code == "400" and status_code not in custom_status_codes:
+            for error_type in schema._get_http400_error_types():
+                if error_type == ValidationErrorEnum.VALIDATION_ERROR.value:  # type: ignore[attr-defined]
+                    error_codes_by_field = schema._get_validation_error_codes()
+                    for attr, error_codes in error_codes_by_field.items():
+                        codes = sorted(error_codes)
+                        entries.append(
+                            CatalogEntry(operation, status_code, attr, codes)
+                        )
+                else:
+                    codes = [ParseErrorCodeEnum.PARSE_ERROR.value]  # type: ignore[attr-defined]
+                    entries.append(CatalogEntry(operation, status_code, None, codes))
+        else:
+            serializer = schema._get_error_response_serializer(status_code)
+            codes = get_error_codes(serializer)
+            entries.append(CatalogEntry(operation, status_code, None, codes))
+    return entries
+
+
+def get_declared_status_codes(schema: AutoSchema) -> Set[str]:
+    """
+    Return the status codes of the responses declared with ``extend_schema``
+    which are never replaced by the error responses.
+    """
+    responses = schema.get_response_serializers()
+    if not isinstance(responses, dict):
+        return set()
+    # keys are either status codes or (status code, media type) tuples
+    return {str(key[0] if isinstance(key, tuple) else key) for key in responses.keys()}
+
+
+def get_error_codes(serializer: Any) -> List[str]:
+    """Return the choices of the error code field of an error response serializer"""
+    if inspect.isclass(serializer):
+        serializer = serializer()
+    errors = getattr(serializer, "fields", {}).get("errors")
+    code = getattr(getattr(errors, "child", None), "fields", {}).get("code")
+    if isinstance(code, serializers.ChoiceField):
+        return sorted(code.choices)
+    return []
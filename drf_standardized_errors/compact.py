@@ -0,0 +1,98 @@
+"""
+A compact error response format for endpoints that can return a large number
+of validation errors (like bulk endpoints using a ``ListSerializer``). Instead
+of repeating the same code, detail and attr for every list item, unique values
+are stored once in tables and errors reference them by index:
+
+{
+    "type": "validation_error",
+    "codes": ["invalid"],
+    "details": ["Enter a valid email address."],
+    "attrs": ["items.INDEX.email"],
+    "errors": [[0, 0, 0, [[0, 100], [150, 151]]]]
+}
+
+Each entry in "errors" is ``[code index, detail index, attr index, ranges]``.
+The attr is a template where list indices are replaced with
+``LIST_INDEX_IN_API_SCHEMA`` while dict keys are kept as is. Each range is ``[*indices, start, stop]``:
+``indices`` fill all but the last placeholder of the attr template and the
+last placeholder takes every value from ``start`` (included) to ``stop``
+(excluded). When the template has no placeholder, the range is ``[0, count]``
+where ``count`` is the number of times the error occurs. The example above
+decodes to errors for "items.0.email" to "items.99.email" and "items.150.email".
+
+Errors sharing the same code, detail and attr template are grouped together,
+so decoding returns them grouped in the order of their first occurrence.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from .attr_paths import AttrNode
+from .formatter import ExceptionFormatter, get_ranges, split_attr
+from .settings import package_settings
+from .types import Error, ErrorResponse
+
+
+class CompactExceptionFormatter(ExceptionFormatter):
+    def format_error_response(self, error_response: ErrorResponse) -> Any:
+        return {
+            "type": error_response.type,
+            **encode_errors(error_response.errors, self.get_attr_tree()),
+        }
+
+
+def encode_errors(
+    errors: List[Error], tree: Optional[AttrNode] = None
+) -> Dict[str, list]:
+    codes: Dict[str, int] = {}
+    details: Dict[str, int] = {}
+    attrs: Dict[Optional[str], int] = {}
+    indices_by_key: Dict[Tuple[int, int, int], List[List[int]]] = {}
+    for error in errors:
+        template, indices = split_attr(error.attr, tree)
+        key = (
+            codes.setdefault(error.code, len(codes)),
+            details.setdefault(error.detail, len(details)),
+            attrs.setdefault(template, len(attrs)),
+        )
+        indices_by_key.setdefault(key, []).append(indices)
+
+    return {
+        "codes": list(codes),
+        "details": list(details),
+        "attrs": list(attrs),
+        "errors": [
+            [*key, get_ranges(all_indices)]
+            for key, all_indices in indices_by_key.items()
+        ],
+    }
+
+
+def decode_errors(data: Dict[str, Any]) -> List[Dict[str, Optional[str]]]:
+    """
+    Reference decoder returning the errors in the default format
+    (a list of dicts with "code", "detail" and "attr")
+    """
+    separator = package_settings.NESTED_FIELD_SEPARATOR
+    placeholder = package_settings.LIST_INDEX_IN_API_SCHEMA
+    codes, details, attrs = data["codes"], data["details"], data["attrs"]
+
+    errors = []
+    for code_index, detail_index, attr_index, ranges in data["errors"]:
+        code, detail, template = (
+            codes[code_index],
+            details[detail_index],
+            attrs[attr_index],
+        )
+        parts = template.split(separator) if template else []
+        positions = [i for i, part in enumerate(parts) if part == placeholder]
+        for *prefix, start, stop in ranges:
+            for index in range(start, stop):
+                if not positions:
+                    attr = template
+                else:
+                    for position, value in zip(positions, [*prefix, index]):
+                        parts[position] = str(value)
+                    attr = separator.join(parts)
+                errors.append({"code": code, "detail": detail, "attr": attr})
+    return errors
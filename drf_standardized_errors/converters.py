@@ -0,0 +1,159 @@
+import builtins
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+from django.core.exceptions import PermissionDenied
+from django.http import Http404
+from rest_framework import exceptions
+from rest_framework.settings import api_settings as drf_settings
+
+from .settings import SettingsSnapshot, package_settings
+
+Converter = Union[
+    Type[exceptions.APIException], Callable[[Exception], exceptions.APIException]
+]
+
+_registry: Dict[Type[Exception], Converter] = {
+    Http404: exceptions.NotFound,
+    PermissionDenied: exceptions.PermissionDenied,
+}
+# converters resolved by exception type for the settings snapshot they were
+# resolved with. It is replaced as a whole when it becomes stale.
+_cache: Tuple[Optional[SettingsSnapshot], Dict[type, Optional[Converter]]] = (None, {})
+
+
+def register_exception_converter(
+    exc_class: Type[Exception], converter: Optional[Converter] = None
+) -> Any:
+    """
+    Register a converter for ``exc_class`` and its subclasses. The converter
+    can be an ``APIException`` subclass (instantiated without arguments) or a
+    callable that receives the exception and returns an ``APIException``.
+    When ``converter`` is not passed, this can be used as a decorator.
+    """
+    if converter is None:
+
+        def decorator(func: Converter) -> Converter:
+            register_exception_converter(exc_class, func)
+            return func
+
+        return decorator
+
+    global _cache
+    _registry[exc_class] = converter
+    _cache = (None, {})
+    return converter
+
+
+def get_exception_converter(exc_class: type) -> Optional[Converter]:
+    """
+    Return the converter registered for the closest class in the MRO of
+    ``exc_class``. Converters in the ``EXCEPTION_CONVERTERS`` setting take
+    precedence over registered ones for the same class.
+    """
+    global _cache
+    snapshot = package_settings.snapshot
+    cache_snapshot, converters_by_class = _cache
+    if cache_snapshot is not snapshot:
+        converters_by_class = {}
+        _cache = (snapshot, converters_by_class)
+
+    try:
+        return converters_by_class[exc_class]
+    except KeyError:
+        pass
+
+    converters = {**_registry, **snapshot.EXCEPTION_CONVERTERS}
+    converter = next(
+        (converters[cls] for cls in exc_class.__mro__ if cls in converters), None
+    )
+    converters_by_class[exc_class] = converter
+    return converter
+
+
+def convert_exception(exc: Exception) -> Exception:
+    if isinstance(exc, exceptions.APIException):
+        # DRF exceptions are never converted, even by a converter registered
+        # for one of their base classes (like Exception)
+        return exc
+    converter = get_exception_converter(type(exc))
+    if converter is None:
+        return exc
+    elif isinstance(converter, type) and issubclass(converter, exceptions.APIException):
+        return converter()
+    else:
+        return converter(exc)
+
+
+def is_exception_group(exc: BaseException) -> bool:
+    # exception groups were added in python 3.11
+    return isinstance(exc, getattr(builtins, "BaseExceptionGroup", ()))
+
+
+def iter_leaf_exceptions(exc: BaseException) -> Iterator[BaseException]:
+    """Generate the exceptions of a (nested) exception group in order"""
+    stack = [exc]
+    while stack:
+        exc = stack.pop()
+        if is_exception_group(exc):
+            stack.extend(reversed(exc.exceptions))  # type: ignore[attr-defined]
+        else:
+            yield exc
+
+
+def merge_validation_errors(
+    excs: List[exceptions.ValidationError],
+) -> exceptions.ValidationError:
+    """
+    Merge the details of validation errors into one. Errors that are not
+    linked to a field are added to the non field errors when other details
+    are dicts. The errors of list items (like the ones of a ListSerializer)
+    are merged by item index.
+    """
+    details = [get_item_errors(exc.detail) for exc in excs]
+    if all(isinstance(detail, list) for detail in details):
+        return exceptions.ValidationError([e for detail in details for e in detail])
+
+    merged: Dict[Any, Any] = {}
+    for detail in details:
+        if isinstance(detail, list):
+            detail = {drf_settings.NON_FIELD_ERRORS_KEY: detail}
+        merge_error_details(merged, detail)
+    return exceptions.ValidationError(merged)
+
+
+def get_item_errors(detail: Any) -> Any:
+    """
+    A list of dicts or lists is the errors of list items in the DRF list format
+    (where valid items have empty errors). It is returned in the DRF dict
+    format so that it is merged by index. Other details are returned as is.
+    """
+    if isinstance(detail, list) and any(
+        isinstance(item, (dict, list)) for item in detail
+    ):
+        return {index: item for index, item in enumerate(detail) if item}
+    return detail
+
+
+def merge_error_details(merged: Dict[Any, Any], detail: Dict[Any, Any]) -> None:
+    """
+    Merge ``detail`` into ``merged``. New containers are built at every level
+    so that the details of the merged exceptions are never modified.
+    """
+    for key, value in detail.items():
+        value = get_item_errors(value)
+        existing = merged.get(key)
+        if existing is None:
+            if isinstance(value, dict):
+                merged[key] = {}
+                merge_error_details(merged[key], value)
+            elif isinstance(value, list):
+                # lists with nested errors were converted to dicts above
+                merged[key] = list(value)
+            else:
+                merged[key] = value
+        elif isinstance(existing, list) and isinstance(value, list):
+            existing.extend(value)
+        elif isinstance(existing, dict) and isinstance(value, dict):
+            merge_error_details(existing, value)
+        # otherwise, the errors of a field and of its nested fields cannot be
+        # combined, so the first ones are kept
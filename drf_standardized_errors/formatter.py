@@ -1,10 +1,13 @@
+from collections import deque
 from dataclasses import asdict
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from rest_framework import exceptions
 from rest_framework.status import is_client_error
 
+from .attr_paths import AttrNode, get_view_attr_tree, join_attr
 from .settings import package_settings
+from .streaming import get_json_encoder, iter_json_chunks
 from .types import (
     CLIENT_ERROR,
     SERVER_ERROR,
@@ -42,8 +45,14 @@ class ExceptionFormatter:
 
         Only validation errors can have multiple errors. Other error types have only
         one error.
+
+        When minimal errors are requested (see `should_omit_detail`), the detail is
+        omitted.
         """
         error_type = self.get_error_type()
+        if self.should_omit_detail():
+            return {"type": error_type, "errors": list(self.iter_minimal_errors())}
+
         errors = self.get_errors()
         error_response = self.get_error_response(error_type, errors)
         return self.format_error_response(error_response)
@@ -61,7 +70,38 @@ class ExceptionFormatter:
         Account for validation errors in nested serializers by returning a list
         of errors instead of a nested dict
         """
-        return flatten_errors(self.exc.detail)
+        return list(self.iter_errors())
+
+    def iter_errors(self) -> Iterator[Error]:
+        return iter_errors(self.exc.detail, tree=self.get_attr_tree())
+
+    def get_attr_tree(self) -> Optional[AttrNode]:
+        """
+        Return the attr tree of the view serializer for validation errors. It
+        is only a shortcut to precomputed attrs, so the errors are formatted
+        the same even if they were raised by another serializer.
+        """
+        if not isinstance(self.exc, exceptions.ValidationError):
+            return None
+        return get_view_attr_tree(self.context["view"])
+
+    def should_omit_detail(self) -> bool:
+        """
+        Clients that show their own messages based on the error code can request
+        minimal errors with the `Prefer: errors=minimal` header or the
+        `errors=minimal` query parameter when `ENABLE_MINIMAL_ERRORS` is set.
+        That is ignored for formatters that customize the error response.
+        """
+        return (
+            package_settings.ENABLE_MINIMAL_ERRORS
+            and not self.is_error_response_customized()
+            and is_minimal_errors_requested(self.context["request"])
+        )
+
+    def iter_minimal_errors(self) -> Iterator[Dict[str, Any]]:
+        tree = self.get_attr_tree()
+        for detail, attr in iter_error_details(self.exc.detail, tree=tree):
+            yield {"code": detail.code, "attr": attr}
 
     def get_error_response(
         self, error_type: ErrorType, errors: List[Error]
@@ -71,6 +111,47 @@ class ExceptionFormatter:
     def format_error_response(self, error_response: ErrorResponse) -> Any:
         return asdict(error_response)
 
+    def stream(self) -> Iterator[bytes]:
+        """
+        Same as `run` but the error response is encoded to JSON incrementally
+        from the lazy errors generator, so the memory used does not grow with
+        the number of errors. Formatters that customize the error response
+        (by overriding `get_errors`, `get_error_response` or
+        `format_error_response`) are encoded in one chunk instead.
+        """
+        if self.is_error_response_customized():
+            yield get_json_encoder().encode(self.run()).encode()
+            return
+
+        errors: Iterator[Dict[str, Any]]
+        if self.should_omit_detail():
+            errors = self.iter_minimal_errors()
+        else:
+            errors = (asdict(error) for error in self.iter_errors())
+        yield from iter_json_chunks(self.get_error_type(), errors)
+
+    def is_error_response_customized(self) -> bool:
+        return any(
+            getattr(type(self), name) is not getattr(ExceptionFormatter, name)
+            for name in ("get_errors", "get_error_response", "format_error_response")
+        )
+
+
+class GroupedExceptionFormatter(ExceptionFormatter):
+    """
+    Group the errors that share the same code, detail and attr template
+    (like "items.INDEX.email") into a single error with the ranges of the
+    offending list indices. That way, the size of validation errors of bulk
+    endpoints depends on the number of distinct problems rather than on the
+    number of rows.
+    """
+
+    def format_error_response(self, error_response: ErrorResponse) -> Any:
+        return {
+            "type": error_response.type,
+            "errors": group_errors(error_response.errors, self.get_attr_tree()),
+        }
+
 
 def flatten_errors(
     detail: Union[list, dict, exceptions.ErrorDetail],
@@ -111,35 +192,205 @@ def flatten_errors(
         ]
     }
     """
+    return list(iter_errors(detail, attr, index))
+
+
+def iter_errors(
+    detail: Union[list, dict, exceptions.ErrorDetail],
+    attr: Optional[str] = None,
+    index: Optional[int] = None,
+    tree: Optional[AttrNode] = None,
+) -> Iterator[Error]:
+    """
+    Same as `flatten_errors` but the errors are generated lazily. That allows
+    encoding very large validation errors without building the whole list.
+    """
+    for error_detail, error_attr in iter_error_details(detail, attr, index, tree):
+        yield Error(error_detail.code, str(error_detail), error_attr)
 
+
+def iter_error_details(
+    detail: Union[list, dict, exceptions.ErrorDetail],
+    attr: Optional[str] = None,
+    index: Optional[int] = None,
+    tree: Optional[AttrNode] = None,
+) -> Iterator[Tuple[exceptions.ErrorDetail, Optional[str]]]:
+    """
+    Generate each error detail along with its attr without converting it to
+    a string. When the attr tree of the serializer that raised the errors is
+    passed, the attrs that do not depend on a list index or dict key are taken
+    from it instead of being built again.
+    """
     # preserve the order of the previous implementation with a fifo queue
-    fifo = [(detail, attr, index)]
-    errors = []
+    fifo = deque([(detail, attr, index, tree)])
     while fifo:
-        detail, attr, index = fifo.pop(0)
+        detail, attr, index, node = fifo.popleft()
         if not detail and detail != "":
             continue
         elif isinstance(detail, list):
+            item_node = node.item if node else None
             for item in detail:
                 if not isinstance(item, exceptions.ErrorDetail):
                     index = 0 if index is None else index + 1
-                    if attr:
-                        new_attr = (
-                            f"{attr}{package_settings.NESTED_FIELD_SEPARATOR}{index}"
-                        )
-                    else:
-                        new_attr = str(index)
-                    fifo.append((item, new_attr, index))
+                    new_attr = join_attr(attr, index) if attr else str(index)
+                    fifo.append((item, new_attr, index, item_node))
                 else:
-                    fifo.append((item, attr, index))
+                    fifo.append((item, attr, index, node))
 
         elif isinstance(detail, dict):
             for key, value in detail.items():
-                if attr:
-                    key = f"{attr}{package_settings.NESTED_FIELD_SEPARATOR}{key}"
-                fifo.append((value, key, None))
+                child = node.get_child(key) if node else None
+                if child and child.attr is not None:
+                    key = child.attr
+                elif attr:
+                    key = join_attr(attr, key)
+                else:
+                    # the list errors of a root ListSerializer are keyed by index
+                    key = str(key)
+                fifo.append((value, key, None, child))
+
+        else:
+            yield detail, attr
+
+
+def iter_chunked_errors(
+    chunks: Iterable[Tuple[int, exceptions.ValidationError]],
+    attr: Optional[str] = None,
+) -> Iterator[Error]:
+    """
+    Generate the errors of a list validated in chunks. Each chunk is a tuple of
+    the index of its first item in the whole list and the validation error
+    raised for the chunk (like the one of a `ListSerializer`). The list indices
+    in the attrs are offset so that they refer to items of the whole list.
+    """
+    for offset, exc in chunks:
+        detail = exc.detail
+        if isinstance(detail, dict):
+            # recent DRF versions key the errors of a ListSerializer by index
+            detail = {
+                key + offset if isinstance(key, int) else key: value
+                for key, value in detail.items()
+            }
+            yield from iter_errors(detail, attr)
+        else:
+            # the index is incremented before being used for the first item
+            yield from iter_errors(detail, attr, offset - 1)
+
+
+def is_minimal_errors_requested(request: Any) -> bool:
+    if request is None:
+        return False
+    if request.GET.get("errors") == "minimal":
+        return True
+    for preference in request.headers.get("Prefer", "").split(","):
+        name, _, value = preference.split(";")[0].partition("=")
+        if name.strip().lower() == "errors" and value.strip(' "').lower() == "minimal":
+            return True
+    return False
+
+
+def group_errors(
+    errors: List[Error], tree: Optional[AttrNode] = None
+) -> List[Dict[str, Any]]:
+    """
+    convert this:
+    [
+        Error("invalid", "Enter a valid email address.", "items.0.email"),
+        Error("invalid", "Enter a valid email address.", "items.1.email"),
+        Error("invalid", "Enter a valid email address.", "items.5.email"),
+    ]
+    to:
+    [
+        {
+            "code": "invalid",
+            "detail": "Enter a valid email address.",
+            "attr": "items.INDEX.email",
+            "indices": [[0, 2], [5, 6]]
+        }
+    ]
+    Errors whose attr does not contain list indices are left as is.
+    """
+    grouped_errors: List[Dict[str, Any]] = []
+    indices_by_key: Dict[Tuple[str, str, Optional[str]], List[List[int]]] = {}
+    for error in errors:
+        template, indices = split_attr(error.attr, tree)
+        if not indices:
+            grouped_errors.append(asdict(error))
+            continue
+
+        key = (error.code, error.detail, template)
+        if key not in indices_by_key:
+            indices_by_key[key] = []
+            grouped_errors.append(
+                {
+                    "code": error.code,
+                    "detail": error.detail,
+                    "attr": template,
+                    "indices": indices_by_key[key],
+                }
+            )
+        indices_by_key[key].append(indices)
+
+    for grouped_error in grouped_errors:
+        if "indices" in grouped_error:
+            grouped_error["indices"] = get_ranges(grouped_error["indices"])
+    return grouped_errors
+
 
+def split_attr(
+    attr: Optional[str], tree: Optional[AttrNode] = None
+) -> Tuple[Optional[str], List[int]]:
+    """
+    Return the attr template (like "items.INDEX.email") and the list indices
+    that were replaced by the placeholder. With the attr tree of the serializer,
+    only the positions in lists are replaced so that dict keys made of digits
+    are kept as is. Otherwise (or from the first part missing from the tree,
+    like the item index when the serializer of the view is used with
+    `many=True`), any number is taken for a list index unless it has leading
+    zeros.
+    """
+    if not attr:
+        return attr, []
+    separator = package_settings.NESTED_FIELD_SEPARATOR
+    placeholder = package_settings.LIST_INDEX_IN_API_SCHEMA
+    parts = attr.split(separator)
+    indices = []
+    node = tree
+    for position, part in enumerate(parts):
+        child = node.get_child(part) if node is not None else None
+        if node is not None and child is not None:
+            is_index = node.is_list and part.isdigit()
+            node = child
         else:
-            errors.append(Error(detail.code, str(detail), attr))  # type: ignore[union-attr]
+            node = None
+            is_index = part.isdigit() and str(int(part)) == part
+        if is_index:
+            indices.append(int(part))
+            parts[position] = placeholder
+    if not indices:
+        return attr, indices
+    return separator.join(parts), indices
+
+
+def get_ranges(all_indices: List[List[int]]) -> List[List[int]]:
+    """
+    Compress the indices of errors into ranges like ``[*indices, start, stop]``
+    where the last index goes from start (included) to stop (excluded). Without
+    indices, the range is ``[0, count]``.
+    """
+    ranges: List[List[int]] = []
+    for indices in all_indices:
+        if not indices:
+            if ranges:
+                ranges[-1][-1] += 1
+            else:
+                ranges.append([0, 1])
+            continue
 
-    return errors
+        *prefix, index = indices
+        last = ranges[-1] if ranges else None
+        if last is not None and last[:-2] == prefix and last[-1] == index:
+            last[-1] += 1
+        else:
+            ranges.append([*prefix, index, index + 1])
+    return ranges
@@ -1,26 +1,35 @@
+import random
 import sys
-from typing import Optional
+from typing import Iterator, Optional
 
 import django
 from django.conf import settings
 from django.core import signals
-from django.core.exceptions import PermissionDenied
-from django.http import Http404
+from django.http import JsonResponse, StreamingHttpResponse
+from django.http.response import HttpResponseBase
 from django.utils.log import log_response
 from rest_framework import exceptions
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.status import is_server_error
+from rest_framework.utils.mediatypes import media_type_matches
 from rest_framework.views import set_rollback
 
+from .converters import (
+    convert_exception,
+    is_exception_group,
+    iter_leaf_exceptions,
+    merge_validation_errors,
+)
 from .formatter import ExceptionFormatter
 from .settings import package_settings
+from .streaming import get_streaming_response
 from .types import ExceptionHandlerContext
 
 
 def exception_handler(
     exc: Exception, context: ExceptionHandlerContext
-) -> Optional[Response]:
+) -> Optional[HttpResponseBase]:
     exception_handler_class = package_settings.EXCEPTION_HANDLER_CLASS
     msg = "`EXCEPTION_HANDLER_CLASS` should be a subclass of ExceptionHandler."
     assert issubclass(exception_handler_class, ExceptionHandler), msg
@@ -28,34 +37,72 @@ def exception_handler(
 
 
 class ExceptionHandler:
+    # set to False when the exception is already reported, like in the error
+    # views that django calls after reporting the exception
+    report_exceptions = True
+
     def __init__(self, exc: Exception, context: ExceptionHandlerContext):
         self.exc = exc
         self.context = context
 
-    def run(self) -> Optional[Response]:
+    def run(self) -> Optional[HttpResponseBase]:
         """entrypoint for handling an exception"""
-        exc = self.convert_known_exceptions(self.exc)
+        exc = self.convert_exception_group(self.exc)
+        exc = self.convert_known_exceptions(exc)
         if self.should_not_handle(exc):
             return None
 
         exc = self.convert_unhandled_exceptions(exc)
-        data = self.format_exception(exc)
-        self.set_rollback()
-        response = self.get_response(exc, data)
-        self.report_exception(exc, response)
+        if self.should_stream(exc):
+            chunks = self.stream_exception(exc)
+            self.set_rollback()
+            response = self.get_streaming_response(exc, chunks)
+        else:
+            data = self.format_exception(exc)
+            self.set_rollback()
+            response = self.get_response(exc, data)
+        if self.report_exceptions:
+            self.report_exception(exc, response)
+        self.sample_error_codes(exc)
         return response
 
+    def convert_exception_group(self, exc: Exception) -> Exception:
+        """
+        Exception groups (like the ones raised by `asyncio.TaskGroup`) are handled
+        as one exception: validation errors are merged into one and the exception
+        with the highest status code is returned. When one of the exceptions is not
+        a DRF exception once converted, the group is returned as is to be handled
+        like any unhandled exception. Either way, the group is reported once.
+        """
+        if not is_exception_group(exc):
+            return exc
+
+        excs = [
+            self.convert_known_exceptions(e) if isinstance(e, Exception) else e
+            for e in iter_leaf_exceptions(exc)
+        ]
+        api_excs = [e for e in excs if isinstance(e, exceptions.APIException)]
+        if len(api_excs) < len(excs):
+            return exc
+
+        validation_errors = [
+            e for e in api_excs if isinstance(e, exceptions.ValidationError)
+        ]
+        if len(validation_errors) > 1:
+            merged = merge_validation_errors(validation_errors)
+            api_excs = [merged] + [
+                e for e in api_excs if not isinstance(e, exceptions.ValidationError)
+            ]
+        # the first exception with the highest status code
+        return max(api_excs, key=lambda e: e.status_code)
+
     def convert_known_exceptions(self, exc: Exception) -> Exception:
         """
         By default, Django's built-in `Http404` and `PermissionDenied` are converted
-        to their DRF equivalent.
+        to their DRF equivalent. More conversions can be added with the
+        `EXCEPTION_CONVERTERS` setting or `register_exception_converter`.
         """
-        if isinstance(exc, Http404):
-            return exceptions.NotFound()
-        elif isinstance(exc, PermissionDenied):
-            return exceptions.PermissionDenied()
-        else:
-            return exc
+        return convert_exception(exc)
 
     def should_not_handle(self, exc: Exception) -> bool:
         """
@@ -82,29 +129,133 @@ class ExceptionHandler:
         else:
             return exc
 
-    def format_exception(self, exc: exceptions.APIException) -> dict:
+    def get_exception_formatter(
+        self, exc: exceptions.APIException
+    ) -> ExceptionFormatter:
         exception_formatter_class = package_settings.EXCEPTION_FORMATTER_CLASS
         msg = "`EXCEPTION_FORMATTER_CLASS` should be a subclass of ExceptionFormatter."
         assert issubclass(exception_formatter_class, ExceptionFormatter), msg
-        return exception_formatter_class(exc, self.context, self.exc).run()
+        return exception_formatter_class(exc, self.context, self.exc)
+
+    def format_exception(self, exc: exceptions.APIException) -> dict:
+        return self.get_exception_formatter(exc).run()
+
+    def should_stream(self, exc: exceptions.APIException) -> bool:
+        """
+        By default, validation errors are streamed when `ENABLE_STREAMING_RESPONSES`
+        is set. Override this to stream only for specific views (like bulk endpoints)
+        """
+        return package_settings.ENABLE_STREAMING_RESPONSES and isinstance(
+            exc, exceptions.ValidationError
+        )
+
+    def stream_exception(self, exc: exceptions.APIException) -> Iterator[bytes]:
+        return self.get_exception_formatter(exc).stream()
 
     def set_rollback(self) -> None:
         set_rollback()
 
-    def get_response(self, exc: exceptions.APIException, data: dict) -> Response:
+    def get_response(
+        self, exc: exceptions.APIException, data: dict
+    ) -> HttpResponseBase:
+        """
+        Outside DRF views (check drf_standardized_errors.middleware), there is no
+        content negotiation, so a django `JsonResponse` is returned instead.
+        """
         headers = self.get_headers(exc)
+        if self.context["view"] is None:
+            return JsonResponse(
+                data, status=exc.status_code, headers=headers, safe=False
+            )
+        self.select_error_renderer()
         return Response(data, status=exc.status_code, headers=headers)
 
+    def select_error_renderer(self) -> None:
+        """
+        Render the error response with one of the `ERROR_RENDERER_CLASSES` (like
+        the MessagePack renderer) when the client lists its media type in the
+        Accept header before the one of the renderer selected for the view.
+        Wildcards are ignored, so those renderers are only used by clients that
+        explicitly ask for them and only for error responses.
+        """
+        renderer_classes = package_settings.ERROR_RENDERER_CLASSES
+        request = self.context["request"]
+        if not renderer_classes or not isinstance(request, Request):
+            return
+
+        renderers = [renderer_class() for renderer_class in renderer_classes]
+        # not set when the content negotiation of the view failed
+        accepted_renderer = getattr(request, "accepted_renderer", None)
+        if accepted_renderer is not None:
+            renderers.insert(0, accepted_renderer)
+        for media_type in request.META.get("HTTP_ACCEPT", "").split(","):
+            media_type = media_type.strip()
+            if not media_type or "*" in media_type:
+                continue
+            for renderer in renderers:
+                if media_type_matches(renderer.media_type, media_type):
+                    if renderer is not accepted_renderer:
+                        request.accepted_renderer = renderer
+                        request.accepted_media_type = renderer.media_type
+                    return
+
+    def get_streaming_response(
+        self, exc: exceptions.APIException, chunks: Iterator[bytes]
+    ) -> StreamingHttpResponse:
+        """
+        The JSON is encoded while the response is sent, so the response does
+        not go through DRF content negotiation and rendering.
+        """
+        headers = self.get_headers(exc)
+        return get_streaming_response(
+            chunks, exc.status_code, headers, self.context["request"]
+        )
+
     def get_headers(self, exc: exceptions.APIException) -> dict:
         headers = {}
         if getattr(exc, "auth_header", None):
             headers["WWW-Authenticate"] = exc.auth_header
         if getattr(exc, "wait", None):
             headers["Retry-After"] = "%d" % exc.wait
+        if package_settings.ENABLE_MINIMAL_ERRORS:
+            headers.update(self.get_minimal_errors_headers(exc))
         return headers
 
+    def get_minimal_errors_headers(self, exc: exceptions.APIException) -> dict:
+        """
+        Responses vary with the `Prefer` header when clients can request minimal
+        errors and `Preference-Applied` tells them when minimal errors are returned.
+        """
+        formatter = self.get_exception_formatter(exc)
+        if formatter.is_error_response_customized():
+            return {}
+        headers = {"Vary": "Prefer"}
+        if formatter.should_omit_detail():
+            headers["Preference-Applied"] = "errors=minimal"
+        return headers
+
+    def sample_error_codes(self, exc: exceptions.APIException) -> None:
+        """
+        When `UNDOCUMENTED_ERRORS_SAMPLE_RATE` is set, check that fraction of
+        validation errors against the error codes in the API schema. Imports
+        are done here so that drf-spectacular is only imported when enabled.
+        """
+        rate = package_settings.UNDOCUMENTED_ERRORS_SAMPLE_RATE
+        view = self.context["view"]
+        if (
+            not rate
+            or view is None
+            or not isinstance(exc, exceptions.ValidationError)
+            or random.random() >= rate
+        ):
+            return
+
+        from .sampling import check_error_codes
+
+        check_error_codes(exc, view, self.context["request"])
+
     def report_exception(
-        self, exc: exceptions.APIException, response: Response
+        self, exc: exceptions.APIException, response: HttpResponseBase
     ) -> None:
         """
         Normally, when an exception is unhandled (non-DRF exception), DRF delegates
@@ -117,11 +268,10 @@ class ExceptionHandler:
         to work as usual (error is captured and sent to their servers).
         """
         if is_server_error(exc.status_code):
-            try:
-                drf_request: Request = self.context["request"]
-                request = drf_request._request
-            except AttributeError:
-                request = None
+            # the request is a django HttpRequest when the exception is raised
+            # outside DRF views
+            request = self.context["request"]
+            request = getattr(request, "_request", request)
             signals.got_request_exception.send(sender=None, request=request)
             if django.VERSION < (4, 1):
                 log_response(
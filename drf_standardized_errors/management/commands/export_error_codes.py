@@ -0,0 +1,84 @@
+import csv
+import json
+from dataclasses import asdict
+from typing import IO, Any, Iterable
+
+from django.core.management.base import BaseCommand
+from drf_spectacular.generators import SchemaGenerator
+
+from drf_standardized_errors.catalog import CatalogEntry, iter_error_catalog
+
+
+class Command(BaseCommand):
+    help = (
+        "Export the catalog of the error codes that each operation of the API "
+        "can return: the operation, status code, attr and error codes."
+    )
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            "--format",
+            dest="format",
+            choices=["json", "csv"],
+            default="json",
+            help="Output format of the catalog (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--workers",
+            dest="workers",
+            default=1,
+            type=int,
+            help="Number of processes that inspect the operations (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--file",
+            dest="file",
+            default=None,
+            help="Write the catalog to this file path instead of stdout.",
+        )
+        parser.add_argument(
+            "--urlconf",
+            dest="urlconf",
+            default=None,
+            help="Python dotted path to a URLconf module. Defaults to ROOT_URLCONF.",
+        )
+        parser.add_argument(
+            "--api-version",
+            dest="api_version",
+            default=None,
+            help="Include only the operations of this API version.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        generator = SchemaGenerator(
+            urlconf=options["urlconf"], api_version=options["api_version"]
+        )
+        entries = iter_error_catalog(generator, workers=options["workers"])
+        write = write_csv if options["format"] == "csv" else write_json
+        if options["file"]:
+            with open(options["file"], "w", newline="", encoding="utf-8") as f:
+                write(entries, f)
+        else:
+            # entries are written as they are computed, line endings included
+            self.stdout.ending = ""
+            write(entries, self.stdout)
+
+
+def write_json(entries: Iterable[CatalogEntry], f: IO) -> None:
+    """Write a JSON array with one entry per line as soon as it is computed"""
+    f.write("[")
+    separator = "\n"
+    for entry in entries:
+        f.write(separator + json.dumps(asdict(entry)))
+        f.flush()
+        separator = ",\n"
+    f.write("\n]\n")
+
+
+def write_csv(entries: Iterable[CatalogEntry], f: IO) -> None:
+    writer = csv.writer(f, lineterminator="\n")
+    writer.writerow(["operation", "status", "attr", "codes"])
+    for entry in entries:
+        codes = " ".join(entry.codes)
+        writer.writerow([entry.operation, entry.status, entry.attr or "", codes])
+        f.flush()
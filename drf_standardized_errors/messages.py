@@ -0,0 +1,105 @@
+"""
+A cache of the error messages of serializer fields rendered in each language.
+
+DRF renders the error message of a field when validation fails: the lazy
+translation is evaluated in the active language then formatted with the
+message params. The rendered messages are cached by (language, message,
+params), so the same few messages are not translated and formatted again
+for every error.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from django.utils import translation
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+CACHE_SIZE = 1024
+
+
+class MessageKey:
+    """
+    Compare messages by identity. Hashing a lazy translation evaluates it and
+    error messages are defined once on field classes anyway.
+    """
+
+    __slots__ = ("message",)
+
+    def __init__(self, message: Any):
+        self.message = message
+
+    def __hash__(self) -> int:
+        return id(self.message)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, MessageKey) and other.message is self.message
+
+
+def get_error_message(message: Any, **params: Any) -> str:
+    """
+    Same as `message.format(**params)` but cached per active language. Messages
+    with the invalid input as param are not cached since the input comes from
+    the request.
+    """
+    if "input" in params:
+        return message.format(**params)
+    # values that are equal but rendered differently (like 10, 10.0 and
+    # Decimal("10")) are told apart by their type
+    key = tuple(sorted((name, type(value), value) for name, value in params.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return message.format(**params)
+    return _get_error_message(translation.get_language(), MessageKey(message), key)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _get_error_message(
+    language: Optional[str], key: MessageKey, params: Tuple[Tuple[str, type, Any], ...]
+) -> str:
+    return key.message.format(**{name: value for name, _, value in params})
+
+
+class CachedErrorMessagesMixin:
+    """
+    Serializer field mixin that uses the cache of rendered error messages
+    when validation fails.
+    """
+
+    error_messages: Dict[str, Any]
+
+    def fail(self, key: str, **kwargs: Any) -> None:
+        if key not in self.error_messages:
+            # let DRF raise the missing error message assertion
+            return super().fail(key, **kwargs)  # type: ignore[misc]
+        message = get_error_message(self.error_messages[key], **kwargs)
+        raise ValidationError(message, code=key)
+
+
+def warm_up_error_messages() -> None:
+    """
+    Render the error messages of DRF fields that do not have params in the
+    active language
+    """
+    for message in get_default_error_messages():
+        if "{" not in message:
+            get_error_message(message)
+
+
+def get_default_error_messages() -> List[Any]:
+    messages = []
+    seen: Set[int] = set()
+    for field_class in [serializers.Field, *iter_subclasses(serializers.Field)]:
+        for message in vars(field_class).get("default_error_messages", {}).values():
+            if id(message) not in seen:
+                seen.add(id(message))
+                messages.append(message)
+    return messages
+
+
+def iter_subclasses(cls: type) -> Iterator[type]:
+    subclass: type
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from iter_subclasses(subclass)
@@ -0,0 +1,49 @@
+from typing import Callable, Optional
+
+from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+
+from .handler import ExceptionHandler
+from .settings import package_settings
+from .types import ExceptionHandlerContext
+
+
+class StandardizedErrorsMiddleware:
+    """
+    Return standardized error responses for exceptions raised by non-DRF views.
+    The response is a JSON response built without going through DRF request
+    wrapping and content negotiation. DRF views are not affected since they
+    handle their exceptions with the exception handler.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        return self.get_response(request)
+
+    def process_exception(
+        self, request: HttpRequest, exception: Exception
+    ) -> Optional[HttpResponseBase]:
+        return get_error_response(exception, request)
+
+
+def get_error_response(
+    exc: Exception, request: HttpRequest, report: bool = True
+) -> Optional[HttpResponseBase]:
+    """
+    Run the configured exception handler class for an exception raised outside
+    DRF views. Returns None when the exception should not be handled.
+    """
+    exception_handler_class = package_settings.EXCEPTION_HANDLER_CLASS
+    msg = "`EXCEPTION_HANDLER_CLASS` should be a subclass of ExceptionHandler."
+    assert issubclass(exception_handler_class, ExceptionHandler), msg
+    context: ExceptionHandlerContext = {
+        "view": None,
+        "args": (),
+        "kwargs": {},
+        "request": request,
+    }
+    handler = exception_handler_class(exc, context)
+    handler.report_exceptions = report
+    return handler.run()
@@ -1,6 +1,8 @@
+import copy
 import inspect
 from collections import defaultdict
-from typing import Dict, List, Set, Type, Union
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Type, Union
 
 from drf_spectacular.drainage import warn
 from drf_spectacular.extensions import OpenApiFilterExtension
@@ -25,6 +27,7 @@ from rest_framework.versioning import (
     QueryParameterVersioning,
     URLPathVersioning,
 )
+from rest_framework.views import APIView
 
 from .handler import exception_handler as standardized_errors_handler
 from .openapi_serializers import (
@@ -43,12 +46,13 @@ from .openapi_serializers import (
 from .openapi_utils import (
     InputDataField,
     get_django_filter_backends,
-    get_error_examples,
-    get_filter_forms,
+    get_error_examples_by_status_code,
+    get_filter_fields_with_error_codes,
+    get_filterset_cache_key,
     get_flat_serializer_fields,
-    get_form_fields_with_error_codes,
     get_serializer_fields_with_error_codes,
     get_validation_error_serializer,
+    get_view_class_cached,
 )
 from .openapi_validation_errors import get_validation_errors
 from .settings import package_settings
@@ -78,7 +82,9 @@ class AutoSchema(BaseAutoSchema):
                         )
                         continue
                     error_responses[status_code] = self._get_response_for_code(
-                        serializer, status_code
+                        serializer,
+                        status_code,
+                        media_types=self._get_error_media_types(),
                     )
 
             return {**error_responses, **responses}
@@ -86,6 +92,13 @@ class AutoSchema(BaseAutoSchema):
             # for callbacks (direction=request), we should not add the error responses
             return responses
 
+    def _get_error_media_types(self) -> List[str]:
+        """Error responses can be rendered by the `ERROR_RENDERER_CLASSES` as well"""
+        media_types = self.map_renderers("media_type")
+        for renderer_class in package_settings.ERROR_RENDERER_CLASSES:
+            media_types.append(renderer_class.media_type.split(";")[0])
+        return list(dict.fromkeys(media_types))
+
     def _get_allowed_error_status_codes(self) -> List[str]:
         allowed_status_codes = package_settings.ALLOWED_ERROR_STATUS_CODES or []
         return [str(status_code) for status_code in allowed_status_codes]
@@ -127,15 +140,7 @@ class AutoSchema(BaseAutoSchema):
             return True
 
     def _should_add_parse_error_response(self) -> bool:
-        parsers = self.view.get_parsers()
-        parsers_that_raise_parse_errors = (
-            JSONParser,
-            MultiPartParser,
-            FileUploadParser,
-        )
-        return any(
-            isinstance(parser, parsers_that_raise_parse_errors) for parser in parsers
-        )
+        return self._get_view_error_responses().parse_error
 
     def _should_add_validation_error_response(self) -> bool:
         """
@@ -152,17 +157,23 @@ class AutoSchema(BaseAutoSchema):
             )
 
         filter_backends = get_django_filter_backends(self.get_filter_backends())
-        filter_extensions = [
-            OpenApiFilterExtension.get_match(backend) for backend in filter_backends
-        ]
         has_filters = any(
-            filter_extension.get_schema_operation_parameters(self)
-            for filter_extension in filter_extensions
-            if filter_extension
+            self._has_filter_parameters(backend) for backend in filter_backends
         )
         has_extra_validation_errors = bool(self._get_extra_validation_errors())
         return has_request_body or has_filters or has_extra_validation_errors
 
+    def _has_filter_parameters(self, filter_backend: Any) -> bool:
+        def has_filter_parameters() -> bool:
+            filter_extension = OpenApiFilterExtension.get_match(filter_backend)
+            return bool(
+                filter_extension
+                and filter_extension.get_schema_operation_parameters(self)
+            )
+
+        key = ("has_filters", *get_filterset_cache_key(self.view, filter_backend))
+        return get_view_class_cached(self.view, key, has_filter_parameters)
+
     def _should_add_http401_error_response(self) -> bool:
         # empty dicts are appended to auth methods if AllowAny or
         # IsAuthenticatedOrReadOnly are in permission classes, so
@@ -171,32 +182,15 @@ class AutoSchema(BaseAutoSchema):
         return bool(auth_methods)
 
     def _should_add_http403_error_response(self) -> bool:
-        permissions = self.view.get_permissions()
-        is_allow_any = len(permissions) == 1 and type(permissions[0]) == AllowAny
-        # if the only permission class is IsAuthenticated and there are auth classes
-        # in the view, then the error raised is a 401 not a 403 (check implementation
-        # of rest_framework.views.APIView.permission_denied)
-        is_authenticated = (
-            len(permissions) == 1
-            and type(permissions[0]) == IsAuthenticated
-            and self.view.get_authenticators()
-        )
-        return bool(permissions) and not is_allow_any and not is_authenticated
+        return self._get_view_error_responses().http403
 
     def _should_add_http404_error_response(self) -> bool:
         paginator = self._get_paginator()
         paginator_can_raise_404 = isinstance(
             paginator, (PageNumberPagination, CursorPagination)
         )
-        versioning_scheme_can_raise_404 = self.view.versioning_class and issubclass(
-            self.view.versioning_class,
-            (
-                URLPathVersioning,
-                NamespaceVersioning,
-                HostNameVersioning,
-                QueryParameterVersioning,
-            ),
-        )
+        view_error_responses = self._get_view_error_responses()
+        versioning_scheme_can_raise_404 = view_error_responses.versioning_http404
         has_path_parameters = bool(
             [
                 parameter
@@ -206,10 +200,9 @@ class AutoSchema(BaseAutoSchema):
         )
         # the default content negotiator can raise a 404 when no renderer can handle
         # the format parameter in the URL
-        content_negotiator = self.view.get_content_negotiator()
         view_can_have_no_renderers = (
             self.view.format_kwarg or drf_settings.URL_FORMAT_OVERRIDE
-        ) and isinstance(content_negotiator, DefaultContentNegotiation)
+        ) and view_error_responses.default_content_negotiation
         return (
             paginator_can_raise_404
             or versioning_scheme_can_raise_404
@@ -222,34 +215,128 @@ class AutoSchema(BaseAutoSchema):
         return True
 
     def _should_add_http406_error_response(self) -> bool:
-        content_negotiator = self.view.get_content_negotiator()
-        return isinstance(content_negotiator, DefaultContentNegotiation) or (
-            self.view.versioning_class
-            and issubclass(self.view.versioning_class, AcceptHeaderVersioning)
-        )
+        return self._get_view_error_responses().http406
 
     def _should_add_http415_error_response(self) -> bool:
-        """
-        This is raised whenever the default content negotiator is unable to
-        determine a parser. So, if the view does not have a parser that
-        handles everything (media type "*/*"), then this error can be raised.
-        """
-        content_negotiator = self.view.get_content_negotiator()
-        parsers_that_handle_everything = [
-            parser for parser in self.view.get_parsers() if parser.media_type == "*/*"
-        ]
-        return (
-            isinstance(content_negotiator, DefaultContentNegotiation)
-            and not parsers_that_handle_everything
-        )
+        return self._get_view_error_responses().http415
 
     def _should_add_http429_error_response(self) -> bool:
-        return bool(self.view.get_throttles())
+        return self._get_view_error_responses().http429
 
     def _should_add_http500_error_response(self) -> bool:
         # bugs are inevitable
         return True
 
+    def _get_view_error_responses(self) -> "ViewErrorResponses":
+        """
+        The error responses that depend only on the view configuration are
+        determined once and reused for all methods and actions of the view.
+        """
+        key = self._get_view_configuration_key()
+        if key is None:
+            return self._build_view_error_responses()
+        return get_view_class_cached(self.view, key, self._build_view_error_responses)
+
+    def _get_view_configuration_key(self) -> Optional[tuple]:
+        """
+        Views created with ``as_view(**initkwargs)`` share the same class, so the
+        configuration is read from the view instance. No key is returned when
+        the view overrides any of the getters since they might depend on the
+        method or action.
+        """
+        view = self.view
+        getters = (
+            "get_authenticators",
+            "get_permissions",
+            "get_parsers",
+            "get_throttles",
+            "get_content_negotiator",
+        )
+        if any(getattr(type(view), g) is not getattr(APIView, g) for g in getters):
+            return None
+
+        key = (
+            "view_error_responses",
+            type(self),
+            tuple(view.authentication_classes),
+            tuple(view.permission_classes),
+            tuple(view.parser_classes),
+            view.content_negotiation_class,
+            tuple(view.throttle_classes),
+            view.versioning_class,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            # e.g. composed permissions on some DRF versions
+            return None
+        return key
+
+    def _build_view_error_responses(self) -> "ViewErrorResponses":
+        view = self.view
+        parsers = view.get_parsers()
+        permissions = view.get_permissions()
+        content_negotiator = view.get_content_negotiator()
+        is_default_content_negotiation = isinstance(
+            content_negotiator, DefaultContentNegotiation
+        )
+
+        parsers_that_raise_parse_errors = (
+            JSONParser,
+            MultiPartParser,
+            FileUploadParser,
+        )
+        parse_error = any(
+            isinstance(parser, parsers_that_raise_parse_errors) for parser in parsers
+        )
+
+        is_allow_any = len(permissions) == 1 and type(permissions[0]) == AllowAny
+        # if the only permission class is IsAuthenticated and there are auth classes
+        # in the view, then the error raised is a 401 not a 403 (check implementation
+        # of rest_framework.views.APIView.permission_denied)
+        is_authenticated = (
+            len(permissions) == 1
+            and type(permissions[0]) == IsAuthenticated
+            and view.get_authenticators()
+        )
+        http403 = bool(permissions) and not is_allow_any and not is_authenticated
+
+        versioning_http404 = bool(
+            view.versioning_class
+            and issubclass(
+                view.versioning_class,
+                (
+                    URLPathVersioning,
+                    NamespaceVersioning,
+                    HostNameVersioning,
+                    QueryParameterVersioning,
+                ),
+            )
+        )
+
+        http406 = is_default_content_negotiation or bool(
+            view.versioning_class
+            and issubclass(view.versioning_class, AcceptHeaderVersioning)
+        )
+
+        # 415 is raised whenever the default content negotiator is unable to
+        # determine a parser. So, if the view does not have a parser that
+        # handles everything (media type "*/*"), then this error can be raised.
+        parsers_that_handle_everything = [
+            parser for parser in parsers if parser.media_type == "*/*"
+        ]
+        http415 = is_default_content_negotiation and not parsers_that_handle_everything
+
+        return ViewErrorResponses(
+            parse_error=parse_error,
+            http403=http403,
+            versioning_http404=versioning_http404,
+            default_content_negotiation=is_default_content_negotiation,
+            http406=http406,
+            http415=http415,
+            http429=bool(view.get_throttles()),
+        )
+
     def _get_error_response_serializer(self, status_code: str) -> S:
         error_schemas = package_settings.ERROR_SCHEMAS or {}
         error_schemas = {
@@ -281,13 +368,13 @@ class AutoSchema(BaseAutoSchema):
         operation_id = self.get_operation_id()
         component_name = f"{camelize(operation_id)}ErrorResponse400"
 
-        http400_serializers = {}
-        if self._should_add_validation_error_response():
-            serializer = self._get_serializer_for_validation_error_response()
-            http400_serializers[ValidationErrorEnum.VALIDATION_ERROR.value] = serializer  # type: ignore[attr-defined]
-        if self._should_add_parse_error_response():
-            serializer = ParseErrorResponseSerializer
-            http400_serializers[ClientErrorEnum.CLIENT_ERROR.value] = serializer  # type: ignore[attr-defined]
+        http400_serializers: Dict[str, S] = {}
+        for error_type in self._get_http400_error_types():
+            if error_type == ValidationErrorEnum.VALIDATION_ERROR.value:  # type: ignore[attr-defined]
+                serializer = self._get_serializer_for_validation_error_response()
+            else:
+                serializer = ParseErrorResponseSerializer
+            http400_serializers[error_type] = serializer
 
         return PolymorphicProxySerializer(
             component_name=component_name,
@@ -295,15 +382,27 @@ class AutoSchema(BaseAutoSchema):
             resource_type_field_name="type",
         )
 
-    def _get_serializer_for_validation_error_response(self) -> S:
-        fields_with_error_codes = self._determine_fields_with_error_codes()
-        error_codes_by_field = self._get_validation_error_codes_by_field(
-            fields_with_error_codes
-        )
+    def _get_http400_error_types(self) -> List[str]:
+        """
+        The 400 response is a validation error and/or a parse error (with the
+        client_error type) depending on the operation.
+        """
+        error_types = []
+        if self._should_add_validation_error_response():
+            error_types.append(ValidationErrorEnum.VALIDATION_ERROR.value)  # type: ignore[attr-defined]
+        if self._should_add_parse_error_response():
+            error_types.append(ClientErrorEnum.CLIENT_ERROR.value)  # type: ignore[attr-defined]
+        return error_types
 
+    def _get_serializer_for_validation_error_response(self) -> S:
+        error_codes_by_field = self._get_validation_error_codes()
         operation_id = self.get_operation_id()
         return get_validation_error_serializer(operation_id, error_codes_by_field)
 
+    def _get_validation_error_codes(self) -> Dict[str, Set[str]]:
+        fields_with_error_codes = self._determine_fields_with_error_codes()
+        return self._get_validation_error_codes_by_field(fields_with_error_codes)
+
     def _determine_fields_with_error_codes(self) -> "List[InputDataField]":
         if self.method in ("PUT", "PATCH", "POST"):
             serializer = self.get_request_serializer()
@@ -311,12 +410,7 @@ class AutoSchema(BaseAutoSchema):
             return get_serializer_fields_with_error_codes(fields)
         else:
             filter_backends = get_django_filter_backends(self.get_filter_backends())
-            filter_forms = get_filter_forms(self.view, filter_backends)
-            fields_with_error_codes = []
-            for form in filter_forms:
-                fields = get_form_fields_with_error_codes(form)
-                fields_with_error_codes.extend(fields)
-            return fields_with_error_codes
+            return get_filter_fields_with_error_codes(self.view, filter_backends)
 
     def _get_validation_error_codes_by_field(
         self, data_fields: "List[InputDataField]"
@@ -364,10 +458,40 @@ class AutoSchema(BaseAutoSchema):
         )
 
     def _get_error_response_examples(self) -> List[OpenApiExample]:
-        status_codes = set(self._get_allowed_error_status_codes())
-        examples = get_error_examples()
+        status_codes = self._get_allowed_error_status_codes()
+        examples_by_status_code = get_error_examples_by_status_code()
         return [
             example
+            for status_code, examples in examples_by_status_code.items()
+            if status_code in status_codes
             for example in examples
-            if status_codes.intersection(example.status_codes)
         ]
+
+
+@dataclass(frozen=True)
+class ViewErrorResponses:
+    """Error responses that can be determined from the view configuration alone"""
+
+    parse_error: bool
+    http403: bool
+    versioning_http404: bool
+    default_content_negotiation: bool
+    http406: bool
+    http415: bool
+    http429: bool
+
+
+def get_operation_schema(
+    view: APIView, path: str, method: str, path_regex: str = ""
+) -> AutoSchema:
+    """
+    Return the schema of the view set up for one operation like the schema
+    generator does. It is a copy since the schema can be shared between the
+    instances of the view class.
+    """
+    schema = copy.copy(view.schema)
+    schema.view = view
+    schema.path = path
+    schema.path_regex = path_regex
+    schema.method = method.upper()
+    return schema
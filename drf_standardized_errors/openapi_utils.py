@@ -1,5 +1,18 @@
 from dataclasses import dataclass, field as dataclass_field
-from typing import Any, Dict, List, Optional, Set, Type, Union
+from functools import lru_cache, partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Type,
+    Union,
+)
+from weakref import WeakKeyDictionary
 
 import django
 import rest_framework
@@ -12,12 +25,12 @@ from django.core.validators import (
     validate_ipv6_address,
     validate_ipv46_address,
 )
+from django.utils.translation import get_language
 from drf_spectacular.plumbing import (
     force_instance,
     get_view_model,
     is_basic_serializer,
     is_list_serializer,
-    is_serializer,
 )
 from drf_spectacular.utils import OpenApiExample, PolymorphicProxySerializer
 from inflection import camelize
@@ -31,6 +44,8 @@ from rest_framework.validators import (
 )
 from rest_framework.views import APIView
 
+from .attr_paths import AttrNode, build_attr_tree, join_attr
+from .bulk import BulkUniqueValidator
 from .openapi_serializers import ValidationErrorEnum
 from .settings import package_settings
 
@@ -45,49 +60,42 @@ def get_flat_serializer_fields(
     at least one field representing "non field errors" and accounts properly
     for composite fields by returning 2 fields: one for the errors linked to
     the parent field and another one for errors linked to the child field.
+    The fields are listed from the attr tree of the serializer, so their names
+    are the attr templates of their errors.
     """
     if not field or getattr(field, "read_only", False):
         return []
 
+    if isinstance(field, (list, tuple)):
+        return [f for item in field for f in get_flat_serializer_fields(item, prefix)]
+
     field = force_instance(field)
-    if is_list_serializer(field):
-        prefix = get_prefix(prefix, field.field_name)
-        non_field_errors_name = get_prefix(prefix, drf_settings.NON_FIELD_ERRORS_KEY)
-        f = InputDataField(non_field_errors_name, field)
-        prefix = get_prefix(prefix, package_settings.LIST_INDEX_IN_API_SCHEMA)
-        return [f] + get_flat_serializer_fields(field.child, prefix)
-    elif isinstance(field, PolymorphicProxySerializer):
-        if isinstance(field.serializers, dict):
-            return get_flat_serializer_fields(list(field.serializers.values()), prefix)
-        else:
-            return get_flat_serializer_fields(field.serializers, prefix)
-    elif is_serializer(field):
-        prefix = get_prefix(prefix, field.field_name)
-        non_field_errors_name = get_prefix(prefix, drf_settings.NON_FIELD_ERRORS_KEY)
-        f = InputDataField(non_field_errors_name, field)
-        return [f] + get_flat_serializer_fields(list(field.fields.values()), prefix)
-    elif isinstance(field, (list, tuple)):
-        first, *remaining = field
-        return get_flat_serializer_fields(first, prefix) + get_flat_serializer_fields(
-            remaining, prefix
-        )
-    elif hasattr(field, "child"):
-        # composite field (List or Dict fields)
-        prefix = get_prefix(prefix, field.field_name)
-        f = InputDataField(prefix, field)
-        if isinstance(field, serializers.ListField):
-            child_prefix = get_prefix(prefix, package_settings.LIST_INDEX_IN_API_SCHEMA)
-        else:
-            child_prefix = get_prefix(prefix, package_settings.DICT_KEY_IN_API_SCHEMA)
-        return [f] + get_flat_serializer_fields(field.child, child_prefix)
+    template = get_prefix(prefix, field.field_name) or None
+    tree = build_attr_tree(field, template, template)
+    return list(iter_input_data_fields(tree))
+
+
+def iter_input_data_fields(node: AttrNode) -> "Iterator[InputDataField]":
+    for variant in node.variants:
+        yield from iter_input_data_fields(variant)
+    if node.variants or getattr(node.field, "read_only", False):
+        return
+
+    if node.children or node.item:
+        if not isinstance(node.field, serializers.BaseSerializer):
+            # composite fields (like list or dict fields) have errors of their own
+            yield InputDataField(node.template or "", node.field)
+        for child in node.children.values():
+            yield from iter_input_data_fields(child)
+        if node.item:
+            yield from iter_input_data_fields(node.item)
     else:
-        name = get_prefix(prefix, field.field_name)
-        return [InputDataField(name, field)]
+        yield InputDataField(node.template or "", node.field)
 
 
 def get_prefix(prefix: Optional[str], name: str) -> str:
     if prefix and name:
-        return f"{prefix}{package_settings.NESTED_FIELD_SEPARATOR}{name}"
+        return join_attr(prefix, name)
     elif prefix:
         return prefix
     else:
@@ -124,6 +132,16 @@ def get_serializer_fields_with_error_codes(
         sfields_with_unique_for_validators, fields_with_error_codes
     )
 
+    sfields_with_bulk_unique_validators = [
+        sfield
+        for sfield in fields_with_error_codes
+        if is_list_serializer(sfield.field)
+        and has_validator(sfield.field, BulkUniqueValidator)
+    ]
+    add_bulk_unique_error_codes(
+        sfields_with_bulk_unique_validators, fields_with_error_codes
+    )
+
     return fields_with_error_codes
 
 
@@ -271,6 +289,31 @@ def add_unique_for_error_codes(
             add_error_code(sfield.name, v.field, "unique", sfields_with_error_codes)
 
 
+def add_bulk_unique_error_codes(
+    sfields_with_bulk_unique_validators: "List[InputDataField]",
+    sfields_with_error_codes: "List[InputDataField]",
+) -> None:
+    for sfield in sfields_with_bulk_unique_validators:
+        # the errors are raised for each item of the list, so the error code
+        # is added to the fields of the list child
+        parts = sfield.name.split(package_settings.NESTED_FIELD_SEPARATOR)
+        parts[-1] = package_settings.LIST_INDEX_IN_API_SCHEMA
+        parts.append(drf_settings.NON_FIELD_ERRORS_KEY)
+        item_attr = package_settings.NESTED_FIELD_SEPARATOR.join(parts)
+
+        bulk_unique_validators = [
+            validator
+            for validator in sfield.field.validators
+            if isinstance(validator, BulkUniqueValidator)
+        ]
+        for v in bulk_unique_validators:
+            if len(v.fields) == 1:
+                field_name = v.fields[0]
+            else:
+                field_name = drf_settings.NON_FIELD_ERRORS_KEY
+            add_error_code(item_attr, field_name, v.code, sfields_with_error_codes)
+
+
 def add_error_code(
     attr: str, field_name: str, error_code: str, sfields: "List[InputDataField]"
 ) -> None:
@@ -291,19 +334,85 @@ def add_error_code(
 
 
 def get_filter_forms(view: APIView, filter_backends: list) -> List[forms.Form]:
+    """
+    The filterset form of each backend only depends on the view configuration,
+    so it is built once and reused for all operations of the view.
+    """
     filter_forms = []
     for backend in filter_backends:
-        model = get_view_model(view)
-        if not model:
-            continue
-        filterset = backend.get_filterset(
-            view.request, model._default_manager.none(), view
-        )
-        if filterset:
-            filter_forms.append(filterset.form)
+        key = ("filter_form", *get_filterset_cache_key(view, backend))
+        form = get_view_class_cached(view, key, partial(get_filter_form, view, backend))
+        if form is not None:
+            filter_forms.append(form)
     return filter_forms
 
 
+def get_filter_form(view: APIView, backend: Any) -> Optional[forms.Form]:
+    model = get_view_model(view)
+    if not model:
+        return None
+    filterset = backend.get_filterset(view.request, model._default_manager.none(), view)
+    return filterset.form if filterset else None
+
+
+def get_filter_fields_with_error_codes(
+    view: APIView, filter_backends: list
+) -> "List[InputDataField]":
+    fields_with_error_codes = []
+    for backend in filter_backends:
+        key = ("filter_fields", *get_filterset_cache_key(view, backend))
+        fields = get_view_class_cached(
+            view, key, partial(get_filter_form_fields_with_error_codes, view, backend)
+        )
+        fields_with_error_codes.extend(fields)
+    return fields_with_error_codes
+
+
+def get_filter_form_fields_with_error_codes(
+    view: APIView, backend: Any
+) -> "List[InputDataField]":
+    return [
+        field
+        for form in get_filter_forms(view, [backend])
+        for field in get_form_fields_with_error_codes(form)
+    ]
+
+
+def get_filterset_cache_key(view: APIView, backend: Any) -> tuple:
+    """
+    Views created with ``as_view(**initkwargs)`` share the same class, so the
+    attributes that determine the filterset are part of the key.
+    """
+    filterset_fields = getattr(view, "filterset_fields", None)
+    if isinstance(filterset_fields, dict):
+        filterset_fields = tuple(
+            (name, tuple(lookups)) for name, lookups in filterset_fields.items()
+        )
+    elif filterset_fields:
+        filterset_fields = tuple(filterset_fields)
+    queryset = getattr(view, "queryset", None)
+    return (
+        type(backend),
+        getattr(view, "filterset_class", None),
+        filterset_fields,
+        getattr(queryset, "model", None),
+    )
+
+
+_view_class_cache: "WeakKeyDictionary[type, Dict[Hashable, Any]]" = WeakKeyDictionary()
+
+
+def get_view_class_cached(view: APIView, key: Hashable, func: Callable[[], Any]) -> Any:
+    """
+    Return the value cached for the view class under ``key``, calling ``func``
+    to compute it on a cache miss. Entries go away with the view class.
+    """
+    cache = _view_class_cache.setdefault(type(view), {})
+    if key not in cache:
+        cache[key] = func()
+    return cache[key]
+
+
 def get_form_fields_with_error_codes(form: forms.Form) -> "List[InputDataField]":
     data_fields = []
     for field_name, field in form.fields.items():
@@ -463,16 +572,23 @@ class InputDataField:
 def get_django_filter_backends(backends: list) -> list:
     """determine django filter backends that raise validation errors"""
     try:
-        from django_filters.rest_framework import DjangoFilterBackend
+        from django_filters.rest_framework import DjangoFilterBackend  # noqa: F401
     except ImportError:
         return []
 
+    return list(_get_django_filter_backends(tuple(backends)))
+
+
+@lru_cache(maxsize=None)
+def _get_django_filter_backends(backends: tuple) -> tuple:
+    from django_filters.rest_framework import DjangoFilterBackend
+
     filter_backends = [filter_backend() for filter_backend in backends]
-    return [
+    return tuple(
         backend
         for backend in filter_backends
         if isinstance(backend, DjangoFilterBackend) and backend.raise_exception
-    ]
+    )
 
 
 def get_error_examples() -> List[OpenApiExample]:
@@ -495,6 +611,26 @@ def get_error_examples() -> List[OpenApiExample]:
     return [get_example_from_exception(error) for error in errors]
 
 
+def get_error_examples_by_status_code() -> Dict[str, List[OpenApiExample]]:
+    """
+    The error examples are the same for all operations, so they are built once
+    per active language (the error details are translated) and grouped by
+    status code.
+    """
+    return _get_error_examples_by_status_code(get_language())
+
+
+@lru_cache(maxsize=None)
+def _get_error_examples_by_status_code(
+    language: Optional[str],
+) -> Dict[str, List[OpenApiExample]]:
+    examples_by_status_code: Dict[str, List[OpenApiExample]] = {}
+    for example in get_error_examples():
+        for status_code in example.status_codes or []:
+            examples_by_status_code.setdefault(str(status_code), []).append(example)
+    return examples_by_status_code
+
+
 def get_example_from_exception(exc: exceptions.APIException) -> OpenApiExample:
     if is_client_error(exc.status_code):
         type_ = "client_error"
@@ -1,16 +1,30 @@
-import copy
 import inspect
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Set, Type, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from drf_spectacular.drainage import error, warn
-from drf_spectacular.openapi import AutoSchema
 from rest_framework.views import APIView
 from rest_framework.viewsets import ViewSetMixin
 
 from .types import SetValidationErrorsKwargs
 
+if TYPE_CHECKING:
+    # the decorator is used in view modules, so importing the schema generation
+    # machinery of drf-spectacular is avoided when serving requests
+    from drf_spectacular.openapi import AutoSchema
+
 V = TypeVar("V", bound=Union[Type[APIView], Callable[..., Any]])
 
 
@@ -155,13 +169,11 @@ def set_validation_errors(
     methods: Optional[List[str]],
     versions: Optional[List[str]],
 ) -> None:
-    if hasattr(view, "_standardized_errors"):
-        if "_standardized_errors" not in vars(view):
-            # that means it is defined on a parent class, so we first create
-            # a copy of it to avoid the validation error showing for the parent
-            # class as well
-            view._standardized_errors = copy.deepcopy(view._standardized_errors)
-    else:
+    # only the errors added to this class are stored on it. Errors defined on
+    # parent classes are resolved through the MRO in `get_validation_errors`
+    # which avoids copying them to each subclass while keeping them out of
+    # the parent class.
+    if "_standardized_errors" not in vars(view):
         view._standardized_errors = defaultdict(list)
 
     errors = generate_standardized_errors(
@@ -196,7 +208,17 @@ def generate_standardized_errors(
 
 
 def get_validation_errors(view: APIView) -> "Dict[str, List[StandardizedError]]":
-    return getattr(view, "_standardized_errors", {})
+    """
+    Collect the errors added to the view class and its parents. Errors of parent
+    classes come first so that errors defined in child views are encountered
+    first when traversing the list of errors of a field in reverse order.
+    """
+    validation_errors = defaultdict(list)
+    for klass in reversed(type(view).__mro__):
+        class_errors = vars(klass).get("_standardized_errors", {})
+        for field_name, errors in class_errors.items():
+            validation_errors[field_name].extend(errors)
+    return validation_errors
 
 
 @dataclass
@@ -207,7 +229,7 @@ class StandardizedError:
     method: Optional[str] = None
     version: Optional[str] = None
 
-    def is_in_scope(self, schema: AutoSchema) -> bool:
+    def is_in_scope(self, schema: "AutoSchema") -> bool:
         """Determine if the error is in scope of the current operation"""
         view = schema.view
         api_version, _ = view.determine_version(view.request, **view.kwargs)
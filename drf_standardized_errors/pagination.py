@@ -0,0 +1,128 @@
+"""
+Paginated error responses for very large validation errors. The error
+response contains the first page of errors and a continuation token when
+there are more. The remaining errors are stored in the django cache and
+served page by page by ``ErrorPageView``.
+"""
+
+import logging
+import secrets
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.core.cache import caches
+from rest_framework import exceptions
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .formatter import ExceptionFormatter
+from .settings import package_settings
+from .types import Error, ErrorResponse
+
+CACHE_KEY_PREFIX = "drf_standardized_errors:errors:"
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidToken(exceptions.NotFound):
+    default_detail = "The errors have expired or the token is invalid."
+    default_code = "invalid_token"
+
+
+class PaginatedExceptionFormatter(ExceptionFormatter):
+    def format_error_response(self, error_response: ErrorResponse) -> Any:
+        page_size = package_settings.ERRORS_PAGE_SIZE
+        errors = error_response.errors
+        next_token = None
+        if len(errors) > page_size:
+            try:
+                key = store_errors(error_response.type, errors[page_size:])
+            except Exception:
+                # failing to store the remaining errors should not prevent
+                # returning the error response, so all errors are returned
+                logger.warning(
+                    "drf-standardized-errors: unable to store the errors pages.",
+                    exc_info=True,
+                )
+                page_size = len(errors)
+            else:
+                next_token = get_token(key, 0)
+        return {
+            "type": error_response.type,
+            "errors": [asdict(error) for error in errors[:page_size]],
+            "next": next_token,
+        }
+
+
+def store_errors(error_type: str, errors: List[Error]) -> str:
+    """
+    Store the errors with their codes and details coded as indices of tables
+    of unique values. The errors of bulk endpoints mostly repeat the same ones.
+    """
+    codes: Dict[str, int] = {}
+    details: Dict[str, int] = {}
+    rows = [
+        (
+            codes.setdefault(error.code, len(codes)),
+            details.setdefault(error.detail, len(details)),
+            error.attr,
+        )
+        for error in errors
+    ]
+    key = secrets.token_urlsafe(16)
+    value = (error_type, list(codes), list(details), rows)
+    get_cache().set(
+        CACHE_KEY_PREFIX + key, value, package_settings.ERRORS_PAGES_TIMEOUT
+    )
+    return key
+
+
+def get_errors_page(token: str) -> Dict[str, Any]:
+    """Return the page of errors for the continuation token"""
+    key, offset = parse_token(token)
+    value = get_cache().get(CACHE_KEY_PREFIX + key)
+    if value is None:
+        raise InvalidToken()
+
+    error_type, codes, details, rows = value
+    page_size = package_settings.ERRORS_PAGE_SIZE
+    end = offset + page_size
+    return {
+        "type": error_type,
+        "errors": [
+            {"code": codes[code], "detail": details[detail], "attr": attr}
+            for code, detail, attr in rows[offset:end]
+        ],
+        "next": get_token(key, end) if end < len(rows) else None,
+    }
+
+
+def get_token(key: str, offset: int) -> str:
+    return f"{key}.{offset}"
+
+
+def parse_token(token: str) -> Tuple[str, int]:
+    key, _, offset = token.partition(".")
+    if not offset.isdigit():
+        raise InvalidToken()
+    return key, int(offset)
+
+
+def get_cache() -> Any:
+    return caches[package_settings.ERRORS_PAGES_CACHE]
+
+
+class ErrorPageView(APIView):
+    """
+    Return the page of errors for the continuation token passed in the
+    "token" query parameter
+    """
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        token: Optional[str] = request.query_params.get("token")
+        if not token:
+            raise exceptions.ValidationError(
+                {"token": ["This field is required."]}, code="required"
+            )
+        return Response(get_errors_page(token))
@@ -0,0 +1,78 @@
+"""
+Binary renderers of error responses for service-to-service calls, meant to be
+added to the ``ERROR_RENDERER_CLASSES`` setting so that they are only used for
+error responses. The error response is encoded as a map with the same keys and
+values as with JSON (strings, integers, arrays and nil), so the error schemas
+generated for the API describe these responses as well. Values that are not
+JSON types (like lazy translations) are converted the same way DRF does for
+JSON. For bulk validation errors, pairing them with the
+``CompactExceptionFormatter`` avoids encoding the same strings for each error.
+
+They require ``msgpack`` and ``cbor2`` respectively.
+"""
+
+from typing import Any, Mapping, Optional
+
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+def encode_default(obj: Any) -> Any:
+    """
+    Convert what msgpack and cbor2 cannot encode (lazy translations, dates,
+    decimals, ...) the same way DRF does for JSON
+    """
+    return JSONEncoder().default(obj)
+
+
+class MessagePackRenderer(BaseRenderer):
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[Mapping[str, Any]] = None,
+    ) -> bytes:
+        try:
+            import msgpack
+        except ImportError:
+            raise ImproperlyConfigured(
+                "msgpack must be installed to use the MessagePackRenderer."
+            )
+
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=encode_default)
+
+
+class CBORRenderer(BaseRenderer):
+    media_type = "application/cbor"
+    format = "cbor"
+    charset = None
+    render_style = "binary"
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[Mapping[str, Any]] = None,
+    ) -> bytes:
+        try:
+            import cbor2
+        except ImportError:
+            raise ImproperlyConfigured(
+                "cbor2 must be installed to use the CBORRenderer."
+            )
+
+        if data is None:
+            return b""
+        return cbor2.dumps(data, default=encode_cbor_default)
+
+
+def encode_cbor_default(encoder: Any, obj: Any) -> None:
+    encoder.encode(encode_default(obj))
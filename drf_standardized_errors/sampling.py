@@ -0,0 +1,228 @@
+"""
+Detect validation error codes returned by the API that are missing from the
+API schema. A fraction of validation errors (set by the
+UNDOCUMENTED_ERRORS_SAMPLE_RATE setting) is checked against the error codes
+that the schema generation determines for the operation. The request thread
+only queues the error codes and attr templates of the sampled error. A
+background thread determines the error codes of the operation (once per view
+function, route, method, action and version) then counts and logs the
+mismatches.
+
+This module depends on drf-spectacular and is only imported when sampling
+is enabled.
+"""
+
+import logging
+import queue
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, FrozenSet, NamedTuple, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from drf_spectacular.drainage import GENERATOR_STATS
+from drf_spectacular.generators import EndpointEnumerator, SchemaGenerator
+from drf_spectacular.settings import spectacular_settings
+from rest_framework import exceptions
+from rest_framework.views import APIView
+
+from .attr_paths import get_attr_template, get_view_attr_tree
+from .formatter import iter_error_details, split_attr
+from .openapi import AutoSchema, get_operation_schema
+
+logger = logging.getLogger(__name__)
+
+# the number of distinct undocumented errors that are counted. Attr templates
+# are not bounded when errors are raised under arbitrary keys.
+MAX_COUNTED_ERRORS = 1000
+# the number of sampled errors waiting for the background thread. Computing
+# the error codes of an operation is slow the first time, so sampled errors
+# are dropped rather than piling up when they come faster.
+MAX_QUEUED_ERRORS = 1000
+
+# (operation, attr template, error code)
+UndocumentedError = Tuple[str, Optional[str], str]
+# (attr template, error code)
+ErrorCode = Tuple[Optional[str], str]
+
+
+class SampledError(NamedTuple):
+    view_class: type
+    # the view function resolved for the request
+    callback: Callable
+    method: str
+    action: Optional[str]
+    version: Optional[str]
+    route: str
+    error_codes: FrozenSet[ErrorCode]
+
+
+_documented_error_codes: (
+    "WeakKeyDictionary[Callable, Dict[tuple, Optional[FrozenSet[ErrorCode]]]]"
+) = WeakKeyDictionary()
+_counts: "Counter[UndocumentedError]" = Counter()
+_reports: "queue.Queue[SampledError]" = queue.Queue(maxsize=MAX_QUEUED_ERRORS)
+_dropped_reports = 0
+_lock = threading.Lock()
+_worker: Optional[threading.Thread] = None
+
+
+def check_error_codes(
+    exc: exceptions.ValidationError, view: APIView, request: Any
+) -> None:
+    try:
+        resolver_match = getattr(request, "resolver_match", None)
+        if resolver_match is None or not isinstance(
+            getattr(view, "schema", None), AutoSchema
+        ):
+            return
+
+        tree = get_view_attr_tree(view)
+        error_codes = frozenset(
+            (get_template(tree, attr), detail.code)
+            for detail, attr in iter_error_details(exc.detail, tree=tree)
+        )
+        report(
+            SampledError(
+                view_class=type(view),
+                callback=resolver_match.func,
+                method=request.method,
+                action=getattr(view, "action", None),
+                version=getattr(request, "version", None),
+                route=resolver_match.route,
+                error_codes=error_codes,
+            )
+        )
+    except Exception:
+        # checking the error codes should never prevent returning the response
+        logger.debug(
+            "drf-standardized-errors: unable to check error codes.", exc_info=True
+        )
+
+
+def get_template(tree: Any, attr: Optional[str]) -> Optional[str]:
+    if attr is None:
+        return None
+    template = get_attr_template(tree, attr) if tree else None
+    return template or split_attr(attr, tree)[0]
+
+
+def report(sampled_error: SampledError) -> None:
+    global _dropped_reports, _worker
+    try:
+        _reports.put_nowait(sampled_error)
+    except queue.Full:
+        with _lock:
+            _dropped_reports += 1
+    if _worker is None or not _worker.is_alive():
+        with _lock:
+            if _worker is None or not _worker.is_alive():
+                _worker = threading.Thread(target=process_reports, daemon=True)
+                _worker.start()
+
+
+def process_reports() -> None:
+    while True:
+        sampled_error = _reports.get()
+        try:
+            check_sampled_error(sampled_error)
+        except Exception:
+            logger.debug(
+                "drf-standardized-errors: unable to check error codes.", exc_info=True
+            )
+        finally:
+            _reports.task_done()
+
+
+def check_sampled_error(sampled_error: SampledError) -> None:
+    documented = get_documented_error_codes(sampled_error)
+    if documented is None:
+        return
+
+    operation = f"{sampled_error.method} {sampled_error.route}"
+    for template, code in sampled_error.error_codes - documented:
+        count((operation, template, code))
+
+
+def count(undocumented_error: UndocumentedError) -> None:
+    with _lock:
+        if undocumented_error not in _counts and len(_counts) >= MAX_COUNTED_ERRORS:
+            return
+        _counts[undocumented_error] += 1
+        first_time = _counts[undocumented_error] == 1
+    if first_time:
+        logger.warning(
+            "drf-standardized-errors: undocumented error code: %s attr=%s code=%s",
+            *undocumented_error,
+        )
+
+
+def get_documented_error_codes(
+    sampled_error: SampledError,
+) -> Optional[FrozenSet[ErrorCode]]:
+    """
+    Return the (attr, code) pairs documented for the operation, or None when
+    the view does not use the AutoSchema of this package. Only called from
+    the background thread. The error codes are cached by view function rather
+    than view class since views built with different ``as_view`` arguments
+    (like another serializer class) document different error codes.
+    """
+    key = (
+        sampled_error.route,
+        sampled_error.method,
+        sampled_error.action,
+        sampled_error.version,
+    )
+    codes_by_key = _documented_error_codes.setdefault(sampled_error.callback, {})
+    if key not in codes_by_key:
+        codes_by_key[key] = compute_documented_error_codes(sampled_error)
+    return codes_by_key[key]
+
+
+def compute_documented_error_codes(
+    sampled_error: SampledError,
+) -> Optional[FrozenSet[ErrorCode]]:
+    """
+    Determine the error codes with a view instantiated from the resolved view
+    function like the schema generator does, so that nothing is shared with
+    the view that handled the request.
+    """
+    method = sampled_error.method
+    # the route template (like "orders/<int:pk>/") as an API schema path
+    path = EndpointEnumerator(patterns=[]).get_path_from_regex(
+        "/" + sampled_error.route
+    )
+    with GENERATOR_STATS.silence():
+        view = SchemaGenerator().create_view(sampled_error.callback, method)
+        if not isinstance(getattr(view, "schema", None), AutoSchema):
+            return None
+        view.request = spectacular_settings.GET_MOCK_REQUEST(method, path, view, None)
+        if sampled_error.version and view.versioning_class:
+            view.request.version = sampled_error.version
+            view.request.versioning_scheme = view.versioning_class()
+
+        schema = get_operation_schema(view, path, method)
+        if not schema._should_add_validation_error_response():
+            return frozenset()
+        error_codes_by_field = schema._get_validation_error_codes()
+    return frozenset(
+        (field_name, error_code)
+        for field_name, error_codes in error_codes_by_field.items()
+        for error_code in error_codes
+    )
+
+
+def get_undocumented_error_counts() -> Dict[UndocumentedError, int]:
+    """Return the number of times each undocumented error was sampled"""
+    with _lock:
+        return dict(_counts)
+
+
+def get_dropped_report_count() -> int:
+    """Return the number of sampled errors dropped because the queue was full"""
+    with _lock:
+        return _dropped_reports
+
+
+def wait_for_reports() -> None:
+    """Block until the reported errors are counted"""
+    _reports.join()
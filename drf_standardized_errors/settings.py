@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 from django.conf import settings
 from django.core.signals import setting_changed
@@ -11,6 +11,10 @@ class PackageSettings:
     Copy of DRF APISettings class with support for importing settings that
     are dicts with value as a string representing the path to the class
     to be imported.
+
+    Unlike DRF APISettings, all settings are resolved at once into an immutable
+    snapshot. When the settings change, a new snapshot is built and swapped in
+    as a whole, so concurrent readers never see a partially updated state.
     """
 
     setting_name = "DRF_STANDARDIZED_ERRORS"
@@ -22,53 +26,94 @@ class PackageSettings:
     ):
         self.defaults = defaults or DEFAULTS
         self.import_strings = import_strings or IMPORT_STRINGS
-        self._cached_attrs: Set[str] = set()
+        self._snapshot: Optional[SettingsSnapshot] = None
 
     @property
     def user_settings(self) -> Dict[str, Any]:
-        if not hasattr(self, "_user_settings"):
-            self._user_settings = getattr(settings, self.setting_name, {})
-        return self._user_settings
+        return getattr(settings, self.setting_name, {})
+
+    @property
+    def snapshot(self) -> "SettingsSnapshot":
+        return self._snapshot or self.warm()
 
     def __getattr__(self, attr: str) -> Any:
         if attr not in self.defaults:
             raise AttributeError(f"Invalid API setting: '{attr}'")
+        return getattr(self.snapshot, attr)
+
+    def warm(self) -> "SettingsSnapshot":
+        """
+        Resolve the settings (including importing the classes they reference)
+        if that's not done yet. Called when the app is ready so that requests
+        do not pay for it.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = self.build_snapshot()
+        return snapshot
 
-        try:
-            # Check if present in user settings
-            val = self.user_settings[attr]
-        except KeyError:
-            # Fall back to defaults
-            val = self.defaults[attr]
+    def reload(self) -> None:
+        self._snapshot = self.build_snapshot()
+
+    def build_snapshot(self) -> "SettingsSnapshot":
+        user_settings = self.user_settings
+        values = {}
+        for attr, default in self.defaults.items():
+            val = user_settings.get(attr, default)
 
-        # Coerce import strings into classes
-        if attr in self.import_strings:
-            if isinstance(val, dict):
+            # Coerce import strings into classes
+            if attr in self.import_strings and attr in IMPORT_STRING_KEYS:
                 val = {
-                    status_code: import_from_string(error_schema, attr)
-                    for status_code, error_schema in val.items()
+                    import_from_string(key, attr) if isinstance(key, str) else key: (
+                        perform_import(value, attr)
+                    )
+                    for key, value in val.items()
                 }
-            else:
-                val = perform_import(val, attr)
+            elif attr in self.import_strings:
+                if isinstance(val, dict):
+                    val = {
+                        status_code: import_from_string(error_schema, attr)
+                        for status_code, error_schema in val.items()
+                    }
+                else:
+                    val = perform_import(val, attr)
 
-        # Cache the result
-        self._cached_attrs.add(attr)
-        setattr(self, attr, val)
-        return val
+            values[attr] = val
+        return SettingsSnapshot(values)
 
-    def reload(self) -> None:
-        for attr in self._cached_attrs:
-            delattr(self, attr)
-        self._cached_attrs.clear()
-        if hasattr(self, "_user_settings"):
-            delattr(self, "_user_settings")
+
+class SettingsSnapshot:
+    """Resolved settings exposed as plain attributes which cannot be changed"""
+
+    def __init__(self, values: Dict[str, Any]):
+        self.__dict__.update(values)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Settings snapshots are immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Settings snapshots are immutable.")
+
+    if TYPE_CHECKING:  # pragma: no cover
+
+        def __getattr__(self, name: str) -> Any: ...
 
 
 DEFAULTS: Dict[str, Any] = {
     "EXCEPTION_HANDLER_CLASS": "drf_standardized_errors.handler.ExceptionHandler",
     "EXCEPTION_FORMATTER_CLASS": "drf_standardized_errors.formatter.ExceptionFormatter",
     "ENABLE_IN_DEBUG_FOR_UNHANDLED_EXCEPTIONS": False,
+    "EXCEPTION_CONVERTERS": {},
     "NESTED_FIELD_SEPARATOR": ".",
+    "ENABLE_STREAMING_RESPONSES": False,
+    "ENABLE_MINIMAL_ERRORS": False,
+    "ERROR_RENDERER_CLASSES": [],
+    "ERRORS_PAGE_SIZE": 100,
+    "ERRORS_PAGES_CACHE": "default",
+    "ERRORS_PAGES_TIMEOUT": 300,
+    "UNDOCUMENTED_ERRORS_SAMPLE_RATE": 0,
+    "WARM_UP_ON_STARTUP": False,
+    "WARM_UP_LANGUAGES": None,
     "ALLOWED_ERROR_STATUS_CODES": [
         "400",
         "401",
@@ -89,8 +134,12 @@ DEFAULTS: Dict[str, Any] = {
 IMPORT_STRINGS = (
     "EXCEPTION_FORMATTER_CLASS",
     "EXCEPTION_HANDLER_CLASS",
+    "ERROR_RENDERER_CLASSES",
     "ERROR_SCHEMAS",
+    "EXCEPTION_CONVERTERS",
 )
+# settings that are dicts where the keys are import strings as well
+IMPORT_STRING_KEYS = ("EXCEPTION_CONVERTERS",)
 
 package_settings = PackageSettings(DEFAULTS, IMPORT_STRINGS)
 
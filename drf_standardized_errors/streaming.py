@@ -0,0 +1,131 @@
+import itertools
+import json
+from dataclasses import asdict
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from rest_framework.compat import LONG_SEPARATORS, SHORT_SEPARATORS
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+from .types import Error
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+# errors are sent in chunks of roughly that size rather than one by one to
+# avoid a write to the socket per error
+CHUNK_SIZE = 64 * 1024
+
+
+def get_json_encoder() -> json.JSONEncoder:
+    """Encode json the same way DRF's JSONRenderer does without indentation"""
+    return JSONEncoder(
+        ensure_ascii=not api_settings.UNICODE_JSON,
+        allow_nan=not api_settings.STRICT_JSON,
+        separators=get_separators(),
+    )
+
+
+def get_separators() -> Tuple[str, str]:
+    return SHORT_SEPARATORS if api_settings.COMPACT_JSON else LONG_SEPARATORS
+
+
+def iter_json_chunks(
+    error_type: str, errors: Iterable[Dict[str, Any]], chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Encode ``{"type": error_type, "errors": [...]}`` incrementally so that
+    only one chunk of the encoded errors is in memory at any given time.
+    """
+    encoder = get_json_encoder()
+    item_separator, key_separator = get_separators()
+
+    buffer = [
+        '{"type"',
+        key_separator,
+        encoder.encode(error_type),
+        item_separator,
+        '"errors"',
+        key_separator,
+        "[",
+    ]
+    size = 0
+    for position, error in enumerate(errors):
+        chunk = encoder.encode(error)
+        if position:
+            buffer.append(item_separator)
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= chunk_size:
+            yield "".join(buffer).encode()
+            buffer, size = [], 0
+    buffer.append("]}")
+    yield "".join(buffer).encode()
+
+
+def iter_ndjson_chunks(
+    errors: Iterable[Error], chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Encode each error as one line of JSON"""
+    encoder = get_json_encoder()
+    buffer: List[str] = []
+    size = 0
+    for error in errors:
+        line = encoder.encode(asdict(error)) + "\n"
+        buffer.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield "".join(buffer).encode()
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer).encode()
+
+
+def get_ndjson_response(
+    errors: Iterable[Error],
+    request: Any = None,
+    status: int = 400,
+    chunk_size: int = CHUNK_SIZE,
+) -> Optional[StreamingHttpResponse]:
+    """
+    Return a streaming `application/x-ndjson` response with one error per line
+    or None when there are no errors. Only the first error is generated before
+    returning the response, the rest are generated while it is sent. So, when
+    the errors come from validating a list in chunks (see `iter_chunked_errors`),
+    clients receive the first errors while the remaining chunks are validated.
+    Lower the chunk size to send errors sooner at the cost of more writes.
+    """
+    errors = iter(errors)
+    first_error = next(errors, None)
+    if first_error is None:
+        return None
+    chunks = iter_ndjson_chunks(itertools.chain([first_error], errors), chunk_size)
+    return get_streaming_response(
+        chunks, status, request=request, content_type=NDJSON_CONTENT_TYPE
+    )
+
+
+async def aiter_chunks(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+def get_streaming_response(
+    chunks: Iterable[bytes],
+    status: int,
+    headers: Optional[dict] = None,
+    request: Any = None,
+    content_type: str = "application/json",
+) -> StreamingHttpResponse:
+    """
+    Under ASGI, the chunks are wrapped in an async iterator since django
+    has to consume sync iterators in a thread for ASGI requests.
+    """
+    request = getattr(request, "_request", request)
+    if isinstance(request, ASGIRequest):
+        streaming_content: Any = aiter_chunks(chunks)
+    else:
+        streaming_content = chunks
+    return StreamingHttpResponse(
+        streaming_content, status=status, headers=headers, content_type=content_type
+    )
@@ -1,15 +1,20 @@
 from dataclasses import dataclass
-from typing import Final, List, Literal, Optional, TypedDict
+from typing import Final, List, Literal, Optional, TypedDict, Union
 
+from django.http import HttpRequest
 from rest_framework.request import Request
 from rest_framework.views import APIView
 
 
 class ExceptionHandlerContext(TypedDict):
-    view: APIView
+    # view is None and request is a django HttpRequest when the exception
+    # is raised outside DRF views (check drf_standardized_errors.middleware)
+    # and request is None when it is raised outside requests (check
+    # drf_standardized_errors.batch)
+    view: Optional[APIView]
     args: tuple
     kwargs: dict
-    request: Optional[Request]
+    request: Optional[Union[Request, HttpRequest]]
 
 
 VALIDATION_ERROR: Final = "validation_error"
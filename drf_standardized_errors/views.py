@@ -0,0 +1,43 @@
+"""
+Error views returning standardized error responses. To use them, add the
+following to your root URLconf:
+
+    handler400 = "drf_standardized_errors.views.bad_request"
+    handler403 = "drf_standardized_errors.views.permission_denied"
+    handler404 = "drf_standardized_errors.views.page_not_found"
+    handler500 = "drf_standardized_errors.views.server_error"
+
+Django takes care of reporting the exception before calling these views, so
+it is not reported again. When the exception should not be handled (check
+`ExceptionHandler.should_not_handle`), django default views are used instead.
+"""
+
+from django.http import HttpRequest, HttpResponse
+from django.views import defaults
+from rest_framework import exceptions
+
+from .middleware import get_error_response
+
+
+def bad_request(request: HttpRequest, exception: Exception) -> HttpResponse:
+    if not isinstance(exception, exceptions.APIException):
+        exception = exceptions.ParseError()
+    response = get_error_response(exception, request, report=False)
+    return response or defaults.bad_request(request, exception)
+
+
+def permission_denied(request: HttpRequest, exception: Exception) -> HttpResponse:
+    response = get_error_response(exception, request, report=False)
+    return response or defaults.permission_denied(request, exception)
+
+
+def page_not_found(request: HttpRequest, exception: Exception) -> HttpResponse:
+    response = get_error_response(exception, request, report=False)
+    return response or defaults.page_not_found(request, exception)
+
+
+def server_error(request: HttpRequest) -> HttpResponse:
+    # the exception details are not available to this view, which results in
+    # the generic server error response
+    response = get_error_response(Exception(), request, report=False)
+    return response or defaults.server_error(request)
@@ -0,0 +1,96 @@
+import logging
+import time
+from typing import List, Optional
+
+from django.conf import settings
+from django.utils import translation
+from rest_framework import exceptions, serializers
+from rest_framework.views import APIView
+
+from .formatter import ExceptionFormatter
+from .messages import warm_up_error_messages
+from .settings import package_settings
+from .types import ExceptionHandlerContext
+
+logger = logging.getLogger(__name__)
+
+
+def warm_up(languages: Optional[List[str]] = None) -> None:
+    """
+    Do the work that would otherwise be done when handling the first errors
+    after startup: resolve the settings, format DRF built-in exceptions in
+    each language to load the translation catalogs and fill the cache of
+    rendered error messages of DRF fields. The message cache is only filled
+    for languages that are set explicitly: the messages of all the languages
+    supported by django would not fit in it.
+    """
+    start = time.perf_counter()
+    package_settings.warm()
+
+    warm_up_messages = bool(languages or package_settings.WARM_UP_LANGUAGES)
+    if languages is None:
+        languages = get_warm_up_languages()
+    for language in languages:
+        with translation.override(language):
+            for exc in get_builtin_exceptions():
+                format_exception(exc)
+            if warm_up_messages:
+                warm_up_error_messages()
+
+    duration = (time.perf_counter() - start) * 1000
+    logger.info(
+        "drf-standardized-errors: warm-up done in %.1fms for languages: %s",
+        duration,
+        ", ".join(languages),
+    )
+
+
+def get_warm_up_languages() -> List[str]:
+    if languages := package_settings.WARM_UP_LANGUAGES:
+        return list(languages)
+    if settings.USE_I18N:
+        return [code for code, _ in settings.LANGUAGES]
+    return [settings.LANGUAGE_CODE]
+
+
+def get_builtin_exceptions() -> List[exceptions.APIException]:
+    """
+    The instances are created in the active language since the error details
+    are translated when the exception is instantiated.
+    """
+    required_message = serializers.Field.default_error_messages["required"]
+    return [
+        exceptions.ValidationError({"field": [required_message]}, code="required"),
+        exceptions.ParseError(),
+        exceptions.AuthenticationFailed(),
+        exceptions.NotAuthenticated(),
+        exceptions.PermissionDenied(),
+        exceptions.NotFound(),
+        exceptions.MethodNotAllowed("get"),
+        exceptions.NotAcceptable(),
+        exceptions.UnsupportedMediaType("application/json"),
+        exceptions.Throttled(),
+        exceptions.APIException(),
+    ]
+
+
+def format_exception(exc: exceptions.APIException) -> None:
+    exception_formatter_class = package_settings.EXCEPTION_FORMATTER_CLASS
+    if not issubclass(exception_formatter_class, ExceptionFormatter):
+        return
+    context: ExceptionHandlerContext = {
+        "view": APIView(),
+        "args": (),
+        "kwargs": {},
+        "request": None,
+    }
+    try:
+        exception_formatter_class(exc, context, exc).run()
+    except Exception:
+        # a custom formatter might rely on a real view or request, which should
+        # not prevent the app from starting
+        logger.warning(
+            "drf-standardized-errors: unable to format %s during warm-up.",
+            exc.__class__.__name__,
+            exc_info=True,
+        )
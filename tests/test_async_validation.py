@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.urls import path
+from drf_spectacular.generators import SchemaGenerator
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import GenericAPIView
+
+from drf_standardized_errors.async_validation import (
+    AsyncValidationMixin,
+    validate_concurrently,
+)
+from drf_standardized_errors.catalog import iter_error_catalog
+from drf_standardized_errors.formatter import flatten_errors
+from drf_standardized_errors.openapi_validation_errors import extend_validation_errors
+
+
+class Counter:
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+    def validator(self, error=None):
+        async def validate(value):
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            await asyncio.sleep(0.01)
+            self.running -= 1
+            if error:
+                raise error
+
+        return validate
+
+
+def validate(*args, **kwargs):
+    try:
+        asyncio.run(validate_concurrently(*args, **kwargs))
+    except ValidationError as exc:
+        return [(e.code, e.attr) for e in flatten_errors(exc.detail)]
+    return []
+
+
+@pytest.mark.parametrize("max_concurrency,max_running", [(None, 4), (2, 2)])
+def test_validators_run_concurrently(max_concurrency, max_running):
+    counter = Counter()
+    field_validators = {
+        "email": [counter.validator(), counter.validator()],
+        "name": [counter.validator()],
+    }
+    errors = validate(
+        {"email": "a@example.com", "name": "a"},
+        field_validators,
+        [counter.validator()],
+        max_concurrency=max_concurrency,
+    )
+    assert errors == []
+    assert counter.max_running == max_running
+
+
+def test_errors_are_merged():
+    counter = Counter()
+    field_validators = {
+        "email": [
+            counter.validator(ValidationError("Banned.", code="banned")),
+            counter.validator(DjangoValidationError("Blocked.", code="blocked")),
+        ],
+        "name": [counter.validator(ValidationError("Taken.", code="taken"))],
+        # not in the data
+        "phone": [counter.validator(ValidationError("Invalid.", code="invalid"))],
+    }
+    validators = [
+        counter.validator(ValidationError("Over quota.", code="quota")),
+        counter.validator(ValidationError({"name": ["Reserved."]}, code="reserved")),
+    ]
+    errors = validate(
+        {"email": "a@example.com", "name": "a"}, field_validators, validators
+    )
+    assert errors == [
+        ("banned", "email"),
+        ("blocked", "email"),
+        ("taken", "name"),
+        ("reserved", "name"),
+        ("quota", "non_field_errors"),
+    ]
+
+
+def test_other_exceptions_are_raised():
+    field_validators = {"email": [Counter().validator(RuntimeError("down"))]}
+    with pytest.raises(RuntimeError):
+        validate({"email": "a@example.com"}, field_validators)
+
+
+async def check_domain(value):
+    await asyncio.sleep(0)
+    if value.endswith("@example.org"):
+        raise ValidationError("Domain not allowed.", code="domain")
+
+
+class SignupSerializer(AsyncValidationMixin, serializers.Serializer):
+    email = serializers.EmailField()
+
+    async_field_validators = {"email": [check_domain]}
+
+
+def test_serializer_async_validation():
+    serializer = SignupSerializer(data={"email": "a@example.com"})
+    assert asyncio.run(serializer.ais_valid())
+    assert serializer.validated_data == {"email": "a@example.com"}
+
+    serializer = SignupSerializer(data={"email": "a@example.org"})
+    with pytest.raises(ValidationError) as exc_info:
+        asyncio.run(serializer.ais_valid(raise_exception=True))
+    assert exc_info.value.detail["email"][0].code == "domain"
+    assert serializer.validated_data == {}
+
+
+def test_serializer_async_validators_run_after_the_regular_validation():
+    serializer = SignupSerializer(data={"email": "invalid"})
+    assert not asyncio.run(serializer.ais_valid())
+    assert serializer.errors["email"][0].code == "invalid"
+
+
+@extend_validation_errors(["domain"], field_name="email", methods=["post"])
+class SignupView(GenericAPIView):
+    serializer_class = SignupSerializer
+
+    def post(self, request, *args, **kwargs):
+        pass
+
+
+def test_async_validation_error_codes_with_extend_validation_errors():
+    generator = SchemaGenerator(patterns=[path("signup/", SignupView.as_view())])
+    codes = {
+        entry.attr: entry.codes
+        for entry in iter_error_catalog(generator)
+        if entry.status == "400"
+    }
+    assert "domain" in codes["email"]
@@ -0,0 +1,125 @@
+from drf_spectacular.utils import PolymorphicProxySerializer
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from drf_standardized_errors.attr_paths import build_attr_tree, get_attr_tree
+from drf_standardized_errors.formatter import ExceptionFormatter, iter_errors
+from drf_standardized_errors.openapi_utils import get_flat_serializer_fields
+
+from .views import OrderErrorView, OrderSerializer
+
+
+class ItemSerializer(serializers.Serializer):
+    email = serializers.EmailField()
+    tags = serializers.ListField(child=serializers.CharField())
+    extra = serializers.DictField(child=serializers.IntegerField())
+    id = serializers.IntegerField(read_only=True)
+
+
+class BulkSerializer(serializers.Serializer):
+    items = ItemSerializer(many=True)
+    address = OrderSerializer()
+
+
+class ContextSerializer(serializers.Serializer):
+    def __init__(self, user, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+
+def test_attr_tree():
+    tree = get_attr_tree(BulkSerializer)
+
+    zipcode = tree.children["address"].children["shipping_address"].children["zipcode"]
+    assert zipcode.attr == zipcode.template == "address.shipping_address.zipcode"
+    items = tree.children["items"]
+    assert items.children["non_field_errors"].attr == "items.non_field_errors"
+    email = items.item.children["email"]
+    assert email.attr is None
+    assert email.template == "items.INDEX.email"
+    assert items.item.children["tags"].item.template == "items.INDEX.tags.INDEX"
+    assert items.item.children["extra"].item.template == "items.INDEX.extra.KEY"
+    assert "id" not in items.item.children
+
+
+def test_attr_tree_of_polymorphic_serializer():
+    proxy = PolymorphicProxySerializer(
+        component_name="Payload",
+        serializers=[ItemSerializer, OrderSerializer],
+        resource_type_field_name=None,
+    )
+    tree = build_attr_tree(proxy, None, None)
+
+    assert tree.get_child("email").template == "email"
+    assert tree.get_child("extra").item.template == "extra.KEY"
+    assert tree.get_child("shipping_address").template == "shipping_address"
+
+
+def test_attr_tree_lists_the_schema_fields():
+    names = [field.name for field in get_flat_serializer_fields(BulkSerializer())]
+    assert names[:6] == [
+        "non_field_errors",
+        "items.non_field_errors",
+        "items.INDEX.non_field_errors",
+        "items.INDEX.email",
+        "items.INDEX.tags",
+        "items.INDEX.tags.INDEX",
+    ]
+    assert "items.INDEX.extra.KEY" in names
+    assert "items.INDEX.id" not in names
+
+
+def test_attr_tree_is_computed_once_per_class_and_settings(settings):
+    tree = get_attr_tree(BulkSerializer)
+    assert get_attr_tree(BulkSerializer) is tree
+
+    settings.DRF_STANDARDIZED_ERRORS = {"NESTED_FIELD_SEPARATOR": "__"}
+    tree = get_attr_tree(BulkSerializer)
+    assert tree.children["address"].children["shipping_address"].attr == (
+        "address__shipping_address"
+    )
+
+
+def test_attr_tree_of_serializer_with_required_args():
+    assert get_attr_tree(ContextSerializer) is None
+
+
+def test_errors_with_attr_tree():
+    serializer = BulkSerializer(
+        data={
+            "items": [
+                {"email": "a@example.com", "tags": ["a"], "extra": {"a": 1}},
+                {"email": "invalid", "tags": [None], "extra": {"a": "x"}},
+            ],
+            "address": {"shipping_address": {"state": "NY"}},
+        }
+    )
+    assert not serializer.is_valid()
+    detail = ValidationError(serializer.errors).detail
+    tree = get_attr_tree(BulkSerializer)
+
+    errors = list(iter_errors(detail, tree=tree))
+    assert errors == list(iter_errors(detail))
+    assert [error.attr for error in errors] == [
+        "items.1.email",
+        "address.shipping_address.street_address",
+        "address.shipping_address.city",
+        "address.shipping_address.state",
+        "address.shipping_address.zipcode",
+        "items.1.tags.0",
+        "items.1.extra.a",
+    ]
+    # attrs that do not depend on list indices are not built again
+    zipcode = tree.children["address"].children["shipping_address"].children["zipcode"]
+    assert errors[4].attr is zipcode.attr
+
+
+def test_formatter_uses_the_view_serializer(exception_context):
+    exception_context["view"] = OrderErrorView()
+    exc = ValidationError({"shipping_address": {"city": ["This field is required."]}})
+    formatter = ExceptionFormatter(exc, exception_context, exc)
+    assert formatter.get_attr_tree() is get_attr_tree(OrderSerializer)
+    assert formatter.run()["errors"][0]["attr"] == "shipping_address.city"
+
+    # no serializer class
+    exception_context["view"] = None
+    assert ExceptionFormatter(exc, exception_context, exc).get_attr_tree() is None
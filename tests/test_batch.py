@@ -0,0 +1,78 @@
+from django.http import Http404
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from drf_standardized_errors.attr_paths import get_attr_tree
+from drf_standardized_errors.batch import format_many
+from drf_standardized_errors.formatter import GroupedExceptionFormatter
+
+
+class RecordSerializer(serializers.Serializer):
+    email = serializers.EmailField()
+    name = serializers.CharField()
+
+
+def validate(records):
+    for record in records:
+        serializer = RecordSerializer(data=record)
+        try:
+            serializer.is_valid(raise_exception=True)
+        except ValidationError as exc:
+            yield exc
+        else:
+            yield None
+
+
+def test_format_many():
+    records = [{"email": "a@example.com", "name": "a"}, {"email": "invalid"}]
+    results = list(format_many(validate(records), index_offset=100))
+    assert results == [
+        (
+            101,
+            {
+                "type": "validation_error",
+                "errors": [
+                    {
+                        "code": "invalid",
+                        "detail": "Enter a valid email address.",
+                        "attr": "email",
+                    },
+                    {
+                        "code": "required",
+                        "detail": "This field is required.",
+                        "attr": "name",
+                    },
+                ],
+            },
+        )
+    ]
+
+
+def test_format_many_is_lazy():
+    def excs():
+        yield ValidationError("Invalid.")
+        raise AssertionError("consumed too early")
+
+    results = format_many(excs())
+    assert next(results)[0] == 0
+
+
+def test_format_many_converts_exceptions():
+    results = dict(format_many([Http404(), ValueError("secret")]))
+    assert results[0]["errors"][0]["code"] == "not_found"
+    assert results[1]["type"] == "server_error"
+    assert results[1]["errors"][0]["detail"] == "Server Error (500)"
+
+
+def test_format_many_with_serializer_class():
+    records = [{"email": "invalid", "name": "a"}] * 3
+    results = list(format_many(validate(records), serializer_class=RecordSerializer))
+    email = get_attr_tree(RecordSerializer).children["email"]
+    # the attr strings are shared by all the records of the batch
+    assert all(data["errors"][0]["attr"] is email.attr for _, data in results)
+
+
+def test_format_many_with_formatter_class():
+    exc = ValidationError({"items": [{"email": ["Invalid."]}, {"email": ["Invalid."]}]})
+    [(_, data)] = format_many([exc], formatter_class=GroupedExceptionFormatter)
+    assert data["errors"][0]["indices"] == [[0, 2]]
@@ -0,0 +1,230 @@
+import datetime
+
+import pytest
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from drf_standardized_errors.bulk import BulkUniqueValidator, FailFastListSerializer
+from drf_standardized_errors.formatter import flatten_errors
+from drf_standardized_errors.openapi_utils import (
+    get_flat_serializer_fields,
+    get_serializer_fields_with_error_codes,
+)
+
+from .models import Post
+
+
+class ItemListSerializer(FailFastListSerializer):
+    max_item_errors = 2
+
+
+class ItemSerializer(serializers.Serializer):
+    email = serializers.EmailField()
+
+    class Meta:
+        list_serializer_class = ItemListSerializer
+
+
+class BulkSerializer(serializers.Serializer):
+    items = ItemSerializer(many=True)
+
+
+def get_errors(items):
+    serializer = BulkSerializer(data={"items": items})
+    assert not serializer.is_valid()
+    detail = ValidationError(serializer.errors).detail
+    return [(error.code, error.attr) for error in flatten_errors(detail)]
+
+
+def test_validation_stops_after_max_item_errors(monkeypatch):
+    validated = []
+    run_validation = ItemSerializer.run_validation
+
+    def record_validation(self, data):
+        validated.append(data)
+        return run_validation(self, data)
+
+    monkeypatch.setattr(ItemSerializer, "run_validation", record_validation)
+    items = [{"email": "a@example.com"}] + [{"email": "invalid"}] * 1000
+
+    assert get_errors(items) == [
+        ("too_many_errors", "items.non_field_errors"),
+        ("invalid", "items.1.email"),
+        ("invalid", "items.2.email"),
+    ]
+    assert len(validated) == 3
+
+
+def test_validation_stops_without_run_child_validation(monkeypatch):
+    # DRF < 3.15 validates the items without calling run_child_validation
+    def to_internal_value(self, data):
+        ret, errors = [], {}
+        for index, item in enumerate(data):
+            try:
+                ret.append(self.child.run_validation(item))
+            except ValidationError as exc:
+                errors[index] = exc.detail
+        if errors:
+            raise ValidationError(errors)
+        return ret
+
+    monkeypatch.setattr(
+        serializers.ListSerializer, "to_internal_value", to_internal_value
+    )
+    monkeypatch.delattr(serializers.ListSerializer, "run_child_validation")
+    items = [{"email": "invalid"}] * 10
+
+    assert get_errors(items) == [
+        ("too_many_errors", "items.non_field_errors"),
+        ("invalid", "items.0.email"),
+        ("invalid", "items.1.email"),
+    ]
+
+
+def test_no_truncation_when_all_items_are_validated():
+    items = [{"email": "a@example.com"}, {"email": "invalid"}, {"email": "invalid"}]
+    assert get_errors(items) == [
+        ("invalid", "items.1.email"),
+        ("invalid", "items.2.email"),
+    ]
+
+
+def test_max_item_errors_argument():
+    serializer = FailFastListSerializer(
+        child=serializers.EmailField(), max_item_errors=None, data=["a"] * 200
+    )
+    assert not serializer.is_valid()
+    assert len(serializer.errors) == 200
+
+    serializer = FailFastListSerializer(
+        child=serializers.EmailField(), max_item_errors=1, data=["a", "b"]
+    )
+    assert not serializer.is_valid()
+    assert serializer.errors[0][0].code == "invalid"
+    assert serializer.errors["non_field_errors"][0].code == "too_many_errors"
+    assert serializer.validated_data == []
+
+
+def get_error_codes(serializer):
+    fields = get_flat_serializer_fields(serializer)
+    fields = get_serializer_fields_with_error_codes(fields)
+    return {field.name: field.error_codes for field in fields}
+
+
+def test_too_many_errors_code_is_documented():
+    error_codes = get_error_codes(BulkSerializer())
+    assert "too_many_errors" in error_codes["items.non_field_errors"]
+
+
+class PostListSerializer(serializers.ListSerializer):
+    default_validators = [
+        BulkUniqueValidator(queryset=Post.objects.all(), fields=["title"])
+    ]
+
+
+class PostSerializer(serializers.Serializer):
+    title = serializers.CharField()
+    published_at = serializers.DateField()
+
+    class Meta:
+        list_serializer_class = PostListSerializer
+
+
+class DailyPostListSerializer(serializers.ListSerializer):
+    default_validators = [
+        BulkUniqueValidator(
+            queryset=Post.objects.all(), fields=["title", "published_at"]
+        )
+    ]
+
+
+class DailyPostSerializer(PostSerializer):
+    class Meta:
+        list_serializer_class = DailyPostListSerializer
+
+
+class BlogSerializer(serializers.Serializer):
+    posts = PostSerializer(many=True)
+    daily_posts = DailyPostSerializer(many=True)
+
+
+@pytest.fixture
+def post():
+    return Post.objects.create(
+        title="a", body="body", published_at=datetime.date(2024, 1, 1)
+    )
+
+
+def get_list_errors(serializer):
+    assert not serializer.is_valid()
+    detail = ValidationError(serializer.errors).detail
+    return [(error.code, error.detail, error.attr) for error in flatten_errors(detail)]
+
+
+@pytest.mark.django_db
+def test_bulk_unique_validator(post, django_assert_num_queries):
+    data = [
+        {"title": title, "published_at": "2024-01-01"}
+        for title in ["a", "b", "c", "b", "b"]
+    ]
+    serializer = PostSerializer(many=True, data=data)
+    with django_assert_num_queries(1):
+        errors = get_list_errors(serializer)
+    assert errors == [
+        ("unique", "This field must be unique.", "0.title"),
+        ("unique", "Duplicate of the item at index 1.", "3.title"),
+        ("unique", "Duplicate of the item at index 1.", "4.title"),
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "serializer_class,num_queries",
+    [(PostSerializer, 3), (DailyPostSerializer, 5)],
+)
+def test_bulk_unique_validator_queries_in_chunks(
+    post, serializer_class, num_queries, monkeypatch, django_assert_num_queries
+):
+    monkeypatch.setattr(BulkUniqueValidator, "batch_size", 2)
+    data = [
+        {"title": title, "published_at": "2024-01-01"}
+        for title in ["a", "b", "c", "d", "e"]
+    ]
+    serializer = serializer_class(many=True, data=data)
+    with django_assert_num_queries(num_queries):
+        errors = get_list_errors(serializer)
+    assert [error[2] for error in errors] == [
+        "0.title" if serializer_class is PostSerializer else "0.non_field_errors"
+    ]
+
+
+@pytest.mark.django_db
+def test_bulk_unique_together_validator(post):
+    data = [
+        {"title": "a", "published_at": "2024-01-01"},
+        {"title": "a", "published_at": "2024-01-02"},
+        {"title": "a", "published_at": "2024-01-02"},
+    ]
+    serializer = DailyPostSerializer(many=True, data=data)
+    assert get_list_errors(serializer) == [
+        (
+            "unique",
+            "The fields title, published_at must make a unique set.",
+            "0.non_field_errors",
+        ),
+        ("unique", "Duplicate of the item at index 1.", "2.non_field_errors"),
+    ]
+
+
+@pytest.mark.django_db
+def test_bulk_unique_validator_excludes_updated_instances(post):
+    data = [{"title": "a", "published_at": "2024-01-01"}]
+    serializer = PostSerializer([post], many=True, data=data)
+    assert serializer.is_valid()
+
+
+def test_bulk_unique_error_codes_are_documented():
+    error_codes = get_error_codes(BlogSerializer())
+    assert "unique" in error_codes["posts.INDEX.title"]
+    assert "unique" in error_codes["daily_posts.INDEX.non_field_errors"]
+    assert "unique" not in error_codes["daily_posts.INDEX.title"]
@@ -0,0 +1,123 @@
+import csv
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import path
+from drf_spectacular.generators import SchemaGenerator
+from drf_spectacular.utils import extend_schema
+from rest_framework import serializers
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from drf_standardized_errors.catalog import CatalogEntry, iter_error_catalog
+from drf_standardized_errors.openapi_validation_errors import extend_validation_errors
+
+
+class ImportSerializer(serializers.Serializer):
+    name = serializers.CharField(max_length=10)
+    email = serializers.EmailField(required=False)
+
+
+@extend_validation_errors(["taken"], field_name="name", methods=["post"])
+class ImportView(GenericAPIView):
+    serializer_class = ImportSerializer
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        return Response(status=204)
+
+
+class StatusView(APIView):
+    @extend_schema(responses={200: None, 404: None})
+    def get(self, request, *args, **kwargs):
+        return Response()
+
+
+@extend_schema(exclude=True)
+class ExcludedView(APIView):
+    def get(self, request, *args, **kwargs):
+        return Response()
+
+
+urlpatterns = [
+    path("imports/", ImportView.as_view()),
+    path("status/", StatusView.as_view()),
+    path("excluded/", ExcludedView.as_view()),
+]
+
+CATALOG = [
+    CatalogEntry("POST /imports/", "400", "non_field_errors", ["invalid", "null"]),
+    CatalogEntry(
+        "POST /imports/",
+        "400",
+        "name",
+        ["blank", "invalid", "max_length", "null", "null_characters_not_allowed"]
+        + ["required", "surrogate_characters_not_allowed", "taken"],
+    ),
+    CatalogEntry(
+        "POST /imports/",
+        "400",
+        "email",
+        ["blank", "invalid", "null", "null_characters_not_allowed"]
+        + ["surrogate_characters_not_allowed"],
+    ),
+    CatalogEntry("POST /imports/", "400", None, ["parse_error"]),
+    CatalogEntry("POST /imports/", "403", None, ["permission_denied"]),
+    CatalogEntry("POST /imports/", "405", None, ["method_not_allowed"]),
+    CatalogEntry("POST /imports/", "406", None, ["not_acceptable"]),
+    CatalogEntry("POST /imports/", "415", None, ["unsupported_media_type"]),
+    CatalogEntry("POST /imports/", "500", None, ["error"]),
+    # the 404 response is declared with extend_schema
+    CatalogEntry("GET /status/", "400", None, ["parse_error"]),
+    CatalogEntry("GET /status/", "405", None, ["method_not_allowed"]),
+    CatalogEntry("GET /status/", "406", None, ["not_acceptable"]),
+    CatalogEntry("GET /status/", "415", None, ["unsupported_media_type"]),
+    CatalogEntry("GET /status/", "500", None, ["error"]),
+]
+
+
+def get_catalog(**kwargs):
+    generator = SchemaGenerator(patterns=urlpatterns)
+    return list(iter_error_catalog(generator, **kwargs))
+
+
+def test_error_catalog():
+    assert get_catalog() == CATALOG
+
+
+def test_error_catalog_with_workers():
+    assert get_catalog(workers=4) == CATALOG
+
+
+@pytest.mark.urls(__name__)
+def test_export_error_codes_as_json():
+    stdout = StringIO()
+    call_command("export_error_codes", stdout=stdout)
+    catalog = json.loads(stdout.getvalue())
+    assert catalog[0] == {
+        "operation": "POST /imports/",
+        "status": "400",
+        "attr": "non_field_errors",
+        "codes": ["invalid", "null"],
+    }
+    assert len(catalog) == len(CATALOG)
+
+
+@pytest.mark.urls(__name__)
+def test_export_error_codes_as_csv(tmp_path):
+    file = tmp_path / "catalog.csv"
+    call_command("export_error_codes", format="csv", workers=2, file=str(file))
+    with open(file, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == len(CATALOG)
+    assert rows[1] == {
+        "operation": "POST /imports/",
+        "status": "400",
+        "attr": "name",
+        "codes": "blank invalid max_length null null_characters_not_allowed required "
+        "surrogate_characters_not_allowed taken",
+    }
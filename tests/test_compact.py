@@ -0,0 +1,134 @@
+import json
+from dataclasses import asdict
+
+import pytest
+from rest_framework import serializers
+from rest_framework.exceptions import ErrorDetail, ValidationError
+from rest_framework.generics import GenericAPIView
+from rest_framework.test import APIRequestFactory
+
+from drf_standardized_errors.compact import (
+    CompactExceptionFormatter,
+    decode_errors,
+    encode_errors,
+)
+from drf_standardized_errors.formatter import ExceptionFormatter, flatten_errors
+
+from .views import BulkContactView
+
+
+@pytest.fixture
+def bulk_errors():
+    invalid_email = [ErrorDetail("Enter a valid email address.", code="invalid")]
+    required = [ErrorDetail("This field is required.", code="required")]
+    rows = [{} for _ in range(200)]
+    for index in [*range(0, 100), 150]:
+        rows[index] = {"email": invalid_email}
+    rows[120] = {"name": required, "tags": {0: required, 3: required}}
+    return {"items": rows, "non_field_errors": required + required}
+
+
+def test_compact_format(bulk_errors, exception_context):
+    exc = ValidationError(bulk_errors)
+    response = CompactExceptionFormatter(exc, exception_context, exc).run()
+
+    assert response == {
+        "type": "validation_error",
+        "codes": ["required", "invalid"],
+        "details": ["This field is required.", "Enter a valid email address."],
+        "attrs": [
+            "non_field_errors",
+            "items.INDEX.email",
+            "items.INDEX.name",
+            "items.INDEX.tags.INDEX",
+        ],
+        "errors": [
+            [0, 0, 0, [[0, 2]]],
+            [1, 1, 1, [[0, 100], [150, 151]]],
+            [0, 0, 2, [[120, 121]]],
+            [0, 0, 3, [[120, 0, 1], [120, 3, 4]]],
+        ],
+    }
+
+
+def test_decode_errors(bulk_errors, exception_context):
+    exc = ValidationError(bulk_errors)
+    response = CompactExceptionFormatter(exc, exception_context, exc).run()
+    default_response = ExceptionFormatter(exc, exception_context, exc).run()
+
+    decoded = decode_errors(json.loads(json.dumps(response)))
+    errors = default_response["errors"]
+    assert len(decoded) == len(errors) == 106
+    # errors are grouped by code, detail and attr template when decoding
+    assert sorted(decoded, key=json.dumps) == sorted(errors, key=json.dumps)
+
+
+def test_compact_format_is_smaller(bulk_errors):
+    errors = flatten_errors(bulk_errors)
+    default_size = len(json.dumps([asdict(error) for error in errors]))
+    compact_size = len(json.dumps(encode_errors(errors)))
+    assert compact_size * 10 < default_size
+
+
+def test_custom_separator_and_placeholder(settings):
+    settings.DRF_STANDARDIZED_ERRORS = {
+        "NESTED_FIELD_SEPARATOR": "__",
+        "LIST_INDEX_IN_API_SCHEMA": "N",
+    }
+    exc = ValidationError({"items": [{}, {"email": ["Invalid."]}]})
+    errors = flatten_errors(exc.detail)
+    data = encode_errors(errors)
+    assert data["attrs"] == ["items__N__email"]
+    assert decode_errors(data)[0]["attr"] == "items__1__email"
+
+
+def test_error_without_attr():
+    exc = ValidationError("invalid")
+    data = encode_errors(flatten_errors(exc.detail))
+    assert data["attrs"] == [None]
+    assert decode_errors(data) == [
+        {"code": "invalid", "detail": "invalid", "attr": None}
+    ]
+
+
+class PricesSerializer(serializers.Serializer):
+    prices = serializers.DictField(child=serializers.IntegerField())
+    quantities = serializers.ListField(child=serializers.IntegerField())
+
+
+@pytest.mark.parametrize("serializer_class", [PricesSerializer, None])
+def test_dict_keys_made_of_digits(serializer_class, exception_context):
+    serializer = PricesSerializer(
+        data={
+            "prices": {"007": "a", "42": "b", "x": "c"},
+            "quantities": ["a", 1, "b"],
+        }
+    )
+    assert not serializer.is_valid()
+    exc = ValidationError(serializer.errors)
+    view = GenericAPIView(serializer_class=serializer_class)
+    context = {**exception_context, "view": view}
+    response = CompactExceptionFormatter(exc, context, exc).run()
+    default_response = ExceptionFormatter(exc, context, exc).run()
+
+    assert "prices.007" in response["attrs"]
+    assert "quantities.INDEX" in response["attrs"]
+    if serializer_class:
+        assert "prices.42" in response["attrs"]
+    decoded = decode_errors(json.loads(json.dumps(response)))
+    assert [error["attr"] for error in decoded] == [
+        error["attr"] for error in default_response["errors"]
+    ]
+
+
+def test_compact_errors_of_view_serializer_with_many(settings):
+    settings.DRF_STANDARDIZED_ERRORS = {
+        "EXCEPTION_FORMATTER_CLASS": "drf_standardized_errors.compact.CompactExceptionFormatter"
+    }
+    request = APIRequestFactory().post(
+        "/bulk-contacts/", [{"email": "invalid"}] * 4, format="json"
+    )
+    response = BulkContactView.as_view()(request)
+    assert response.status_code == 400
+    assert response.data["attrs"] == ["INDEX.email"]
+    assert response.data["errors"] == [[0, 0, 0, [[0, 4]]]]
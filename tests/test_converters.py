@@ -0,0 +1,116 @@
+import pytest
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import IntegrityError
+from rest_framework.exceptions import APIException, NotFound, ValidationError
+
+from drf_standardized_errors import converters
+from drf_standardized_errors.converters import (
+    convert_exception,
+    get_exception_converter,
+    merge_validation_errors,
+    register_exception_converter,
+)
+from drf_standardized_errors.handler import exception_handler
+
+
+class ConflictError(APIException):
+    status_code = 409
+    default_detail = "Conflict."
+    default_code = "conflict"
+
+
+class UpstreamTimeout(Exception):
+    pass
+
+
+class ReadTimeout(UpstreamTimeout):
+    pass
+
+
+class ServiceUnavailable(APIException):
+    status_code = 503
+    default_detail = "Service temporarily unavailable, try again later."
+    default_code = "service_unavailable"
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(converters, "_registry", converters._registry.copy())
+    monkeypatch.setattr(converters, "_cache", (None, {}))
+
+
+def test_exception_converters_setting(settings, api_client):
+    settings.DRF_STANDARDIZED_ERRORS = {
+        "EXCEPTION_CONVERTERS": {
+            "django.db.IntegrityError": "tests.test_converters.ConflictError"
+        }
+    }
+    response = api_client.post("/integrity-error/")
+    assert response.status_code == 409
+    assert response.data["type"] == "client_error"
+    error = response.data["errors"][0]
+    assert error["code"] == "conflict"
+    assert error["detail"] == "Conflict."
+
+
+def test_register_exception_converter(registry, exception_context):
+    @register_exception_converter(UpstreamTimeout)
+    def convert_timeout(exc):
+        return ServiceUnavailable()
+
+    response = exception_handler(ReadTimeout(), exception_context)
+    assert response.status_code == 503
+    assert response.data["errors"][0]["code"] == "service_unavailable"
+
+
+def test_closest_class_in_mro_is_used(registry):
+    register_exception_converter(UpstreamTimeout, ServiceUnavailable)
+    register_exception_converter(ReadTimeout, ConflictError)
+
+    assert get_exception_converter(ReadTimeout) is ConflictError
+    assert get_exception_converter(UpstreamTimeout) is ServiceUnavailable
+
+
+def test_setting_takes_precedence_over_registered_converter(settings, registry):
+    register_exception_converter(ObjectDoesNotExist, ConflictError)
+    assert get_exception_converter(ObjectDoesNotExist) is ConflictError
+
+    settings.DRF_STANDARDIZED_ERRORS = {
+        "EXCEPTION_CONVERTERS": {ObjectDoesNotExist: NotFound}
+    }
+    assert get_exception_converter(ObjectDoesNotExist) is NotFound
+
+
+def test_converter_is_resolved_once_per_exception_type(registry, monkeypatch):
+    assert get_exception_converter(IntegrityError) is None
+
+    monkeypatch.setitem(converters._registry, IntegrityError, ConflictError)
+    # the cached result is returned until the registry or settings change
+    assert get_exception_converter(IntegrityError) is None
+
+    register_exception_converter(UpstreamTimeout, ServiceUnavailable)
+    assert get_exception_converter(IntegrityError) is ConflictError
+
+
+def test_drf_exceptions_are_not_converted(registry):
+    register_exception_converter(Exception, ServiceUnavailable)
+    exc = ValidationError("Invalid.")
+    assert convert_exception(exc) is exc
+    assert isinstance(convert_exception(ReadTimeout()), ServiceUnavailable)
+
+
+def test_merging_validation_errors_does_not_modify_them():
+    first = ValidationError({"addr": {"zip": ["bad"]}, "items": [{"email": ["bad"]}]})
+    second = ValidationError(
+        {"addr": {"zip": ["worse"]}, "items": [{"email": ["worse"]}]}
+    )
+    merged = merge_validation_errors([first, second])
+    assert merged.detail == {
+        "addr": {"zip": ["bad", "worse"]},
+        "items": {0: {"email": ["bad", "worse"]}},
+    }
+    assert first.detail == {"addr": {"zip": ["bad"]}, "items": [{"email": ["bad"]}]}
+    assert second.detail == {
+        "addr": {"zip": ["worse"]},
+        "items": [{"email": ["worse"]}],
+    }
@@ -1,3 +1,4 @@
+import sys
 from unittest.mock import MagicMock
 
 import pytest
@@ -157,3 +158,81 @@ def test_retry_after_header_is_set(api_client):
     assert response.status_code == 429
     retry_after_header = response.headers.get("Retry-After")
     assert retry_after_header == "600"
+
+
+requires_exception_groups = pytest.mark.skipif(
+    sys.version_info < (3, 11), reason="exception groups were added in python 3.11"
+)
+
+
+@requires_exception_groups
+def test_exception_group_validation_errors_are_merged(exception_context):
+    exc = ExceptionGroup(  # noqa: F821
+        "validation",
+        [
+            ValidationError({"name": ["This field is required."]}, code="required"),
+            ExceptionGroup(  # noqa: F821
+                "nested",
+                [
+                    ValidationError({"name": ["Taken."]}, code="taken"),
+                    ValidationError("Over quota.", code="quota"),
+                ],
+            ),
+        ],
+    )
+    response = exception_handler(exc, exception_context)
+    assert response.status_code == 400
+    assert response.data["type"] == "validation_error"
+    assert [(e["code"], e["attr"]) for e in response.data["errors"]] == [
+        ("required", "name"),
+        ("taken", "name"),
+        ("quota", "non_field_errors"),
+    ]
+
+
+@requires_exception_groups
+def test_exception_group_list_item_errors_are_merged_by_index(exception_context):
+    exc = ExceptionGroup(  # noqa: F821
+        "validation",
+        [
+            ValidationError([{}, {"email": ["Invalid."]}]),
+            ValidationError({0: {"email": ["Taken."]}, 1: {"name": ["Required."]}}),
+            ValidationError({"items": [{"email": ["Invalid."]}, {}]}),
+            ValidationError({"items": [{}, {"email": ["Taken."]}]}),
+            ValidationError(["Too many items."]),
+        ],
+    )
+    response = exception_handler(exc, exception_context)
+    assert [(e["detail"], e["attr"]) for e in response.data["errors"]] == [
+        ("Too many items.", "non_field_errors"),
+        ("Invalid.", "1.email"),
+        ("Required.", "1.name"),
+        ("Taken.", "0.email"),
+        ("Invalid.", "items.0.email"),
+        ("Taken.", "items.1.email"),
+    ]
+
+
+@requires_exception_groups
+def test_exception_group_status_is_the_highest_one(exception_context):
+    exc = ExceptionGroup(  # noqa: F821
+        "errors", [ValidationError("Invalid."), Http404(), PermissionDenied()]
+    )
+    response = exception_handler(exc, exception_context)
+    assert response.status_code == 404
+    assert response.data["errors"][0]["code"] == "not_found"
+
+
+@requires_exception_groups
+def test_exception_group_with_unhandled_exception(exception_context):
+    mock = MagicMock()
+    got_request_exception.connect(mock)
+
+    exc = ExceptionGroup(  # noqa: F821
+        "errors", [ValidationError("Invalid."), ValueError(), KeyError()]
+    )
+    response = exception_handler(exc, exception_context)
+    assert response.status_code == 500
+    assert response.data["errors"][0]["detail"] == "Server Error (500)"
+    # the group is reported once
+    assert mock.call_count == 1
@@ -1,8 +1,16 @@
 import pytest
-from rest_framework.exceptions import ErrorDetail
-from rest_framework.test import APIClient
+from rest_framework import serializers
+from rest_framework.exceptions import ErrorDetail, ValidationError
+from rest_framework.test import APIClient, APIRequestFactory
 
-from drf_standardized_errors.formatter import flatten_errors
+from drf_standardized_errors.attr_paths import get_attr_tree
+from drf_standardized_errors.formatter import (
+    GroupedExceptionFormatter,
+    flatten_errors,
+    group_errors,
+)
+
+from .views import BulkContactView
 
 
 @pytest.fixture
@@ -91,6 +99,11 @@ def test_list_serializer_errors(list_serializer_errors):
     assert errors[2].attr == "1.email"
 
 
+def test_list_serializer_errors_as_dict(list_serializer_errors):
+    errors = flatten_errors(dict(enumerate(list_serializer_errors)))
+    assert [error.attr for error in errors] == ["0.name", "0.email", "1.email"]
+
+
 @pytest.fixture
 def nested_list_serializer_error():
     return {
@@ -126,3 +139,74 @@ def test_exception_with_detail_empty():
     assert len(errors) == 1
     assert errors[0].attr == "some_field"
     assert errors[0].detail == ""
+
+
+def test_group_errors():
+    invalid_email = [ErrorDetail("Enter a valid email address.", code="invalid")]
+    required = [ErrorDetail("This field is required.", code="required")]
+    rows = [{"email": invalid_email} for _ in range(3)]
+    rows += [{}, {"email": invalid_email, "name": required}]
+    errors = group_errors(flatten_errors({"items": rows, "name": required}))
+    assert errors == [
+        {"code": "required", "detail": "This field is required.", "attr": "name"},
+        {
+            "code": "invalid",
+            "detail": "Enter a valid email address.",
+            "attr": "items.INDEX.email",
+            "indices": [[0, 3], [4, 5]],
+        },
+        {
+            "code": "required",
+            "detail": "This field is required.",
+            "attr": "items.INDEX.name",
+            "indices": [[4, 5]],
+        },
+    ]
+
+
+def test_group_errors_with_nested_lists(settings):
+    settings.DRF_STANDARDIZED_ERRORS = {"LIST_INDEX_IN_API_SCHEMA": "N"}
+    invalid = [ErrorDetail("Invalid.", code="invalid")]
+    detail = {"rows": [{"cells": [invalid, invalid]}, {}, {"cells": [{}, invalid]}]}
+    errors = group_errors(flatten_errors(detail))
+    assert len(errors) == 1
+    assert errors[0]["attr"] == "rows.N.cells.N"
+    assert errors[0]["indices"] == [[0, 0, 2], [2, 1, 2]]
+
+
+def test_group_errors_keeps_dict_keys():
+    class PricesSerializer(serializers.Serializer):
+        prices = serializers.DictField(child=serializers.IntegerField())
+
+    invalid = [ErrorDetail("Invalid.", code="invalid")]
+    detail = {"prices": {"1": invalid, "2": invalid}}
+    tree = get_attr_tree(PricesSerializer)
+    errors = group_errors(flatten_errors(detail), tree)
+    assert [error["attr"] for error in errors] == ["prices.1", "prices.2"]
+    assert group_errors(flatten_errors(detail))[0]["attr"] == "prices.INDEX"
+
+
+def test_grouped_exception_formatter(exception_context):
+    exc = ValidationError({"items": [{"email": ["Invalid."]}, {"email": ["Invalid."]}]})
+    response = GroupedExceptionFormatter(exc, exception_context, exc).run()
+    assert response["type"] == "validation_error"
+    assert response["errors"][0]["indices"] == [[0, 2]]
+
+
+def test_grouped_errors_of_view_serializer_with_many(settings):
+    settings.DRF_STANDARDIZED_ERRORS = {
+        "EXCEPTION_FORMATTER_CLASS": "drf_standardized_errors.formatter.GroupedExceptionFormatter"
+    }
+    request = APIRequestFactory().post(
+        "/bulk-contacts/", [{"email": "invalid"}] * 4, format="json"
+    )
+    response = BulkContactView.as_view()(request)
+    assert response.status_code == 400
+    assert response.data["errors"] == [
+        {
+            "code": "invalid",
+            "detail": "Enter a valid email address.",
+            "attr": "INDEX.email",
+            "indices": [[0, 4]],
+        }
+    ]
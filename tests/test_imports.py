@@ -0,0 +1,99 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+RUNTIME_MODULES = {
+    "drf_standardized_errors.attr_paths",
+    "drf_standardized_errors.handler",
+    "drf_standardized_errors.converters",
+    "drf_standardized_errors.formatter",
+    "drf_standardized_errors.settings",
+    "drf_standardized_errors.streaming",
+    "drf_standardized_errors.types",
+}
+SCHEMA_DEPENDENCIES = (
+    "drf_spectacular",
+    "inflection",
+    "django_filters",
+    "rest_framework.versioning",
+    "rest_framework.pagination",
+)
+# generous threshold (in microseconds) to catch heavy imports sneaking into
+# the runtime modules without making the test flaky
+MAX_HANDLER_IMPORT_TIME = 100_000
+
+# used when measuring import times since modules imported with importlib (like app
+# configs) are not reported by -X importtime
+INSTALLED_APPS = [
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    "rest_framework",
+]
+
+
+def get_imported_modules(*modules: str) -> Dict[str, int]:
+    """
+    Import the modules in a fresh interpreter after DRF views are imported
+    (as they would be in any project) and return the modules that got imported
+    as a result along with their cumulative import time in microseconds.
+    """
+    code = (
+        "import sys, django;"
+        "from django.conf import settings;"
+        "settings.configure(INSTALLED_APPS=%r);"
+        "django.setup();"
+        "import rest_framework.views;"
+        "sys.stderr.write('START\\n');"
+    ) % (INSTALLED_APPS,) + "".join(f"import {module};" for module in modules)
+    result = run_python("-X", "importtime", "-c", code)
+    _, output = result.stderr.split("START\n")
+    imported = {}
+    for line in output.splitlines():
+        if line.startswith("import time:"):
+            _, cumulative, name = line.split("|")
+            imported[name.strip()] = int(cumulative)
+    return imported
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parent.parent,
+        env={**os.environ, "DJANGO_SETTINGS_MODULE": "tests.settings"},
+    )
+
+
+def test_exception_handler_does_not_import_schema_dependencies():
+    imported = get_imported_modules("drf_standardized_errors.handler")
+
+    package_modules = {m for m in imported if m.startswith("drf_standardized_errors.")}
+    assert package_modules == RUNTIME_MODULES
+    assert not [m for m in imported if m.startswith(SCHEMA_DEPENDENCIES)]
+    assert imported["drf_standardized_errors.handler"] < MAX_HANDLER_IMPORT_TIME
+
+
+def test_extend_validation_errors_does_not_import_schema_generation():
+    """the decorator is imported in view modules which are loaded at runtime"""
+    imported = get_imported_modules("drf_standardized_errors.openapi_validation_errors")
+    assert "drf_spectacular.openapi" not in imported
+    assert "django.test" not in imported
+
+
+def test_app_ready_does_not_import_schema_dependencies():
+    # rest_framework.compat imports optional packages (like inflection) when they
+    # are installed, so only the modules imported after it are checked
+    code = (
+        "import sys, rest_framework.compat; before = set(sys.modules);"
+        "import django; django.setup();"
+        "print('\\n'.join(set(sys.modules) - before))"
+    )
+    imported = run_python("-c", code).stdout.splitlines()
+
+    package_modules = {m for m in imported if m.startswith("drf_standardized_errors.")}
+    assert package_modules == RUNTIME_MODULES | {"drf_standardized_errors.apps"}
+    assert not [m for m in imported if m.startswith(SCHEMA_DEPENDENCIES)]
@@ -0,0 +1,115 @@
+from decimal import Decimal
+
+import pytest
+from django.utils import translation
+from rest_framework import serializers
+
+from drf_standardized_errors import messages
+from drf_standardized_errors.messages import (
+    CachedErrorMessagesMixin,
+    get_error_message,
+    warm_up_error_messages,
+)
+from drf_standardized_errors.warmup import warm_up
+
+
+class CharField(CachedErrorMessagesMixin, serializers.CharField):
+    pass
+
+
+class ListField(CachedErrorMessagesMixin, serializers.ListField):
+    pass
+
+
+class NameSerializer(serializers.Serializer):
+    name = CharField(max_length=5)
+    tags = ListField(child=serializers.CharField(), required=False)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    messages._get_error_message.cache_clear()
+
+
+def test_messages_are_cached_per_language_and_params():
+    message = serializers.CharField.default_error_messages["max_length"]
+    assert get_error_message(message, max_length=5) == (
+        "Ensure this field has no more than 5 characters."
+    )
+    assert get_error_message(message, max_length=5) == (
+        "Ensure this field has no more than 5 characters."
+    )
+    with translation.override("fr"):
+        assert get_error_message(message, max_length=5).startswith(
+            "Assurez-vous que ce champ comporte au plus 5"
+        )
+    assert get_error_message(message, max_length=10) == (
+        "Ensure this field has no more than 10 characters."
+    )
+
+    info = messages._get_error_message.cache_info()
+    assert info.hits == 1
+    assert info.misses == 3
+
+
+def test_unhashable_params_are_not_cached():
+    message = "Invalid input: {input}."
+    assert get_error_message(message, input=[1]) == "Invalid input: [1]."
+    assert messages._get_error_message.cache_info().currsize == 0
+
+
+def test_equal_params_of_other_types_are_cached_separately():
+    message = serializers.IntegerField.default_error_messages["max_value"]
+    assert get_error_message(message, max_value=Decimal("10")) == (
+        "Ensure this value is less than or equal to 10."
+    )
+    assert get_error_message(message, max_value=10.0) == (
+        "Ensure this value is less than or equal to 10.0."
+    )
+    assert get_error_message(message, max_value=True) == (
+        "Ensure this value is less than or equal to True."
+    )
+    assert get_error_message(message, max_value=1) == (
+        "Ensure this value is less than or equal to 1."
+    )
+    assert messages._get_error_message.cache_info().currsize == 4
+
+
+def test_messages_with_input_are_not_cached():
+    message = serializers.ChoiceField.default_error_messages["invalid_choice"]
+    assert get_error_message(message, input="x") == '"x" is not a valid choice.'
+    assert messages._get_error_message.cache_info().currsize == 0
+
+
+def test_cached_error_messages_mixin():
+    serializer = NameSerializer(data={"name": "", "tags": "not a list"})
+    assert not serializer.is_valid()
+    assert serializer.errors["name"][0].code == "blank"
+    assert serializer.errors["name"][0] == "This field may not be blank."
+    assert serializer.errors["tags"][0].code == "not_a_list"
+    assert messages._get_error_message.cache_info().currsize == 2
+
+
+def test_missing_error_message():
+    with pytest.raises(AssertionError, match="ValidationError raised by `CharField`"):
+        CharField().fail("unknown")
+
+
+def test_warm_up_error_messages():
+    with translation.override("en"):
+        warm_up_error_messages()
+    size = messages._get_error_message.cache_info().currsize
+    assert size > 10
+
+    warm_up(["en", "fr"])
+    assert messages._get_error_message.cache_info().currsize == 2 * size
+
+
+def test_messages_are_not_warmed_up_for_all_languages(settings):
+    settings.USE_I18N = True
+    warm_up()
+    assert messages._get_error_message.cache_info().currsize == 0
+
+    settings.DRF_STANDARDIZED_ERRORS = {"WARM_UP_LANGUAGES": ["en"]}
+    warm_up()
+    assert messages._get_error_message.cache_info().currsize > 10
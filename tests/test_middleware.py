@@ -0,0 +1,124 @@
+import json
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+from django.core.exceptions import PermissionDenied, SuspiciousOperation
+from django.core.signals import got_request_exception
+from django.test import Client
+
+from drf_standardized_errors.handler import ExceptionHandler
+from drf_standardized_errors.views import bad_request, permission_denied
+
+MIDDLEWARE = ["drf_standardized_errors.middleware.StandardizedErrorsMiddleware"]
+
+
+@pytest.fixture
+def client():
+    return Client(raise_request_exception=False)
+
+
+def test_not_found_in_django_view(settings, client):
+    settings.MIDDLEWARE = MIDDLEWARE
+    response = client.get("/django-view/not-found/")
+    assert response.status_code == 404
+    assert response["Content-Type"] == "application/json"
+    assert response.json() == {
+        "type": "client_error",
+        "errors": [
+            {"code": "not_found", "detail": "Not found.", "attr": None},
+        ],
+    }
+
+
+def test_permission_denied_in_django_view(settings, client):
+    settings.MIDDLEWARE = MIDDLEWARE
+    response = client.get("/django-view/permission-denied/")
+    assert response.status_code == 403
+    assert response.json()["errors"][0]["code"] == "permission_denied"
+
+
+def test_server_error_in_django_view(settings, client):
+    settings.MIDDLEWARE = MIDDLEWARE
+    mock = MagicMock()
+    got_request_exception.connect(mock)
+
+    response = client.get("/django-view/server-error/")
+    assert response.status_code == 500
+    error = response.json()["errors"][0]
+    assert error["code"] == "error"
+    assert error["detail"] == "Server Error (500)"
+    assert mock.call_args.kwargs["request"].path == "/django-view/server-error/"
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 11), reason="exception groups were added in python 3.11"
+)
+def test_exception_group_in_django_view(settings, client):
+    settings.MIDDLEWARE = MIDDLEWARE
+    response = client.get("/django-view/exception-group/")
+    assert response.status_code == 404
+    assert response.json()["errors"][0]["code"] == "not_found"
+
+
+def test_unhandled_exception_in_debug_is_left_to_django(settings, client):
+    settings.MIDDLEWARE = MIDDLEWARE
+    settings.DEBUG = True
+    response = client.get("/django-view/server-error/")
+    assert response.status_code == 500
+    assert response["Content-Type"].startswith("text/html")
+
+
+def test_drf_views_are_not_affected(settings, client):
+    settings.MIDDLEWARE = MIDDLEWARE
+    response = client.post(
+        "/order-error/", data={"shipping_address": {}}, content_type="application/json"
+    )
+    assert response.status_code == 400
+    assert response.json()["type"] == "validation_error"
+
+
+class CustomExceptionHandler(ExceptionHandler):
+    def get_response(self, exc, data):
+        response = super().get_response(exc, data)
+        response["X-Error-Type"] = data["type"]
+        return response
+
+
+def test_custom_handler_in_django_view(settings, client):
+    settings.MIDDLEWARE = MIDDLEWARE
+    settings.DRF_STANDARDIZED_ERRORS = {
+        "EXCEPTION_HANDLER_CLASS": "tests.test_middleware.CustomExceptionHandler"
+    }
+    response = client.get("/django-view/not-found/")
+    assert response.status_code == 404
+    assert response["X-Error-Type"] == "client_error"
+
+    response = client.get("/unknown-url/")
+    assert response["X-Error-Type"] == "client_error"
+
+
+def test_page_not_found_view(client):
+    response = client.get("/unknown-url/")
+    assert response.status_code == 404
+    assert response.json()["errors"][0]["code"] == "not_found"
+
+
+def test_server_error_view(client):
+    # without the middleware, django calls handler500
+    response = client.get("/django-view/server-error/")
+    assert response.status_code == 500
+    error = response.json()["errors"][0]
+    assert error["detail"] == "Server Error (500)"
+
+
+def test_bad_request_view(rf):
+    response = bad_request(rf.get("/"), SuspiciousOperation("Invalid header."))
+    assert response.status_code == 400
+    assert json.loads(response.content)["errors"][0]["code"] == "parse_error"
+
+
+def test_permission_denied_view(rf):
+    response = permission_denied(rf.get("/"), PermissionDenied())
+    assert response.status_code == 403
+    assert json.loads(response.content)["errors"][0]["code"] == "permission_denied"
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+from rest_framework.exceptions import ErrorDetail, ValidationError
+
+from drf_standardized_errors.formatter import (
+    ExceptionFormatter,
+    GroupedExceptionFormatter,
+    is_minimal_errors_requested,
+)
+
+
+@pytest.fixture
+def minimal_errors(settings):
+    settings.DRF_STANDARDIZED_ERRORS = {"ENABLE_MINIMAL_ERRORS": True}
+
+
+def test_minimal_errors_with_prefer_header(minimal_errors, api_client):
+    response = api_client.post(
+        "/order-error/", data={}, format="json", HTTP_PREFER="errors=minimal"
+    )
+    assert response.status_code == 400
+    assert response.json() == {
+        "type": "validation_error",
+        "errors": [{"code": "required", "attr": "shipping_address"}],
+    }
+
+
+def test_minimal_errors_with_query_param(minimal_errors, api_client):
+    response = api_client.get("/error/?errors=minimal")
+    assert response.status_code == 500
+    assert response.json() == {
+        "type": "server_error",
+        "errors": [{"code": "error", "attr": None}],
+    }
+
+
+def test_minimal_errors_are_opt_in(api_client):
+    response = api_client.get("/error/?errors=minimal")
+    assert response.json()["errors"][0]["detail"] == "Server Error (500)"
+
+
+@pytest.mark.parametrize(
+    "prefer,expected",
+    [
+        ("errors=minimal", True),
+        ('respond-async, errors="minimal"; strict', True),
+        ("Errors=Minimal", True),
+        ("errors=full", False),
+        ("return=minimal", False),
+        ("", False),
+    ],
+)
+def test_prefer_header(rf, prefer, expected):
+    request = rf.get("/", HTTP_PREFER=prefer)
+    assert is_minimal_errors_requested(request) is expected
+
+
+def test_minimal_errors_stream(minimal_errors, rf, exception_context):
+    detail = ErrorDetail(
+        "Ensure this field has no more than 5 characters.", "max_length"
+    )
+    exc = ValidationError({"name": [detail]})
+    exception_context["request"] = rf.get("/", HTTP_PREFER="errors=minimal")
+
+    response = ExceptionFormatter(exc, exception_context, exc).run()
+    assert response["errors"] == [{"code": "max_length", "attr": "name"}]
+    chunks = ExceptionFormatter(exc, exception_context, exc).stream()
+    assert json.loads(b"".join(chunks)) == response
+
+
+def test_minimal_errors_headers(minimal_errors, api_client):
+    response = api_client.get("/error/", HTTP_PREFER="errors=minimal")
+    assert "Prefer" in response["Vary"]
+    assert response["Preference-Applied"] == "errors=minimal"
+
+    response = api_client.get("/error/")
+    assert "Prefer" in response["Vary"]
+    assert not response.has_header("Preference-Applied")
+
+
+def test_no_minimal_errors_headers_when_disabled(api_client):
+    response = api_client.get("/error/", HTTP_PREFER="errors=minimal")
+    assert "Prefer" not in response.get("Vary", "")
+    assert not response.has_header("Preference-Applied")
+
+
+def test_customized_formatter_ignores_minimal_errors(
+    minimal_errors, rf, exception_context
+):
+    exc = ValidationError({"name": ["This field is required."]})
+    exception_context["request"] = rf.get("/", HTTP_PREFER="errors=minimal")
+    response = GroupedExceptionFormatter(exc, exception_context, exc).run()
+    assert response["errors"][0]["detail"] == "This field is required."
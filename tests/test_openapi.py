@@ -29,6 +29,7 @@ from rest_framework.response import Response
 from rest_framework.throttling import AnonRateThrottle
 from rest_framework.versioning import AcceptHeaderVersioning, URLPathVersioning
 from rest_framework.views import APIView
+from rest_framework.viewsets import ModelViewSet
 
 from drf_standardized_errors.openapi import AutoSchema
 from drf_standardized_errors.openapi_serializers import ClientErrorEnum
@@ -55,6 +56,23 @@ def test_parse_error():
     assert "400" in responses
 
 
+def test_error_renderers_media_types(settings):
+    settings.DRF_STANDARDIZED_ERRORS = {
+        "ERROR_RENDERER_CLASSES": [
+            "drf_standardized_errors.renderers.MessagePackRenderer"
+        ]
+    }
+    route = "parse/"
+    view = DummyView.as_view(parser_classes=[JSONParser])
+    schema = generate_view_schema(route, view)
+    responses = get_responses(schema, route)
+    assert list(responses["400"]["content"]) == [
+        "application/json",
+        "application/msgpack",
+    ]
+    assert list(responses["200"]["content"]) == ["application/json"]
+
+
 class CustomParser(BaseParser):
     def parse(self, stream, media_type=None, parser_context=None):
         return {}
@@ -328,6 +346,47 @@ def test_no_403_error_when_is_authenticated():
     assert "403" not in responses
 
 
+class PermissionsViewSet(ModelViewSet):
+    serializer_class = UserSerializer
+    queryset = User.objects.all()
+    authentication_classes = [BasicAuthentication]
+
+    def get_permissions(self):
+        if self.action == "list":
+            return [AllowAny()]
+        return [IsAdminUser()]
+
+
+def test_view_error_responses_computed_once_per_view(monkeypatch):
+    calls = []
+    build_view_error_responses = AutoSchema._build_view_error_responses
+
+    def _build_view_error_responses(self):
+        calls.append(self.view.action)
+        return build_view_error_responses(self)
+
+    monkeypatch.setattr(
+        AutoSchema, "_build_view_error_responses", _build_view_error_responses
+    )
+    route = "users/"
+
+    class UserViewSet(ModelViewSet):
+        serializer_class = UserSerializer
+        queryset = User.objects.all()
+
+    view = UserViewSet.as_view({"get": "list", "post": "create"})
+    generate_view_schema(route, view)
+    assert len(calls) == 1
+
+
+def test_view_error_responses_with_overridden_getters():
+    route = "users/"
+    view = PermissionsViewSet.as_view({"get": "list", "post": "create"})
+    schema = generate_view_schema(route, view)
+    assert "403" not in get_responses(schema, route, "get")
+    assert "403" in get_responses(schema, route, "post")
+
+
 class DummyListView(GenericAPIView):
     def get(self, request, *args, **kwargs):
         return Response(status=204)
@@ -7,6 +7,7 @@ from django import forms
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
 from django.core.validators import FileExtensionValidator
+from django.utils import translation
 from django_filters import CharFilter
 from django_filters.rest_framework import DjangoFilterBackend, FilterSet
 from drf_spectacular.plumbing import build_mock_request
@@ -18,6 +19,7 @@ from drf_standardized_errors.openapi_utils import (
     InputDataField,
     _drf_version,
     get_django_filter_backends,
+    get_error_examples_by_status_code,
     get_error_serializer,
     get_filter_forms,
     get_flat_serializer_fields,
@@ -521,6 +523,19 @@ def test_get_filter_forms(filter_view):
     assert "username" in form.fields
 
 
+def test_filter_forms_are_reused_across_operations(filter_view):
+    backends = get_django_filter_backends([DjangoFilterBackend])
+    (backend,) = backends
+    assert get_django_filter_backends([DjangoFilterBackend]) == [backend]
+
+    (form,) = get_filter_forms(filter_view, backends)
+    generator = SchemaGenerator()
+    view = generator.create_view(FilterView.as_view(), "get")
+    view.request = build_mock_request("get", "filter/", view, None)
+    (other_form,) = get_filter_forms(view, backends)
+    assert other_form is form
+
+
 @pytest.fixture
 def filter_view_no_model():
     generator = SchemaGenerator()
@@ -687,3 +702,22 @@ def test_updated_dict_index_in_api_schema(settings):
     fields = get_flat_serializer_fields(DictSerializer())
     expected_fields = {"non_field_errors", "d", "d.DICT_KEY"}
     assert {field.name for field in fields} == expected_fields
+
+
+def test_error_examples_are_cached_per_language():
+    with translation.override("en"):
+        examples = get_error_examples_by_status_code()
+        assert get_error_examples_by_status_code() is examples
+        assert [example.name for example in examples["401"]] == [
+            "AuthenticationFailed",
+            "NotAuthenticated",
+        ]
+        (example,) = examples["403"]
+        detail = example.value["errors"][0]["detail"]
+        assert detail == "You do not have permission to perform this action."
+
+    with translation.override("fr"):
+        fr_examples = get_error_examples_by_status_code()
+        assert fr_examples is not examples
+        (example,) = fr_examples["403"]
+        assert example.value["errors"][0]["detail"] != detail
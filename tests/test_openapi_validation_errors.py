@@ -9,7 +9,10 @@ from rest_framework.response import Response
 from rest_framework.versioning import URLPathVersioning
 from rest_framework.viewsets import ModelViewSet
 
-from drf_standardized_errors.openapi_validation_errors import extend_validation_errors
+from drf_standardized_errors.openapi_validation_errors import (
+    extend_validation_errors,
+    get_validation_errors,
+)
 
 from .utils import generate_versioned_view_schema, generate_view_schema, get_error_codes
 
@@ -423,6 +426,29 @@ def test_overriding_inherited_validation_errors(child_viewset):
     assert "parent_error" not in error_codes
 
 
+def test_child_view_only_stores_its_own_validation_errors(child_viewset):
+    extend_validation_errors(["child_error"], field_name="first_name")(child_viewset)
+
+    parent_viewset = child_viewset.__bases__[0]
+    parent_errors = vars(parent_viewset)["_standardized_errors"]
+    child_errors = vars(child_viewset)["_standardized_errors"]
+    assert [e.error_codes for e in parent_errors["first_name"]] == [{"parent_error"}]
+    assert [e.error_codes for e in child_errors["first_name"]] == [{"child_error"}]
+
+    errors = get_validation_errors(child_viewset())
+    error_codes = [e.error_codes for e in errors["first_name"]]
+    assert error_codes == [{"parent_error"}, {"child_error"}]
+
+
+def test_errors_added_to_parent_later_are_inherited(child_viewset):
+    extend_validation_errors(["child_error"], field_name="first_name")(child_viewset)
+    parent_viewset = child_viewset.__bases__[0]
+    extend_validation_errors(["late_error"], field_name="last_name")(parent_viewset)
+
+    errors = get_validation_errors(child_viewset())
+    assert [e.error_codes for e in errors["last_name"]] == [{"late_error"}]
+
+
 @pytest.fixture
 def delete_view():
     class ValidationView(DestroyAPIView):
@@ -0,0 +1,91 @@
+import pytest
+from django.urls import path
+from rest_framework.exceptions import ValidationError
+from rest_framework.views import APIView
+
+from drf_standardized_errors import pagination
+from drf_standardized_errors.pagination import ErrorPageView
+
+
+class BulkErrorView(APIView):
+    def post(self, request, *args, **kwargs):
+        raise ValidationError({"items": [{"email": ["Invalid."]} for _ in range(25)]})
+
+
+urlpatterns = [
+    path("bulk-error/", BulkErrorView.as_view()),
+    path("errors/", ErrorPageView.as_view()),
+]
+
+
+@pytest.fixture(autouse=True)
+def paginated_errors(settings):
+    settings.DRF_STANDARDIZED_ERRORS = {
+        "EXCEPTION_FORMATTER_CLASS": "drf_standardized_errors.pagination.PaginatedExceptionFormatter",
+        "ERRORS_PAGE_SIZE": 10,
+    }
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+
+
+@pytest.mark.urls(__name__)
+def test_paginated_errors(api_client):
+    response = api_client.post("/bulk-error/")
+    assert response.status_code == 400
+    assert response.data["type"] == "validation_error"
+    attrs = [error["attr"] for error in response.data["errors"]]
+    assert attrs == [f"items.{index}.email" for index in range(10)]
+
+    token = response.data["next"]
+    while token:
+        response = api_client.get("/errors/", {"token": token})
+        assert response.status_code == 200
+        assert response.data["type"] == "validation_error"
+        attrs.extend(error["attr"] for error in response.data["errors"])
+        token = response.data["next"]
+
+    assert attrs == [f"items.{index}.email" for index in range(25)]
+    assert response.data["errors"][-1] == {
+        "code": "invalid",
+        "detail": "Invalid.",
+        "attr": "items.24.email",
+    }
+
+
+@pytest.mark.urls(__name__)
+def test_no_token_when_errors_fit_in_one_page(settings, api_client):
+    settings.DRF_STANDARDIZED_ERRORS = {
+        **settings.DRF_STANDARDIZED_ERRORS,
+        "ERRORS_PAGE_SIZE": 25,
+    }
+    response = api_client.post("/bulk-error/")
+    assert len(response.data["errors"]) == 25
+    assert response.data["next"] is None
+
+
+@pytest.mark.urls(__name__)
+def test_all_errors_are_returned_when_the_cache_fails(api_client, monkeypatch):
+    def fail(*args, **kwargs):
+        raise ConnectionError("cache is down")
+
+    monkeypatch.setattr(pagination.get_cache(), "set", fail)
+    response = api_client.post("/bulk-error/")
+    assert response.status_code == 400
+    assert len(response.data["errors"]) == 25
+    assert response.data["next"] is None
+
+
+@pytest.mark.urls(__name__)
+@pytest.mark.parametrize("token", ["unknown.0", "unknown", "unknown.x"])
+def test_invalid_token(api_client, token):
+    response = api_client.get("/errors/", {"token": token})
+    assert response.status_code == 404
+    assert response.data["errors"][0]["code"] == "invalid_token"
+
+
+@pytest.mark.urls(__name__)
+def test_missing_token(api_client):
+    response = api_client.get("/errors/")
+    assert response.status_code == 400
+    assert response.data["errors"][0]["attr"] == "token"
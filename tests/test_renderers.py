@@ -0,0 +1,103 @@
+import pytest
+from django.urls import path
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from drf_standardized_errors.compact import CompactExceptionFormatter
+from drf_standardized_errors.renderers import CBORRenderer, MessagePackRenderer
+
+msgpack = pytest.importorskip("msgpack")
+cbor2 = pytest.importorskip("cbor2")
+
+
+class BinaryErrorView(APIView):
+    renderer_classes = [JSONRenderer]
+
+    def get(self, request, *args, **kwargs):
+        raise ValidationError({"email": ["Enter a valid email address."]})
+
+
+class SuccessView(APIView):
+    renderer_classes = [JSONRenderer]
+
+    def get(self, request, *args, **kwargs):
+        return Response({"email": "a@example.com"})
+
+
+urlpatterns = [
+    path("binary-error/", BinaryErrorView.as_view()),
+    path("success/", SuccessView.as_view()),
+]
+
+
+@pytest.fixture(autouse=True)
+def error_renderers(settings):
+    settings.DRF_STANDARDIZED_ERRORS = {
+        "ERROR_RENDERER_CLASSES": [
+            "drf_standardized_errors.renderers.MessagePackRenderer",
+            "drf_standardized_errors.renderers.CBORRenderer",
+        ]
+    }
+
+
+expected_response = {
+    "type": "validation_error",
+    "errors": [
+        {"code": "invalid", "detail": "Enter a valid email address.", "attr": "email"}
+    ],
+}
+
+
+@pytest.mark.urls(__name__)
+def test_msgpack_error_response(api_client):
+    response = api_client.get(
+        "/binary-error/", HTTP_ACCEPT="application/msgpack, application/json"
+    )
+    assert response.status_code == 400
+    assert response["Content-Type"] == "application/msgpack"
+    assert msgpack.unpackb(response.content) == expected_response
+
+
+@pytest.mark.urls(__name__)
+def test_cbor_error_response(api_client):
+    response = api_client.get(
+        "/binary-error/", HTTP_ACCEPT="application/cbor, application/json"
+    )
+    assert response.status_code == 400
+    assert response["Content-Type"] == "application/cbor"
+    assert cbor2.loads(response.content) == expected_response
+
+
+@pytest.mark.urls(__name__)
+def test_view_renderer_is_preferred(api_client):
+    response = api_client.get(
+        "/binary-error/", HTTP_ACCEPT="application/json, application/msgpack"
+    )
+    assert response["Content-Type"] == "application/json"
+    assert response.json() == expected_response
+
+
+@pytest.mark.urls(__name__)
+def test_error_renderers_are_only_used_for_errors(api_client):
+    response = api_client.get("/success/", HTTP_ACCEPT="application/msgpack, */*")
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/json"
+
+    response = api_client.get("/binary-error/", HTTP_ACCEPT="*/*")
+    assert response["Content-Type"] == "application/json"
+
+    # the content negotiation of the view fails
+    response = api_client.get("/success/", HTTP_ACCEPT="application/msgpack")
+    assert response.status_code == 406
+    assert response["Content-Type"] == "application/msgpack"
+    assert msgpack.unpackb(response.content)["errors"][0]["code"] == "not_acceptable"
+
+
+@pytest.mark.parametrize("renderer_class", [MessagePackRenderer, CBORRenderer])
+def test_bulk_errors_with_compact_formatter(renderer_class, exception_context):
+    exc = ValidationError([{"email": ["Invalid."]} for _ in range(1000)])
+    data = CompactExceptionFormatter(exc, exception_context, exc).run()
+    content = renderer_class().render(data)
+    assert len(content) < 150
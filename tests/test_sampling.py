@@ -0,0 +1,218 @@
+import logging
+import queue
+import threading
+
+import pytest
+from django.urls import path
+from rest_framework import serializers
+from rest_framework.generics import GenericAPIView
+from rest_framework.response import Response
+
+from drf_standardized_errors import sampling
+from drf_standardized_errors.openapi_validation_errors import extend_validation_errors
+from drf_standardized_errors.sampling import (
+    get_dropped_report_count,
+    get_undocumented_error_counts,
+    wait_for_reports,
+)
+
+
+class ItemSerializer(serializers.Serializer):
+    email = serializers.EmailField()
+
+    def validate_email(self, value):
+        if value.endswith("@example.org"):
+            raise serializers.ValidationError("Domain not allowed.", code="domain")
+        return value
+
+
+class ImportSerializer(serializers.Serializer):
+    name = serializers.CharField()
+    items = ItemSerializer(many=True)
+
+    def validate_name(self, value):
+        if value == "taken":
+            raise serializers.ValidationError("Name is taken.", code="taken")
+        return value
+
+
+class ImportView(GenericAPIView):
+    serializer_class = ImportSerializer
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return Response(status=204)
+
+
+@extend_validation_errors(["taken"], field_name="name", methods=["post"])
+class DocumentedImportView(ImportView):
+    pass
+
+
+class BulkItemView(GenericAPIView):
+    serializer_class = ItemSerializer
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        return Response(status=204)
+
+
+urlpatterns = [
+    path("imports/", ImportView.as_view()),
+    path("imports/<int:pk>/", ImportView.as_view()),
+    path("item-imports/", ImportView.as_view(serializer_class=ItemSerializer)),
+    path("bulk-items/", BulkItemView.as_view()),
+    path("documented-imports/", DocumentedImportView.as_view()),
+]
+
+
+@pytest.fixture(autouse=True)
+def sampling_state(monkeypatch, settings):
+    settings.DRF_STANDARDIZED_ERRORS = {"UNDOCUMENTED_ERRORS_SAMPLE_RATE": 1}
+    monkeypatch.setattr(sampling, "_counts", sampling.Counter())
+    monkeypatch.setattr(
+        sampling, "_documented_error_codes", sampling.WeakKeyDictionary()
+    )
+
+
+def post(api_client, url, data):
+    response = api_client.post(url, data=data, format="json")
+    assert response.status_code == 400
+    wait_for_reports()
+
+
+@pytest.mark.urls(__name__)
+def test_undocumented_error_codes_are_counted(api_client, caplog):
+    data = {
+        "name": "taken",
+        "items": [{"email": "a@example.com"}, {"email": "b@example.org"}],
+    }
+    with caplog.at_level(logging.WARNING, logger="drf_standardized_errors.sampling"):
+        post(api_client, "/imports/", data)
+        post(api_client, "/imports/", data)
+
+    assert get_undocumented_error_counts() == {
+        ("POST imports/", "name", "taken"): 2,
+        ("POST imports/", "items.INDEX.email", "domain"): 2,
+    }
+    # logged once per undocumented error
+    assert caplog.text.count("undocumented error code") == 2
+    assert "POST imports/ attr=items.INDEX.email code=domain" in caplog.text
+
+
+@pytest.mark.urls(__name__)
+def test_documented_error_codes_are_not_counted(api_client):
+    post(api_client, "/documented-imports/", {"name": "taken", "items": []})
+    post(api_client, "/imports/", {"items": [{"email": "invalid"}]})
+    assert get_undocumented_error_counts() == {}
+
+
+@pytest.mark.urls(__name__)
+def test_documented_error_codes_are_computed_once_per_operation(
+    api_client, monkeypatch
+):
+    calls = []
+    compute = sampling.compute_documented_error_codes
+
+    def compute_documented_error_codes(sampled_error):
+        calls.append(sampled_error.view_class)
+        return compute(sampled_error)
+
+    monkeypatch.setattr(
+        sampling, "compute_documented_error_codes", compute_documented_error_codes
+    )
+    post(api_client, "/imports/", {})
+    post(api_client, "/imports/", {"name": "taken"})
+    assert calls == [ImportView]
+
+
+@pytest.mark.urls(__name__)
+def test_documented_error_codes_are_computed_per_view_function_and_route(
+    api_client,
+):
+    post(api_client, "/imports/", {"items": []})
+    post(api_client, "/imports/1/", {"items": []})
+    # same view class with another serializer class
+    post(api_client, "/item-imports/", {})
+    assert get_undocumented_error_counts() == {}
+    assert len(sampling._documented_error_codes) == 3
+
+
+@pytest.mark.urls(__name__)
+def test_errors_of_view_serializer_with_many_share_the_attr_template(api_client):
+    data = [{"email": "a@example.org"}] * 3
+    response = api_client.post("/bulk-items/", data=data, format="json")
+    assert response.status_code == 400
+    wait_for_reports()
+    assert get_undocumented_error_counts() == {
+        ("POST bulk-items/", "INDEX.email", "domain"): 1
+    }
+
+
+@pytest.mark.urls(__name__)
+def test_documented_error_codes_are_computed_in_the_background(api_client, monkeypatch):
+    threads = []
+    compute = sampling.compute_documented_error_codes
+
+    def compute_documented_error_codes(sampled_error):
+        threads.append(threading.current_thread())
+        return compute(sampled_error)
+
+    monkeypatch.setattr(
+        sampling, "compute_documented_error_codes", compute_documented_error_codes
+    )
+    post(api_client, "/imports/", {})
+    assert threads
+    assert threading.current_thread() not in threads
+
+
+@pytest.mark.urls(__name__)
+def test_route_template_is_the_schema_path(api_client, monkeypatch):
+    paths = []
+    get_operation_schema = sampling.get_operation_schema
+
+    def get_schema(view, path, method):
+        paths.append(path)
+        return get_operation_schema(view, path, method)
+
+    monkeypatch.setattr(sampling, "get_operation_schema", get_schema)
+    post(api_client, "/imports/42/", {"name": "taken", "items": []})
+    assert paths == ["/imports/{pk}/"]
+    assert (
+        "POST imports/<int:pk>/",
+        "name",
+        "taken",
+    ) in get_undocumented_error_counts()
+
+
+@pytest.mark.urls(__name__)
+def test_counted_errors_are_capped(api_client, monkeypatch):
+    monkeypatch.setattr(sampling, "MAX_COUNTED_ERRORS", 1)
+    data = {"name": "taken", "items": [{"email": "a@example.org"}]}
+    post(api_client, "/imports/", data)
+    post(api_client, "/imports/", data)
+    counts = get_undocumented_error_counts()
+    assert len(counts) == 1
+    assert list(counts.values()) == [2]
+
+
+@pytest.mark.urls(__name__)
+def test_sampled_errors_are_dropped_when_the_queue_is_full(api_client, monkeypatch):
+    monkeypatch.setattr(sampling, "_reports", queue.Queue(maxsize=1))
+    monkeypatch.setattr(sampling, "_dropped_reports", 0)
+    # no worker consumes the queue
+    monkeypatch.setattr(sampling, "_worker", threading.current_thread())
+    for _ in range(3):
+        response = api_client.post("/imports/", data={}, format="json")
+        assert response.status_code == 400
+    assert sampling._reports.qsize() == 1
+    assert get_dropped_report_count() == 2
+
+
+@pytest.mark.urls(__name__)
+def test_sampling_is_disabled_by_default(api_client, settings):
+    settings.DRF_STANDARDIZED_ERRORS = {}
+    post(api_client, "/imports/", {"name": "taken", "items": []})
+    assert get_undocumented_error_counts() == {}
@@ -1,8 +1,10 @@
+import pytest
 from django.db import IntegrityError
 from rest_framework.exceptions import APIException
 
 from drf_standardized_errors.formatter import ExceptionFormatter
 from drf_standardized_errors.handler import ExceptionHandler, exception_handler
+from drf_standardized_errors.settings import package_settings
 from drf_standardized_errors.types import ErrorResponse
 
 
@@ -100,3 +102,33 @@ def test_nested_field_separator(settings, api_client):
     error = response.data["errors"][0]
     assert error["code"] == "unsupported"
     assert error["attr"] == "shipping_address__state"
+
+
+def test_settings_snapshot_is_swapped_when_settings_change(settings):
+    snapshot = package_settings.snapshot
+    settings.DRF_STANDARDIZED_ERRORS = {
+        "NESTED_FIELD_SEPARATOR": "__",
+        "EXCEPTION_HANDLER_CLASS": "tests.test_settings.CustomExceptionHandler",
+    }
+
+    assert package_settings.snapshot is not snapshot
+    assert package_settings.NESTED_FIELD_SEPARATOR == "__"
+    assert package_settings.EXCEPTION_HANDLER_CLASS is CustomExceptionHandler
+    # readers holding on to the previous snapshot still get consistent values
+    assert snapshot.NESTED_FIELD_SEPARATOR == "."
+    assert snapshot.EXCEPTION_HANDLER_CLASS is ExceptionHandler
+
+
+def test_settings_snapshot_is_immutable():
+    with pytest.raises(AttributeError):
+        package_settings.snapshot.NESTED_FIELD_SEPARATOR = "__"
+
+
+def test_settings_are_resolved_when_app_is_ready():
+    assert package_settings._snapshot is not None
+    assert package_settings.warm() is package_settings.snapshot
+
+
+def test_invalid_setting():
+    with pytest.raises(AttributeError):
+        package_settings.INVALID_SETTING
@@ -0,0 +1,151 @@
+import asyncio
+import json
+
+import pytest
+from django.http import StreamingHttpResponse
+from django.test import AsyncRequestFactory
+from rest_framework import serializers
+from rest_framework.exceptions import ErrorDetail, ValidationError
+
+from drf_standardized_errors.compact import CompactExceptionFormatter
+from drf_standardized_errors.formatter import ExceptionFormatter, iter_chunked_errors
+from drf_standardized_errors.handler import exception_handler
+from drf_standardized_errors.streaming import get_ndjson_response, iter_json_chunks
+
+
+@pytest.fixture
+def streaming_responses(settings):
+    settings.DRF_STANDARDIZED_ERRORS = {"ENABLE_STREAMING_RESPONSES": True}
+
+
+@pytest.fixture
+def bulk_error():
+    invalid_email = [ErrorDetail("Enter a valid email address.", code="invalid")]
+    return ValidationError([{"email": invalid_email} for _ in range(5000)])
+
+
+def get_content(response):
+    return json.loads(b"".join(response.streaming_content))
+
+
+def test_validation_errors_are_streamed(streaming_responses, api_client):
+    response = api_client.post("/order-error/", data={}, format="json")
+    assert isinstance(response, StreamingHttpResponse)
+    assert response.status_code == 400
+    assert response["Content-Type"] == "application/json"
+    assert get_content(response) == {
+        "type": "validation_error",
+        "errors": [
+            {
+                "code": "required",
+                "detail": "This field is required.",
+                "attr": "shipping_address",
+            }
+        ],
+    }
+
+
+def test_other_errors_are_not_streamed(streaming_responses, api_client):
+    response = api_client.get("/error/")
+    assert not isinstance(response, StreamingHttpResponse)
+    assert response.status_code == 500
+
+
+def test_streaming_is_disabled_by_default(api_client):
+    response = api_client.post("/order-error/", data={}, format="json")
+    assert not isinstance(response, StreamingHttpResponse)
+
+
+def test_streamed_content_matches_default_format(bulk_error, exception_context):
+    formatter = ExceptionFormatter(bulk_error, exception_context, bulk_error)
+    chunks = list(formatter.stream())
+    assert len(chunks) > 1
+    assert json.loads(b"".join(chunks)) == formatter.run()
+
+
+def test_customized_formatter_is_encoded_in_one_chunk(bulk_error, exception_context):
+    formatter = CompactExceptionFormatter(bulk_error, exception_context, bulk_error)
+    chunks = list(formatter.stream())
+    assert len(chunks) == 1
+    assert json.loads(chunks[0]) == formatter.run()
+
+
+def test_empty_errors():
+    assert json.loads(b"".join(iter_json_chunks("client_error", []))) == {
+        "type": "client_error",
+        "errors": [],
+    }
+
+
+def test_async_iterator_for_asgi_requests(streaming_responses, bulk_error):
+    request = AsyncRequestFactory().post("/order-error/")
+    context = {"view": None, "args": (), "kwargs": {}, "request": request}
+    response = exception_handler(bulk_error, context)
+    assert response.is_async
+
+    async def consume():
+        return b"".join([chunk async for chunk in response.streaming_content])
+
+    content = asyncio.run(consume())
+    assert len(json.loads(content)["errors"]) == 5000
+
+
+class ItemSerializer(serializers.Serializer):
+    email = serializers.EmailField()
+
+
+def validate_in_chunks(rows, chunk_size):
+    for offset in range(0, len(rows), chunk_size):
+        serializer = ItemSerializer(data=rows[offset : offset + chunk_size], many=True)
+        if not serializer.is_valid():
+            yield offset, ValidationError(serializer.errors)
+
+
+def test_chunked_errors_have_offset_indices():
+    rows = [{"email": "valid@example.com"}] * 10
+    rows[3] = rows[7] = {"email": "invalid"}
+    errors = list(iter_chunked_errors(validate_in_chunks(rows, 4), attr="items"))
+    assert [error.attr for error in errors] == ["items.3.email", "items.7.email"]
+
+    errors = list(iter_chunked_errors(validate_in_chunks(rows, 4)))
+    assert [error.attr for error in errors] == ["3.email", "7.email"]
+
+
+def test_ndjson_response(rf):
+    rows = [{"email": "invalid"}] * 1000
+    errors = iter_chunked_errors(validate_in_chunks(rows, 100))
+    response = get_ndjson_response(errors, rf.post("/"), chunk_size=1024)
+    assert response.status_code == 400
+    assert response["Content-Type"] == "application/x-ndjson"
+
+    chunks = list(response.streaming_content)
+    assert len(chunks) > 1
+    lines = b"".join(chunks).decode().splitlines()
+    assert len(lines) == 1000
+    assert json.loads(lines[999]) == {
+        "code": "invalid",
+        "detail": "Enter a valid email address.",
+        "attr": "999.email",
+    }
+
+
+def test_ndjson_response_is_lazy(rf):
+    rows = [{"email": "invalid"}] * 10
+    validated_chunks = []
+
+    def get_chunks():
+        for offset, exc in validate_in_chunks(rows, 2):
+            validated_chunks.append(offset)
+            yield offset, exc
+
+    response = get_ndjson_response(iter_chunked_errors(get_chunks()), rf.post("/"))
+    # only the first chunk is validated until the response is sent
+    assert validated_chunks == [0]
+    assert len(list(response)) == 1
+    assert validated_chunks == [0, 2, 4, 6, 8]
+
+
+def test_no_ndjson_response_without_errors(rf):
+    rows = [{"email": "valid@example.com"}] * 10
+    errors = iter_chunked_errors(validate_in_chunks(rows, 4))
+    assert get_ndjson_response(errors, rf.post("/")) is None
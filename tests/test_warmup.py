@@ -0,0 +1,63 @@
+import logging
+from unittest.mock import MagicMock
+
+from django.apps import apps
+
+from drf_standardized_errors import warmup
+from drf_standardized_errors.formatter import ExceptionFormatter
+from drf_standardized_errors.warmup import get_warm_up_languages, warm_up
+
+
+def test_warm_up_formats_builtin_exceptions(monkeypatch, caplog):
+    mock = MagicMock(wraps=warmup.format_exception)
+    monkeypatch.setattr(warmup, "format_exception", mock)
+
+    with caplog.at_level(logging.INFO, logger="drf_standardized_errors.warmup"):
+        warm_up(["en", "fr"])
+
+    assert mock.call_count == 2 * len(warmup.get_builtin_exceptions())
+    assert "warm-up done in" in caplog.text
+    assert "languages: en, fr" in caplog.text
+
+
+def test_warm_up_languages(settings):
+    settings.LANGUAGES = [("en", "English"), ("fr", "French")]
+    assert get_warm_up_languages() == ["en", "fr"]
+
+    settings.DRF_STANDARDIZED_ERRORS = {"WARM_UP_LANGUAGES": ["de"]}
+    assert get_warm_up_languages() == ["de"]
+
+
+def test_warm_up_languages_without_i18n(settings):
+    settings.USE_I18N = False
+    settings.LANGUAGE_CODE = "es"
+    assert get_warm_up_languages() == ["es"]
+
+
+def test_warm_up_with_failing_formatter(settings, caplog):
+    settings.DRF_STANDARDIZED_ERRORS = {
+        "EXCEPTION_FORMATTER_CLASS": "tests.test_warmup.RequestFormatter"
+    }
+    with caplog.at_level(logging.INFO, logger="drf_standardized_errors.warmup"):
+        warm_up(["en"])
+
+    assert "unable to format ValidationError during warm-up" in caplog.text
+    assert "warm-up done in" in caplog.text
+
+
+class RequestFormatter(ExceptionFormatter):
+    def format_error_response(self, error_response):
+        return {"path": self.context["request"].path}
+
+
+def test_warm_up_is_opt_in(settings, monkeypatch):
+    mock = MagicMock()
+    monkeypatch.setattr(warmup, "warm_up", mock)
+    app_config = apps.get_app_config("drf_standardized_errors")
+
+    app_config.ready()
+    assert not mock.called
+
+    settings.DRF_STANDARDIZED_ERRORS = {"WARM_UP_ON_STARTUP": True}
+    app_config.ready()
+    assert mock.called
@@ -9,8 +9,12 @@ from .views import (
     OrderErrorView,
     RateLimitErrorView,
     RecursionView,
+    django_view,
 )
 
+handler404 = "drf_standardized_errors.views.page_not_found"
+handler500 = "drf_standardized_errors.views.server_error"
+
 urlpatterns = [
     path("integrity-error/", IntegrityErrorView.as_view()),
     path("error/", ErrorView.as_view()),
@@ -18,6 +22,7 @@ urlpatterns = [
     path("auth-error/", AuthErrorView.as_view()),
     path("rate-limit-error/", RateLimitErrorView.as_view()),
     path("recursion-error/", RecursionView.as_view()),
+    path("django-view/<str:error>/", django_view),
     path("schema/", SpectacularAPIView.as_view(), name="api-schema"),
     path(
         "protected-schema/",
@@ -1,4 +1,6 @@
+from django.core.exceptions import PermissionDenied
 from django.db import IntegrityError
+from django.http import Http404, JsonResponse
 from rest_framework import serializers
 from rest_framework.authentication import BasicAuthentication
 from rest_framework.generics import GenericAPIView
@@ -46,6 +48,19 @@ class OrderErrorView(GenericAPIView):
         return Response(status=204)
 
 
+class ContactSerializer(serializers.Serializer):
+    email = serializers.EmailField()
+
+
+class BulkContactView(GenericAPIView):
+    serializer_class = ContactSerializer
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        return Response(status=204)
+
+
 class AuthErrorView(APIView):
     authentication_classes = [BasicAuthentication]
     permission_classes = [IsAuthenticated]
@@ -73,3 +88,18 @@ class RecursionView(APIView):
     def get(self, request, *args, **kwargs):
         errors = [{"field": ["Some Error"]} for _ in range(1, 1000)]
         raise serializers.ValidationError(errors)
+
+
+def django_view(request, error):
+    """plain django view to test errors raised outside DRF views"""
+    if error == "not-found":
+        raise Http404("No such thing.")
+    elif error == "permission-denied":
+        raise PermissionDenied()
+    elif error == "server-error":
+        raise Exception("Internal server error.")
+    elif error == "exception-group":
+        raise ExceptionGroup(  # noqa: F821
+            "errors", [PermissionDenied(), Http404("No such thing.")]
+        )
+    return JsonResponse({})